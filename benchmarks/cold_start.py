@@ -0,0 +1,218 @@
+"""Cold-start benchmark for the stdio transport.
+
+Spawns ``docketbird_mcp.py --transport stdio`` the way desktop MCP clients
+do, once per run, and measures the time from spawn to the ``initialize``
+answer and to the first tool answer:
+
+    python benchmarks/cold_start.py --runs 20 --tool list_courts_and_types
+
+The default tool needs no network access (it only reads the court
+catalog). With ``--mock`` the server talks to ``mock_docketbird.py`` instead,
+so tools that call the API can be measured too:
+
+    python benchmarks/cold_start.py --mock --tool list_cases \\
+        --arguments '{"scope": "company"}'
+
+Speaks JSON-RPC over the pipes directly, so the driver adds as
+little as possible to the numbers. ``--importtime`` instead prints the
+modules that take longest to import.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVER = ROOT / "docketbird_mcp.py"
+MOCK = Path(__file__).resolve().parent / "mock_docketbird.py"
+
+
+def send(process: subprocess.Popen, message: dict) -> None:
+    process.stdin.write(json.dumps(message).encode() + b"\n")
+    process.stdin.flush()
+
+
+def receive(process: subprocess.Popen, request_id: int) -> dict:
+    """Read lines until the answer to ``request_id``; anything else is skipped."""
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("Server exited before answering")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            # Stray output on stdout; a client would have to skip it too
+            continue
+        if message.get("id") == request_id:
+            return message
+
+
+def run_once(
+    env: dict, tool: str, arguments: dict, think_time: float = 0.0
+) -> tuple[float, float, float]:
+    """Return seconds to ``initialize``, to the tool answer, and of the call itself."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, str(SERVER), "--transport", "stdio"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        cwd=str(ROOT),
+        env=env,
+    )
+    try:
+        send(
+            process,
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "cold-start", "version": "0"},
+                },
+            },
+        )
+        receive(process, 1)
+        initialized = time.perf_counter() - start
+        send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        # A host usually lists tools and waits for the model before calling one
+        time.sleep(think_time)
+        called = time.perf_counter()
+        send(
+            process,
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "tools/call",
+                "params": {"name": tool, "arguments": arguments},
+            },
+        )
+        answer = receive(process, 2)
+        if "error" in answer:
+            raise RuntimeError(f"{tool} failed: {answer['error']}")
+        answered = time.perf_counter()
+    finally:
+        process.kill()
+        process.wait()
+    return initialized, answered - start, answered - called
+
+
+def baseline(runs: int) -> float:
+    """Median time to start and stop a bare interpreter, for reference."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def import_times(env: dict, top: int) -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import docketbird_mcp"],
+        capture_output=True,
+        text=True,
+        cwd=str(ROOT),
+        env=env,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if cumulative.strip().isdigit():
+            rows.append((int(cumulative), name.rstrip()))
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative / 1000:9.1f} ms {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure stdio cold start.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--tool", default="list_courts_and_types")
+    parser.add_argument("--arguments", default="{}", help="Tool arguments as JSON")
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.0,
+        help="Seconds between initialization and the tool call",
+    )
+    parser.add_argument(
+        "--mock", action="store_true", help="Point the server at a local mock API"
+    )
+    parser.add_argument(
+        "--importtime", action="store_true", help="Show the slowest imports instead"
+    )
+    args = parser.parse_args()
+
+    env = {**os.environ, "DOCKETBIRD_API_KEY": os.getenv("DOCKETBIRD_API_KEY", "benchmark")}
+    if args.importtime:
+        import_times(env, top=25)
+        return
+
+    mock = None
+    if args.mock:
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        mock = subprocess.Popen(
+            [sys.executable, str(MOCK), "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        wait_for_port(port)
+        # Every spawn must reach the API rather than the on-disk cache
+        env.update(
+            DOCKETBIRD_BASE_URL=f"http://127.0.0.1:{port}", DOCKETBIRD_CACHE_DB=""
+        )
+    try:
+        measure(env, args)
+    finally:
+        if mock is not None:
+            mock.kill()
+            mock.wait()
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Nothing listening on port {port}")
+            time.sleep(0.1)
+
+
+def measure(env: dict, args) -> None:
+    arguments = json.loads(args.arguments)
+    # The first spawn also writes bytecode caches; do not count it
+    run_once(env, args.tool, arguments, args.think_time)
+    samples = [
+        run_once(env, args.tool, arguments, args.think_time) for _ in range(args.runs)
+    ]
+
+    print(f"Bare interpreter: median {baseline(args.runs) * 1000:7.1f} ms")
+    labels = (
+        "Spawn to initialize",
+        f"Spawn to first {args.tool}",
+        f"First {args.tool} call",
+    )
+    for label, values in zip(labels, zip(*samples)):
+        print(
+            f"{label + ':':<40} median {statistics.median(values) * 1000:7.1f} ms, "
+            f"min {min(values) * 1000:7.1f} ms, max {max(values) * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""Load test for the DocketBird MCP server.
+
+Starts ``mock_docketbird.py`` in a subprocess and the MCP server against it,
+then runs many concurrent MCP clients through a weighted mix of tools:
+
+    python benchmarks/load_test.py --transport both --clients 20 \\
+        --calls 50 --documents 5000 --latency-ms 30 --fault-504 0.01
+
+With ``--transport stdio`` every client gets its own server process, as MCP
+hosts do; with ``--transport sse`` all clients share one server started with
+``create_starlette_app`` (on ``--workers`` processes). Reports p50/p95/p99 latency and error counts per
+tool, the peak RSS of the server process(es), and the number of upstream
+calls the mock received. ``--json`` prints the same report as JSON, for
+comparing runs.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+
+from mock_docketbird import add_arguments, case_id, config_from_args
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVER = ROOT / "docketbird_mcp.py"
+MOCK = Path(__file__).resolve().parent / "mock_docketbird.py"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def read_memory(pid: int) -> dict[str, int]:
+    """Current and peak resident set size of ``pid`` in KiB (Linux only)."""
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    memory[key] = int(value.split()[0])
+    except OSError:
+        pass
+    return memory
+
+
+def server_pids(exclude: set[int]) -> list[int]:
+    """PIDs of the MCP servers started by this process, and of their workers."""
+    parents = {}
+    servers = set()
+    for entry in os.listdir("/proc") if os.path.isdir("/proc") else ():
+        if not entry.isdigit() or int(entry) in exclude:
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except (OSError, IndexError, ValueError):
+            continue
+        parents[int(entry)] = ppid
+        if ppid == os.getpid() and SERVER.name.encode() in cmdline:
+            servers.add(int(entry))
+    # uvicorn's worker processes are children of the server process
+    workers = {pid for pid, ppid in parents.items() if ppid in servers}
+    return sorted(servers | workers)
+
+
+class MemorySampler:
+    """Record the peak RSS of the server processes while the load runs."""
+
+    def __init__(self, exclude: set[int], interval: float = 0.2):
+        self.exclude = exclude
+        self.interval = interval
+        self.peak_per_process = 0
+        self.peak_total = 0
+        self.processes = 0
+
+    async def run(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval)
+
+    def sample(self) -> None:
+        pids = server_pids(self.exclude)
+        sizes = [read_memory(pid).get("VmHWM", 0) for pid in pids]
+        current = [read_memory(pid).get("VmRSS", 0) for pid in pids]
+        self.processes = max(self.processes, len(pids))
+        self.peak_per_process = max([self.peak_per_process, *sizes])
+        self.peak_total = max(self.peak_total, sum(current))
+
+
+def workload(cases: list[str], documents: int, save_path: str):
+    """Weighted tool calls resembling an agent working through a few cases."""
+    def doc_id(case: str) -> str:
+        # Every third document has no download link in the mock
+        n = random.randrange(documents)
+        return f"{case}-{n - n % 3 + 1:05d}"
+
+    return [
+        (30, lambda c: ("get_case_details", {"case_id": c, "limit": 50})),
+        (10, lambda c: ("get_case_details", {"case_id": c, "format": "compact"})),
+        (20, lambda c: ("search_case_documents", {"case_id": c, "search_term": "motion dismiss"})),
+        (10, lambda c: ("get_docket_updates", {"case_id": c})),
+        (10, lambda c: ("get_calendar_entries", {"case_id": c})),
+        (5, lambda c: ("list_cases", {"scope": "company"})),
+        (5, lambda c: ("get_upcoming_deadlines", {"days": 30})),
+        (5, lambda c: ("download_document_by_id", {"document_id": doc_id(c), "save_path": save_path})),
+        (5, lambda c: ("get_cases", {"case_ids": random.sample(cases, min(3, len(cases)))})),
+    ]
+
+
+class Results:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def record(self, tool: str, seconds: float, ok: bool) -> None:
+        self.latencies[tool].append(seconds)
+        if not ok:
+            self.errors[tool] += 1
+
+    def summary(self) -> dict[str, dict]:
+        report = {}
+        for tool, samples in sorted(self.latencies.items()):
+            report[tool] = {
+                "calls": len(samples),
+                "errors": self.errors[tool],
+                "p50_ms": percentile(samples, 50) * 1000,
+                "p95_ms": percentile(samples, 95) * 1000,
+                "p99_ms": percentile(samples, 99) * 1000,
+            }
+        return report
+
+
+async def run_client(session: ClientSession, mix, cases, calls: int, results: Results):
+    weights = [weight for weight, _ in mix]
+    for _ in range(calls):
+        make_call = random.choices(mix, weights)[0][1]
+        tool, arguments = make_call(random.choice(cases))
+        start = time.perf_counter()
+        try:
+            result = await session.call_tool(tool, arguments)
+            text = "".join(getattr(item, "text", "") for item in result.content)
+            ok = not result.isError and not text.startswith(("Error", "An unexpected"))
+        except Exception:
+            ok = False
+        results.record(tool, time.perf_counter() - start, ok)
+
+
+async def run_stdio(env, args, mix, cases, results: Results) -> None:
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=[str(SERVER), "--transport", "stdio"],
+        env=env,
+        cwd=str(ROOT),
+    )
+
+    async def client() -> None:
+        async with stdio_client(params, errlog=log) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                await run_client(session, mix, cases, args.calls, results)
+
+    with open(os.devnull, "w") as log:
+        await asyncio.gather(*(client() for _ in range(args.clients)))
+
+
+async def run_sse(env, args, mix, cases, results: Results) -> None:
+    port = free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable, str(SERVER), "--transport", "sse",
+            "--host", "127.0.0.1", "--port", str(port), "--workers", str(args.workers),
+        ],
+        env=env,
+        cwd=str(ROOT),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/sse"
+    try:
+        await wait_for_port(port)
+
+        async def client() -> None:
+            async with sse_client(url, timeout=30, sse_read_timeout=600) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    await run_client(session, mix, cases, args.calls, results)
+
+        await asyncio.gather(*(client() for _ in range(args.clients)))
+    finally:
+        stop(server)
+
+
+def stop(process: subprocess.Popen) -> None:
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        # uvicorn waits for open SSE streams before exiting
+        process.kill()
+        process.wait()
+
+
+async def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Nothing listening on port {port}")
+            await asyncio.sleep(0.1)
+
+
+async def run(transport: str, args, mock_url: str, mock_pid: int) -> dict:
+    config = config_from_args(args)
+    cases = [case_id(n) for n in range(config.cases)]
+    with tempfile.TemporaryDirectory(prefix="docketbird-bench-") as tmp:
+        # A cold start for every run: fresh persistent caches and indexes
+        env = {
+            **os.environ,
+            "DOCKETBIRD_API_KEY": "benchmark",
+            "DOCKETBIRD_BASE_URL": mock_url,
+            "DOCKETBIRD_CACHE_DB": os.path.join(tmp, "cache.sqlite3"),
+            "DOCKETBIRD_INDEX_DIR": os.path.join(tmp, "indexes"),
+            "DOCKETBIRD_SNAPSHOT_DIR": os.path.join(tmp, "snapshots"),
+            "DOCKETBIRD_CALENDAR_DIR": os.path.join(tmp, "calendars"),
+            "DOCKETBIRD_FOLLOWED_FILE": os.path.join(tmp, "followed.json"),
+            "DOCKETBIRD_MIRROR_DIR": "",
+            "DOCKETBIRD_POLL_INTERVAL": "0",
+            "DOCKETBIRD_RATE_LIMIT": str(args.rate_limit),
+        }
+        save_path = os.path.join(tmp, "downloads")
+        os.makedirs(save_path)
+        mix = workload(cases, config.documents, save_path)
+
+        async with httpx.AsyncClient() as http:
+            await http.post(f"{mock_url}/__reset")
+            results = Results()
+            sampler = MemorySampler(exclude={mock_pid})
+            sampling = asyncio.create_task(sampler.run())
+            start = time.perf_counter()
+            try:
+                if transport == "stdio":
+                    await run_stdio(env, args, mix, cases, results)
+                else:
+                    await run_sse(env, args, mix, cases, results)
+            finally:
+                sampling.cancel()
+            elapsed = time.perf_counter() - start
+            upstream = (await http.get(f"{mock_url}/__stats")).json()
+
+    total_calls = sum(len(samples) for samples in results.latencies.values())
+    return {
+        "transport": transport,
+        "clients": args.clients,
+        "elapsed_s": elapsed,
+        "throughput_calls_per_s": total_calls / elapsed if elapsed else 0.0,
+        "tools": results.summary(),
+        "server_processes": sampler.processes,
+        "peak_rss_kib_per_process": sampler.peak_per_process,
+        "peak_rss_kib_total": sampler.peak_total,
+        "upstream_calls": upstream,
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"\n=== {report['transport'].upper()}: {report['clients']} clients, "
+        f"{report['elapsed_s']:.1f}s, {report['throughput_calls_per_s']:.1f} calls/s ==="
+    )
+    print(f"{'tool':<26}{'calls':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for tool, row in report["tools"].items():
+        print(
+            f"{tool:<26}{row['calls']:>7}{row['errors']:>8}"
+            f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}"
+        )
+    print(
+        f"Server RSS: peak {report['peak_rss_kib_per_process'] / 1024:.1f} MiB per process, "
+        f"{report['peak_rss_kib_total'] / 1024:.1f} MiB total "
+        f"over {report['server_processes']} process(es)"
+    )
+    upstream = report["upstream_calls"]
+    print(f"Upstream calls: {sum(v for k, v in upstream.items() if ' ' not in k)}")
+    for route, count in sorted(upstream.items()):
+        print(f"  {route:<32}{count:>7}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the DocketBird MCP server.")
+    parser.add_argument("--transport", choices=["stdio", "sse", "both"], default="both")
+    parser.add_argument("--clients", type=int, default=10, help="Concurrent MCP clients")
+    parser.add_argument("--calls", type=int, default=20, help="Tool calls per client")
+    parser.add_argument("--workers", type=int, default=1, help="SSE server worker processes")
+    parser.add_argument(
+        "--rate-limit", type=float, default=0, help="Server's DOCKETBIRD_RATE_LIMIT (0 = off)"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    add_arguments(parser)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    port = free_port()
+    mock_args = [
+        "--port", str(port),
+        "--cases", str(args.cases),
+        "--documents", str(args.documents),
+        "--page-size", str(args.page_size),
+        "--latency-ms", str(args.latency_ms),
+        "--fault-504", str(args.fault_504),
+        "--fault-429", str(args.fault_429),
+        "--file-size", str(args.file_size),
+    ]
+    mock = subprocess.Popen(
+        [sys.executable, str(MOCK), *mock_args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        await wait_for_port(port)
+        transports = ["stdio", "sse"] if args.transport == "both" else [args.transport]
+        reports = [
+            await run(transport, args, f"http://127.0.0.1:{port}", mock.pid)
+            for transport in transports
+        ]
+    finally:
+        stop(mock)
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for report in reports:
+            print_report(report)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
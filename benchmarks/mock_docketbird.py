@@ -0,0 +1,288 @@
+"""Local stand-in for the DocketBird API and its S3 document bucket.
+
+Serves the endpoints described in ``docketbird_api.yaml`` with synthetic,
+deterministic data, so the MCP server can be benchmarked without network
+access or API credentials:
+
+    python benchmarks/mock_docketbird.py --cases 20 --documents 5000 \\
+        --latency-ms 30 --fault-504 0.01 --fault-429 0.01
+
+then run the server with ``DOCKETBIRD_BASE_URL=http://127.0.0.1:9900``.
+``GET /__stats`` returns the number of calls per route, and
+``POST /__reset`` clears the counters.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+COURTS = ("nysd", "cand", "txnd", "ilnd", "deb")
+TITLES = (
+    "MOTION to Dismiss for Failure to State a Claim",
+    "ORDER granting Motion for Extension of Time",
+    "MEMORANDUM OF LAW in Opposition to Motion",
+    "NOTICE of Appearance",
+    "STIPULATION of Dismissal",
+    "DECLARATION in Support of Motion for Summary Judgment",
+    "MINUTE ENTRY for Status Conference",
+    "COMPLAINT against all defendants",
+)
+
+
+@dataclass
+class MockConfig:
+    cases: int = 10
+    documents: int = 200
+    page_size: int = 1000
+    latency_ms: float = 0.0
+    fault_504: float = 0.0
+    fault_429: float = 0.0
+    file_size: int = 256 * 1024
+    seed: int = 1
+
+
+def case_id(n: int) -> str:
+    court = COURTS[n % len(COURTS)]
+    return f"{court}-1:20{10 + n % 15}-cv-{n:05d}"
+
+
+def make_document(case: str, n: int, base_url: str) -> dict:
+    filed = date(2015, 1, 1) + timedelta(days=n % 3650)
+    doc_id = f"{case}-{n:05d}"
+    downloadable = n % 3 != 0
+    return {
+        "id": doc_id,
+        "title": f"{TITLES[n % len(TITLES)]} ({n})",
+        "filing_date": filed.isoformat(),
+        "restricted": False,
+        "primary_docket_sheet_number": n,
+        "pacer_document_url": f"https://ecf.example.gov/doc1/{n:012d}",
+        "downloaded": int(downloadable),
+        "docketbird_document_url": (
+            f"{base_url}/s3/{doc_id}.pdf?Signature=mock&Expires=9999999999"
+            if downloadable
+            else None
+        ),
+        "custom_filename": f"Document No. {n:04d}. {filed}.pdf",
+        "description": "Filed by plaintiff." if n % 4 == 0 else None,
+    }
+
+
+def create_app(config: MockConfig) -> Starlette:
+    calls: Counter = Counter()
+    rng = random.Random(config.seed)
+    cases = [case_id(n) for n in range(config.cases)]
+
+    async def simulate(route: str):
+        """Count the call, wait, and maybe fail like the real API does."""
+        calls[route] += 1
+        if config.latency_ms:
+            await asyncio.sleep(config.latency_ms / 1000 * rng.uniform(0.5, 1.5))
+        roll = rng.random()
+        if roll < config.fault_504:
+            calls[f"{route} 504"] += 1
+            return JSONResponse({"message": "Endpoint request timed out"}, 504)
+        if roll < config.fault_504 + config.fault_429:
+            calls[f"{route} 429"] += 1
+            return JSONResponse(
+                {"message": "Too Many Requests"}, 429, headers={"Retry-After": "1"}
+            )
+        return None
+
+    def base_url(request: Request) -> str:
+        return str(request.base_url).rstrip("/")
+
+    def etagged(request: Request, payload: dict) -> Response:
+        response = JSONResponse(payload)
+        etag = '"' + hashlib.sha1(response.body).hexdigest() + '"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return response
+
+    async def list_cases(request: Request):
+        if fault := await simulate("/cases"):
+            return fault
+        return etagged(
+            request,
+            {
+                "data": {
+                    "cases": [
+                        {
+                            "id": case,
+                            "court_id": case.split("-")[0],
+                            "title": f"Plaintiff {n} v. Defendant {n}",
+                            "case_number": case.split(":")[1],
+                            "date_filed": "2020-01-02",
+                        }
+                        for n, case in enumerate(cases)
+                    ]
+                }
+            },
+        )
+
+    async def get_case(request: Request):
+        if fault := await simulate("/cases/{case_id}"):
+            return fault
+        case = request.path_params["case_id"]
+        if case not in cases:
+            return JSONResponse({"status": "error"}, 404)
+        return etagged(
+            request,
+            {
+                "status": "success",
+                "data": {
+                    "case": {
+                        "id": case,
+                        "title": f"Case {case}",
+                        "court_id": case.split("-")[0],
+                        "date_filed": "2020-01-02",
+                        "url": f"https://www.docketbird.com/court-cases/{case}",
+                    }
+                },
+            },
+        )
+
+    async def list_documents(request: Request):
+        if fault := await simulate("/documents"):
+            return fault
+        case = request.query_params.get("case_id")
+        if case not in cases:
+            return JSONResponse({"status": "error"}, 404)
+        page = int(request.query_params.get("page", "1"))
+        start = (page - 1) * config.page_size
+        end = min(start + config.page_size, config.documents)
+        url = base_url(request)
+        payload = {
+            "data": {
+                "case": {"id": case, "title": f"Case {case}"},
+                "parties": [
+                    {"name": "Plaintiff Inc.", "type": "Plaintiff"},
+                    {"name": "Defendant LLC", "type": "Defendant"},
+                ],
+                "documents": [make_document(case, n, url) for n in range(start, end)],
+            },
+            "has_more": end < config.documents,
+        }
+        return etagged(request, payload)
+
+    async def get_document(request: Request):
+        if fault := await simulate("/documents/{document_id}"):
+            return fault
+        doc_id = request.path_params["document_id"]
+        case, _, number = doc_id.rpartition("-")
+        if case not in cases or not number.isdigit():
+            return JSONResponse({"status": "error"}, 404)
+        document = make_document(case, int(number), base_url(request))
+        return JSONResponse({"status": "success", "data": {"document": document}})
+
+    async def calendar_entries(request: Request):
+        if fault := await simulate("/calendar_entries"):
+            return fault
+        case = request.query_params.get("case_id")
+        if case not in cases:
+            return JSONResponse({"status": "error"}, 404)
+        today = date.today()
+        entries = [
+            {
+                "id": n,
+                "uuid": f"00000000-0000-0000-0000-{n:012d}",
+                "case_id": case,
+                "document_id": f"{case}-{n:05d}",
+                "iso8601_datetime": (today + timedelta(days=n * 3 - 30)).isoformat(),
+                "title": f"Deadline {n}",
+            }
+            for n in range(40)
+        ]
+        return etagged(request, {"status": "success", "data": {"calendar_entries": entries}})
+
+    async def post_case_action(request: Request):
+        if fault := await simulate(request.url.path):
+            return fault
+        return Response(status_code=200)
+
+    async def s3_object(request: Request):
+        calls["s3"] += 1
+        if config.latency_ms:
+            await asyncio.sleep(config.latency_ms / 1000)
+        body = (request.path_params["name"].encode() * 64)[:64]
+        body = (body * (config.file_size // len(body) + 1))[: config.file_size]
+        range_header = request.headers.get("range", "")
+        if range_header.startswith("bytes="):
+            offset = int(range_header[6:].split("-")[0])
+            if offset >= len(body):
+                return Response(status_code=416)
+            return Response(
+                body[offset:],
+                206,
+                media_type="application/pdf",
+                headers={"Content-Range": f"bytes {offset}-{len(body) - 1}/{len(body)}"},
+            )
+        return Response(body, media_type="application/pdf")
+
+    async def stats(request: Request):
+        return JSONResponse(dict(calls))
+
+    async def reset(request: Request):
+        calls.clear()
+        return JSONResponse({})
+
+    return Starlette(
+        routes=[
+            Route("/cases", list_cases),
+            Route("/cases/{case_id:path}", get_case),
+            Route("/documents", list_documents),
+            Route("/documents/{document_id:path}", get_document),
+            Route("/calendar_entries", calendar_entries),
+            Route("/follow_case", post_case_action, methods=["POST"]),
+            Route("/create_autocalendar", post_case_action, methods=["POST"]),
+            Route("/s3/{name:path}", s3_object),
+            Route("/__stats", stats),
+            Route("/__reset", reset, methods=["POST"]),
+        ]
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--cases", type=int, default=10, help="Number of cases")
+    parser.add_argument(
+        "--documents", type=int, default=200, help="Documents per case (10 to 50000)"
+    )
+    parser.add_argument("--page-size", type=int, default=1000, help="Documents per page")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean added latency")
+    parser.add_argument("--fault-504", type=float, default=0.0, help="Share of 504 answers")
+    parser.add_argument("--fault-429", type=float, default=0.0, help="Share of 429 answers")
+    parser.add_argument(
+        "--file-size", type=int, default=256 * 1024, help="Bytes per S3 document"
+    )
+
+
+def config_from_args(args) -> MockConfig:
+    return MockConfig(
+        cases=args.cases,
+        documents=args.documents,
+        page_size=args.page_size,
+        latency_ms=args.latency_ms,
+        fault_504=args.fault_504,
+        fault_429=args.fault_429,
+        file_size=args.file_size,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a mock DocketBird API.")
+    add_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9900)
+    args = parser.parse_args()
+    uvicorn.run(create_app(config_from_args(args)), host=args.host, port=args.port)
@@ -0,0 +1,347 @@
+"""Content-addressed store of downloaded documents, shared by every folder.
+
+Each document body is stored once under its SHA-256 in
+``<directory>/sha256/<2 hex>/<hash>``. An index maps document IDs (or, for
+downloads without one, S3 object paths) to blobs, so a document already
+downloaded for another case or another export is placed from disk without
+touching S3. Files are placed as reflinks (copy-on-write clones) where the
+filesystem supports them, else as read-only hardlinks sharing the store's
+bytes, and copied only across filesystems or in ``copy`` mode.
+
+All writes go to a uniquely named temporary file renamed into place, so
+several server processes can share one store. Once the blobs exceed
+``max_bytes`` the least recently stored are pruned.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import secrets
+import shutil
+import stat
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+from docketbird_metrics import CACHE_LOOKUPS
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl cloning a file on Linux filesystems with copy-on-write (btrfs, XFS)
+FICLONE = 0x40049409
+LINK_MODES = ("hardlink", "copy")
+HASH_BUFFER_SIZE = 1024 * 1024
+
+logger = logging.getLogger("docketbird.blobs")
+
+
+@dataclass
+class Blob:
+    sha256: str
+    size: int
+    path: str
+    mtime_ns: int = 0
+
+
+def source_key(url: str) -> str:
+    """The stable part of a pre-signed S3 URL (the signature is dropped)."""
+    return url.split("?")[0]
+
+
+def _tmp_path(path: str) -> str:
+    # Unique per process and per call, as downloads run in worker threads
+    return f"{path}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _reflink(source: str, destination: str) -> bool:
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        _remove(destination)
+        return False
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(HASH_BUFFER_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """Downloaded documents keyed by content, persisted to ``directory``.
+
+    Files are placed as reflinks where possible. Otherwise, with
+    ``hardlink`` (the default), they are hardlinked on the store's
+    filesystem, which makes them read-only: blobs are, and a hardlink shares
+    their inode. Only across filesystems, or without ``hardlink``, are they
+    copied.
+    """
+
+    def __init__(
+        self,
+        directory: str | None,
+        hardlink: bool = True,
+        max_bytes: int = 2 * 1024 * 1024 * 1024,
+    ):
+        self.directory = directory
+        self.hardlink = hardlink
+        self.max_bytes = max_bytes
+        self._device: int | None = None
+        # Size of the blobs, scanned once and then tracked as blobs are added
+        self._bytes: int | None = None
+        self._size_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "BlobStore":
+        """Build the store from ``DOCKETBIRD_BLOB_DIR`` (empty disables it)."""
+        directory = os.getenv(
+            "DOCKETBIRD_BLOB_DIR",
+            os.path.join(os.path.expanduser("~"), ".docketbird", "blobs"),
+        )
+        mode = os.getenv("DOCKETBIRD_BLOB_LINK", LINK_MODES[0])
+        if mode not in LINK_MODES:
+            logger.warning(
+                "Unknown DOCKETBIRD_BLOB_LINK '%s', using '%s'", mode, LINK_MODES[0]
+            )
+            mode = LINK_MODES[0]
+        return cls(
+            directory or None,
+            hardlink=mode == "hardlink",
+            max_bytes=int(
+                os.getenv("DOCKETBIRD_BLOB_MAX_BYTES", str(2 * 1024 * 1024 * 1024))
+            ),
+        )
+
+    def _blob_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, "sha256", sha256[:2], sha256)
+
+    def _index_path(self, url: str, document_id: str | None) -> str:
+        # One entry per download: by document ID, else by S3 object
+        kind, key = ("documents", document_id) if document_id else ("sources", url)
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, "index", kind, f"{name}.json")
+
+    def shares_device(self, path: str) -> bool:
+        """True if ``path`` is on the store's filesystem.
+
+        Adding a download kept on another filesystem would write it twice,
+        as it can be neither linked nor cloned into the store.
+        """
+        if not self.directory:
+            return False
+        try:
+            if self._device is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._device = os.stat(self.directory).st_dev
+            return os.stat(path).st_dev == self._device
+        except OSError:
+            return False
+
+    def get(self, sha256: str, size: int | None = None) -> Blob | None:
+        """The stored blob with this hash, if present (and of ``size``)."""
+        if not self.directory:
+            return None
+        path = self._blob_path(sha256)
+        try:
+            info = os.stat(path)
+        except OSError:
+            return None
+        if size is not None and info.st_size != size:
+            return None
+        return Blob(sha256, info.st_size, path, info.st_mtime_ns)
+
+    def lookup(self, url: str, document_id: str | None = None) -> Blob | None:
+        """The blob already downloaded for ``document_id`` (or this S3 object).
+
+        A document ID only matches while its download URL still points at
+        the same S3 object, so a replaced document is fetched again. A blob
+        modified since it was indexed is re-hashed, and dropped if its
+        content no longer matches.
+        """
+        if not self.directory:
+            return None
+        source = source_key(url)
+        entry = self._read_index(self._index_path(source, document_id))
+        blob = None
+        if entry is not None and entry.get("source") == source:
+            blob = self._verified(entry)
+        if blob is None:
+            CACHE_LOOKUPS.inc("blobs", "miss")
+            return None
+        if entry.get("mtime_ns") != blob.mtime_ns:
+            self.record(blob, url, document_id)
+        CACHE_LOOKUPS.inc("blobs", "hit")
+        return blob
+
+    def _verified(self, entry: dict) -> Blob | None:
+        blob = self.get(entry["sha256"], entry.get("size"))
+        if blob is None:
+            return None
+        if blob.mtime_ns == entry.get("mtime_ns"):
+            return blob
+        try:
+            if _file_sha256(blob.path) == blob.sha256:
+                # Replaced by an identical copy from a concurrent writer
+                return blob
+        except OSError:
+            return None
+        # Edited in place through a hardlink; never hand it out again
+        _remove(blob.path)
+        return None
+
+    def _read_index(self, path: str) -> dict | None:
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "sha256" in entry else None
+
+    def add(self, path: str, sha256: str) -> Blob | None:
+        """Store the file at ``path``, whose hash is ``sha256``.
+
+        The file is cloned (or, in hardlink mode, linked) into the store where
+        possible and copied otherwise. If the blob exists already (another
+        case, another process) and is intact, nothing is written.
+        """
+        if not self.directory:
+            return None
+        size = os.path.getsize(path)
+        blob = self.get(sha256, size)
+        if blob is not None and _file_sha256(blob.path) == sha256:
+            return blob
+        blob_path = self._blob_path(sha256)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        tmp_path = _tmp_path(blob_path)
+        try:
+            self._materialize(path, tmp_path)
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            # Concurrent writers of the same content replace each other harmlessly
+            os.replace(tmp_path, blob_path)
+        except BaseException:
+            _remove(tmp_path)
+            raise
+        if self._grow(size) > self.max_bytes:
+            self.prune()
+        return self.get(sha256)
+
+    def _grow(self, size: int) -> int:
+        with self._size_lock:
+            if self._bytes is None:
+                self._bytes = sum(size for _, size, _, _ in self._scan())
+            else:
+                self._bytes += size
+            return self._bytes
+
+    def _scan(self) -> list[tuple[float, int, str, str]]:
+        blobs = []
+        for root, _, files in os.walk(os.path.join(self.directory, "sha256")):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                blobs.append((info.st_mtime, info.st_size, name, path))
+        return blobs
+
+    def record(self, blob: Blob, url: str, document_id: str | None = None) -> None:
+        """Remember that ``url`` (and ``document_id``) resolved to ``blob``."""
+        if not self.directory:
+            return
+        source = source_key(url)
+        try:
+            entry = {
+                "sha256": blob.sha256,
+                "size": blob.size,
+                "mtime_ns": blob.mtime_ns,
+                "source": source,
+                "document_id": document_id,
+                "stored_at": time.time(),
+            }
+            path = self._index_path(source, document_id)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = _tmp_path(path)
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The index is best effort; the blob is still found by hash
+            pass
+
+    def place(self, blob: Blob, destination: str) -> None:
+        """Make ``destination`` a copy of ``blob``, replacing it atomically."""
+        tmp_path = _tmp_path(destination)
+        try:
+            self._materialize(blob.path, tmp_path)
+            os.replace(tmp_path, destination)
+        except BaseException:
+            _remove(tmp_path)
+            raise
+
+    def _materialize(self, source: str, destination: str) -> None:
+        if _reflink(source, destination):
+            return
+        if self.hardlink:
+            try:
+                os.link(source, destination)
+                return
+            except OSError:
+                # Another filesystem, or links are not supported
+                pass
+        shutil.copyfile(source, destination)
+
+    def prune(self) -> None:
+        """Delete the least recently stored blobs beyond ``max_bytes``.
+
+        Index entries of deleted blobs are removed as well. Files already
+        placed in folders are separate copies (or links) and stay intact.
+        Called from ``add`` once the blobs outgrow the budget, which runs in
+        a worker thread.
+        """
+        if not self.directory:
+            return
+        blobs = self._scan()
+        total = sum(size for _, size, _, _ in blobs)
+        doomed = set()
+        for _, size, name, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            doomed.add(name)
+            total -= size
+        with self._size_lock:
+            # Also picks up blobs added or pruned by other processes
+            self._bytes = total
+        if not doomed:
+            return
+        for root, _, files in os.walk(os.path.join(self.directory, "index")):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    with open(path, "r") as f:
+                        stale = json.load(f).get("sha256") in doomed
+                except (OSError, ValueError, AttributeError):
+                    stale = True
+                if stale:
+                    _remove(path)
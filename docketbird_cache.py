@@ -0,0 +1,405 @@
+"""Response caches for DocketBird API calls: in-process LRU and on-disk SQLite."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Time-to-live in seconds, matched against the endpoint path by longest prefix.
+# Single documents carry pre-signed S3 URLs, so they expire sooner.
+DEFAULT_TTLS = {
+    "/documents/": 300.0,
+    "/documents": 600.0,
+    "/cases": 900.0,
+}
+
+
+def ttl_for(
+    path: str, ttls: dict[str, float] = DEFAULT_TTLS, default: float = 300.0
+) -> float:
+    """Time-to-live for ``path``, using the longest matching prefix in ``ttls``."""
+    best = None
+    for prefix in ttls:
+        if path.startswith(prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return ttls[best] if best is not None else default
+
+
+def cache_key(endpoint: str, params: dict | None = None, model=None) -> tuple:
+    """Build a cache key from an endpoint, its query parameters and model.
+
+    Query strings embedded in ``endpoint`` are merged with ``params`` so that
+    ``/documents?case_id=x`` and ``("/documents", {"case_id": "x"})`` share
+    an entry. Raw JSON and each parsed model are cached separately.
+    """
+    parts = urlsplit(endpoint)
+    query = dict(parse_qsl(parts.query))
+    if params:
+        query.update({k: str(v) for k, v in params.items() if v is not None})
+    model_name = model.__name__ if model is not None else None
+    return (parts.path, tuple(sorted(query.items())), model_name)
+
+
+class ResponseCache:
+    """LRU cache of decoded API responses, bounded by entry count and bytes.
+
+    Entry size is the length of the raw response body, which is a cheap and
+    stable proxy for the memory held by the decoded object. Each entry also
+    keeps the response's validators (ETag and Last-Modified) so that an
+    expired entry can be renewed with a conditional request.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 300.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.current_bytes = 0
+        self._entries: OrderedDict[
+            tuple, tuple[object, int, float, tuple | None]
+        ] = OrderedDict()
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """Build a cache using the ``DOCKETBIRD_CACHE_*`` environment variables."""
+        return cls(
+            max_entries=int(os.getenv("DOCKETBIRD_CACHE_MAX_ENTRIES", "512")),
+            max_bytes=int(os.getenv("DOCKETBIRD_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        )
+
+    def ttl_for(self, path: str) -> float:
+        return ttl_for(path, self.ttls, self.default_ttl)
+
+    def get(self, key: tuple):
+        """Return the cached value for ``key``, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, size, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            # Expired entries stay (until evicted) so they can be revalidated
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def stale(self, key: tuple) -> tuple | None:
+        """Return ``(value, size, validators)`` for ``key``, even if expired.
+
+        ``validators`` is an ``(etag, last_modified)`` pair or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, size, _, validators = entry
+        return value, size, validators
+
+    def set(
+        self, key: tuple, value, size: int, validators: tuple | None = None
+    ) -> None:
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, size, time.monotonic() + ttl, validators)
+        self.current_bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or self.current_bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, endpoint: str, params: dict | None = None) -> bool:
+        """Drop the entries for one request, raw or parsed.
+
+        Returns True if something was removed.
+        """
+        path, query, _ = cache_key(endpoint, params)
+        keys = [key for key in self._entries if key[0] == path and key[1] == query]
+        for key in keys:
+            self._remove(key)
+        return bool(keys)
+
+    def invalidate_prefix(self, prefix: str = "") -> int:
+        """Drop every entry whose path starts with ``prefix`` (all if empty)."""
+        keys = [key for key in self._entries if key[0].startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def invalidate_case(self, case_id: str) -> int:
+        """Drop every entry that was requested with the given ``case_id``."""
+        keys = [key for key in self._entries if ("case_id", case_id) in key[1]]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revalidations": self.revalidations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: tuple) -> None:
+        _, size, _, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class StoredResponse:
+    """A raw API response as kept by a persistent cache backend."""
+
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    expires_at: float = 0.0
+    stored_at: float = 0.0
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def validators(self) -> tuple | None:
+        if self.etag is None and self.last_modified is None:
+            return None
+        return self.etag, self.last_modified
+
+
+class CacheBackend:
+    """Interface for persistent response stores shared between processes.
+
+    Keys are request strings such as ``{scope}:/documents?case_id=...``,
+    where the scope identifies the API key and base URL. Backends
+    return stale entries too, so callers can revalidate them.
+    """
+
+    def get(self, key: str) -> StoredResponse | None:
+        raise NotImplementedError
+
+    def set(self, key: str, response: StoredResponse) -> None:
+        raise NotImplementedError
+
+    def touch(self, key: str, expires_at: float) -> None:
+        """Extend an entry's lifetime after a successful revalidation."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class SQLiteBackend(CacheBackend):
+    """SQLite (WAL mode) response store with zlib-compressed bodies.
+
+    WAL lets several server processes on one host read concurrently while
+    one writes. Each thread gets its own connection. Once the stored bodies
+    exceed ``max_bytes``, the least recently stored rows are pruned.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires_at REAL NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+            )
+
+    @classmethod
+    def from_env(cls) -> "SQLiteBackend | None":
+        """Build the backend from ``DOCKETBIRD_CACHE_DB`` (empty disables it)."""
+        path = os.getenv(
+            "DOCKETBIRD_CACHE_DB",
+            os.path.join(os.path.expanduser("~"), ".docketbird", "cache.sqlite3"),
+        )
+        if not path:
+            return None
+        try:
+            return cls(
+                path,
+                max_bytes=int(
+                    os.getenv("DOCKETBIRD_CACHE_DB_MAX_BYTES", str(512 * 1024 * 1024))
+                ),
+            )
+        except (OSError, sqlite3.Error):
+            # An unusable cache location should not stop the server
+            return None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> StoredResponse | None:
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT body, etag, last_modified, expires_at, stored_at "
+                    "FROM responses WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            # A locked or damaged database is treated as a miss
+            return None
+        if row is None:
+            return None
+        body, etag, last_modified, expires_at, stored_at = row
+        try:
+            body = zlib.decompress(body)
+        except zlib.error:
+            self.delete(key)
+            return None
+        return StoredResponse(body, etag, last_modified, expires_at, stored_at)
+
+    def set(self, key: str, response: StoredResponse) -> None:
+        compressed = zlib.compress(response.body, 6)
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, size, etag, last_modified, expires_at, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    compressed,
+                    len(compressed),
+                    response.etag,
+                    response.last_modified,
+                    response.expires_at,
+                    response.stored_at or time.time(),
+                ),
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self.prune()
+        except sqlite3.Error:
+            # Writes are best effort; another process may hold the lock
+            pass
+
+    def touch(self, key: str, expires_at: float) -> None:
+        try:
+            self._connect().execute(
+                "UPDATE responses SET expires_at = ?, stored_at = ? WHERE key = ?",
+                (expires_at, time.time(), key),
+            )
+        except sqlite3.Error:
+            pass
+
+    def delete(self, key: str) -> None:
+        try:
+            self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error:
+            pass
+
+    def delete_prefix(self, prefix: str) -> None:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        try:
+            self._connect().execute(
+                "DELETE FROM responses WHERE key LIKE ? ESCAPE '\\'",
+                (escaped + "%",),
+            )
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        try:
+            self._connect().execute("DELETE FROM responses")
+        except sqlite3.Error:
+            pass
+
+    def prune(self) -> None:
+        conn = self._connect()
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        removed = 0
+        rows = conn.execute(
+            "SELECT key, size FROM responses ORDER BY stored_at"
+        ).fetchall()
+        doomed = []
+        for key, size in rows:
+            if removed >= excess:
+                break
+            doomed.append((key,))
+            removed += size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+
+def store_scope(base_url: str, api_key: str | None) -> str:
+    """Short hash naming the account and API a persistent entry belongs to.
+
+    The store is shared by every process on the host, and responses such as
+    ``/cases?scope=company`` differ between API keys and base URLs.
+    """
+    identity = f"{base_url}\n{api_key or ''}".encode()
+    return hashlib.sha256(identity).hexdigest()[:16]
+
+
+def backend_key(key: tuple, scope: str = "") -> str:
+    """Persistent key for an in-memory cache key (the model is irrelevant).
+
+    ``scope`` (see ``store_scope``) is prefixed as ``{scope}:``.
+    """
+    path, query = key[0], key[1]
+    request = f"{path}?{urlencode(query)}" if query else path
+    return f"{scope}:{request}" if scope else request
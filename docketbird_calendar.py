@@ -0,0 +1,174 @@
+"""Per-case calendar indexes for fast deadline range queries."""
+
+import asyncio
+import bisect
+import heapq
+import json
+import os
+import re
+import time
+from dataclasses import asdict
+
+from docketbird_models import CalendarEntry
+
+
+def _sort_key(entry: CalendarEntry) -> tuple:
+    # All-day entries ("2024-05-03") sort before timed ones on the same day
+    return (entry.date, entry.iso8601_datetime or "", entry.id or 0)
+
+
+class CaseCalendar:
+    """One case's calendar entries, kept sorted by date.
+
+    ``between`` answers date-range queries with two binary searches, so a
+    range over many cases costs O(log n) per case plus the matches.
+    """
+
+    def __init__(self, case_id: str, available: bool = True):
+        self.case_id = case_id
+        # False when the case has no AutoCalendar (the API answers 404)
+        self.available = available
+        self.entries: list[CalendarEntry] = []
+        self._dates: list[str] = []
+        self._by_id: dict = {}
+        self.updated_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def update(self, entries, available: bool = True) -> int:
+        """Replace the entries, re-sorting only if something changed.
+
+        Returns the number of entries added, changed or removed.
+        """
+        fresh = {(e.id if e.id is not None else e.uuid): e for e in entries}
+        changed = sum(
+            1 for key, entry in fresh.items() if self._by_id.get(key) != entry
+        )
+        changed += sum(1 for key in self._by_id if key not in fresh)
+        if changed:
+            self._by_id = fresh
+            self.entries = sorted(fresh.values(), key=_sort_key)
+            self._dates = [entry.date for entry in self.entries]
+        self.available = available
+        self.updated_at = time.time()
+        return changed
+
+    def between(self, start: str | None, end: str | None) -> list[CalendarEntry]:
+        """Entries dated from ``start`` to ``end`` (``YYYY-MM-DD``, inclusive)."""
+        lo = bisect.bisect_left(self._dates, start) if start else 0
+        hi = bisect.bisect_right(self._dates, end) if end else len(self._dates)
+        return self.entries[lo:hi]
+
+    def to_dict(self) -> dict:
+        return {
+            "case_id": self.case_id,
+            "available": self.available,
+            "updated_at": self.updated_at,
+            "entries": [asdict(entry) for entry in self.entries],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CaseCalendar":
+        calendar = cls(data["case_id"])
+        calendar.update(
+            (CalendarEntry.from_dict(e) for e in data.get("entries", ())),
+            available=data.get("available", True),
+        )
+        calendar.updated_at = data.get("updated_at", 0.0)
+        return calendar
+
+
+def merge_ranges(calendars, start: str | None, end: str | None):
+    """Yield the entries of several calendars within a date range, in date order."""
+    return heapq.merge(
+        *(calendar.between(start, end) for calendar in calendars), key=_sort_key
+    )
+
+
+class CalendarStore:
+    """Keeps case calendars in memory and persists them to ``directory``.
+
+    A calendar is re-fetched at most once per ``max_age`` seconds. Calendars
+    are read and written in a worker thread, and only written when their
+    entries changed.
+    """
+
+    def __init__(self, directory: str | None, max_age: float = 3600.0):
+        self.directory = directory
+        self.max_age = max_age
+        self._calendars: dict[str, CaseCalendar] = {}
+        self._save_locks: dict[str, asyncio.Lock] = {}
+
+    @classmethod
+    def from_env(cls) -> "CalendarStore":
+        directory = os.getenv(
+            "DOCKETBIRD_CALENDAR_DIR",
+            os.path.join(os.path.expanduser("~"), ".docketbird", "calendars"),
+        )
+        return cls(
+            directory or None,
+            max_age=float(os.getenv("DOCKETBIRD_CALENDAR_MAX_AGE", "3600")),
+        )
+
+    async def get(self, case_id: str) -> CaseCalendar:
+        calendar = self._calendars.get(case_id)
+        if calendar is None:
+            loaded = await asyncio.to_thread(self._load, case_id)
+            # Another caller may have loaded or created it meanwhile
+            calendar = self._calendars.setdefault(
+                case_id, loaded or CaseCalendar(case_id)
+            )
+        return calendar
+
+    def is_fresh(self, calendar: CaseCalendar) -> bool:
+        return time.time() - calendar.updated_at < self.max_age
+
+    def invalidate(self, case_id: str) -> None:
+        """Make the next lookup of ``case_id`` re-fetch its calendar."""
+        calendar = self._calendars.get(case_id)
+        if calendar is not None:
+            calendar.updated_at = 0.0
+
+    async def update(
+        self, case_id: str, entries, available: bool = True
+    ) -> CaseCalendar:
+        calendar = await self.get(case_id)
+        was_available = calendar.available
+        if calendar.update(entries, available) or available != was_available:
+            await self._save(calendar)
+        return calendar
+
+    def _path(self, case_id: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9._-]", "_", case_id)
+        return os.path.join(self.directory, f"{safe}.json")
+
+    def _load(self, case_id: str) -> CaseCalendar | None:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(case_id), "r") as f:
+                return CaseCalendar.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    async def _save(self, calendar: CaseCalendar) -> None:
+        if not self.directory:
+            return
+        # Serialized on the loop; the calendar may change while the thread writes
+        data = calendar.to_dict()
+        lock = self._save_locks.setdefault(calendar.case_id, asyncio.Lock())
+        async with lock:
+            await asyncio.to_thread(self._write, calendar.case_id, data)
+
+    def _write(self, case_id: str, data: dict) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(case_id)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Persistence is best effort; the in-memory calendar still works
+            pass
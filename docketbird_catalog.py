@@ -0,0 +1,188 @@
+"""Court and case-type catalog built from courts.json and case_types.json."""
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+
+# {court_id}-{district}:{year}-{type}-{number}, e.g. txnd-3:2007-cv-01697
+FEDERAL_CASE_ID_RE = re.compile(r"^([a-z0-9]+)-(\d+):(\d{2,4})-([a-z]+)-(\d+)")
+
+CATEGORIES = ("Circuit", "District", "Bankruptcy", "State", "Other")
+
+# Federal district and bankruptcy courts, e.g. "Northern District of Texas
+# (Bankruptcy)". Only their case IDs follow FEDERAL_CASE_ID_RE: appeals
+# (ca5-2021-30580), state (uc-..., nyap1) and county courts use other layouts.
+FEDERAL_TRIAL_COURT_NAME_RE = re.compile(r"^(?:\w+ )?District of (?!.*County)")
+
+
+@dataclass(frozen=True, slots=True)
+class Court:
+    code: str
+    name: str
+    category: str
+    # True when case IDs are known to follow FEDERAL_CASE_ID_RE
+    federal: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class CaseType:
+    abbreviation: str
+    name: str
+    example: str
+
+
+def categorize(name: str) -> str:
+    """Group a court by its name the way list_courts_and_types shows it."""
+    if "Circuit Court" in name or "Circuit" in name and "District" not in name:
+        return "Circuit"
+    elif "Bankruptcy" in name:
+        return "Bankruptcy"
+    elif "District" in name and "Bankruptcy" not in name:
+        return "District"
+    elif any(
+        state in name for state in ["Superior Court", "Supreme Court", "County Court"]
+    ):
+        return "State"
+    return "Other"
+
+
+def is_federal_trial_court(code: str, name: str) -> bool:
+    """True for the federal district and bankruptcy courts.
+
+    Decided from the court code and an explicit name pattern rather than the
+    display grouping, which files many state courts under Circuit or District.
+    """
+    return (
+        not code.startswith("uc-")
+        and code.isalnum()
+        and FEDERAL_TRIAL_COURT_NAME_RE.match(name) is not None
+    )
+
+
+@dataclass(frozen=True)
+class Catalog:
+    """Immutable, pre-indexed view of the court and case-type files."""
+
+    courts: MappingProxyType
+    case_types: MappingProxyType
+    rendered: str
+
+    @classmethod
+    def build(cls, courts_data: dict, case_types_data: dict) -> "Catalog":
+        courts = {}
+        buckets = {category: [] for category in CATEGORIES}
+        for court in courts_data["courts"]:
+            name = court["court_name"]
+            code = court["value"]
+            category = categorize(name)
+            courts[code] = Court(
+                code, name, category, is_federal_trial_court(code, name)
+            )
+            buckets[category].append(f"- {code}: {name}")
+
+        case_types = {}
+        for case_type in case_types_data["case_types"]:
+            abbreviation = case_type["abbreviature"]
+            case_types[abbreviation] = CaseType(
+                abbreviation, case_type["name"], case_type["example"]
+            )
+
+        # Build output
+        output = []
+        output.append("=== COURTS ===\n")
+        for category in CATEGORIES:
+            if buckets[category]:
+                output.append(f"{category} Courts:")
+                output.extend(sorted(buckets[category]))
+                output.append("")
+
+        # Add case types from case_types.json
+        output.append("=== CASE TYPES ===")
+        for case_type in case_types.values():
+            output.append(f"- {case_type.abbreviation}: {case_type.name}")
+            output.append(f"  Example: {case_type.example}")
+            output.append("")
+
+        return cls(
+            MappingProxyType(courts), MappingProxyType(case_types), "\n".join(output)
+        )
+
+    def court(self, code: str) -> Court | None:
+        return self.courts.get(code)
+
+    def case_type(self, abbreviation: str) -> CaseType | None:
+        return self.case_types.get(abbreviation)
+
+    def court_for_case(self, case_id: str) -> Court | None:
+        """Find the court a case id belongs to.
+
+        Federal ids start with ``{court_id}-``; state court codes contain
+        hyphens themselves, so every hyphen-delimited prefix is tried.
+        """
+        position = case_id.find("-")
+        while position > 0:
+            court = self.courts.get(case_id[:position])
+            if court is not None:
+                return court
+            position = case_id.find("-", position + 1)
+        return None
+
+    def validate_case_id(self, case_id: str) -> str | None:
+        """Return an error message if ``case_id`` cannot be valid, else None.
+
+        Only the layout of federal district and bankruptcy case IDs is
+        checked. The ``{type}`` part is not checked against ``case_types``,
+        which lists common PACER types only (mj, mc, md and others exist).
+        """
+        case_id = (case_id or "").strip()
+        if not case_id:
+            return "case_id is required"
+        court = self.court_for_case(case_id)
+        if court is None:
+            return (
+                f"Unknown court in case ID '{case_id}'. Case IDs look like "
+                "txnd-3:2007-cv-01697; see list_courts_and_types for valid court codes."
+            )
+        # Other courts' ids do not follow the federal layout
+        if court.federal and not FEDERAL_CASE_ID_RE.match(case_id):
+            return (
+                f"Malformed case ID '{case_id}'. Expected "
+                "{court_id}-{district}:{year}-{type}-{number}, e.g. txnd-3:2007-cv-01697"
+            )
+        return None
+
+
+class CatalogLoader:
+    """Load the catalog once and reload it only when a file's mtime changes.
+
+    Raises the underlying ``FileNotFoundError``/``json.JSONDecodeError`` from
+    ``get`` so callers can report which file is broken.
+    """
+
+    def __init__(self, courts_path: Path, case_types_path: Path):
+        self.courts_path = Path(courts_path)
+        self.case_types_path = Path(case_types_path)
+        self._catalog: Catalog | None = None
+        self._mtimes: tuple | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Catalog:
+        mtimes = (
+            os.stat(self.courts_path).st_mtime_ns,
+            os.stat(self.case_types_path).st_mtime_ns,
+        )
+        if self._catalog is not None and mtimes == self._mtimes:
+            return self._catalog
+        with self._lock:
+            if self._catalog is None or mtimes != self._mtimes:
+                with open(self.courts_path, "r") as f:
+                    courts_data = json.load(f)
+                with open(self.case_types_path, "r") as f:
+                    case_types_data = json.load(f)
+                self._catalog = Catalog.build(courts_data, case_types_data)
+                self._mtimes = mtimes
+        return self._catalog
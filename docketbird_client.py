@@ -0,0 +1,902 @@
+"""Async HTTP client for the DocketBird API and pre-signed S3 downloads."""
+
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+import httpx
+
+from docketbird_cache import (
+    CacheBackend,
+    ResponseCache,
+    SQLiteBackend,
+    StoredResponse,
+    backend_key,
+    store_scope,
+    cache_key,
+    ttl_for,
+)
+from docketbird_metrics import (
+    CACHE_LOOKUPS,
+    route_label,
+    track_decode,
+    track_upstream,
+)
+from docketbird_ratelimit import (
+    CircuitBreaker,
+    RateLimiter,
+    backoff_delay,
+    parse_retry_after,
+)
+
+BASE_URL = "https://api.docketbird.com"
+
+logger = logging.getLogger("docketbird.client")
+
+# HTTP/2 is only negotiated when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:
+    import ijson
+except ImportError:  # streaming decode is optional
+    ijson = None
+
+JSON_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
+# Responses smaller than this are decoded in one go (and cached); larger or
+# unsized bodies are parsed incrementally when ijson is available.
+STREAM_THRESHOLD = 4 * 1024 * 1024
+# Streamed bodies up to this size (per Content-Length) are also kept in the
+# in-memory cache; larger or unsized ones are not, to keep memory flat.
+STREAM_CACHE_BYTES = 16 * 1024 * 1024
+
+# API answers that are worth another try after a pause
+RETRY_STATUSES = {429, 502, 503, 504}
+
+
+class DocketBirdAPIError(Exception):
+    """Raised when a request to the DocketBird API fails."""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _Flight:
+    """One shared call of ``SingleFlight`` and the callers awaiting it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one shared task.
+
+    The first caller for a key starts the work; everyone who arrives while it
+    is still running awaits the same task and receives the same result or
+    exception. The task is shielded, so a cancelled waiter does not cancel the
+    upstream request for the others; once every waiter has gone (e.g. all
+    clients disconnected), the task itself is cancelled.
+    """
+
+    def __init__(self):
+        self._inflight: dict[tuple, _Flight] = {}
+        self.shared = 0
+
+    async def do(self, key: tuple, fn, *args):
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn(*args)))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self.shared += 1
+        # Counted on the flight, so a newer flight for the key is unaffected
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: tuple, flight: "_Flight") -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+class DocketBirdClient:
+    """Shared, pooled async client for the DocketBird API.
+
+    A single ``httpx.AsyncClient`` is created lazily on first use so that it is
+    bound to the running event loop. Connections are kept alive and reused
+    across tool calls, and every host gets its own concurrency limit so a large
+    S3 download burst cannot starve API calls (and vice versa).
+
+    Parsed responses live in ``cache`` (per process); raw bodies can also be
+    kept in a persistent ``store`` shared by every process on the host, so a
+    freshly started worker does not have to re-fetch what another one has.
+
+    API requests pass through a token-bucket ``rate_limiter`` shared per API
+    key and a ``breaker`` that fails fast while the API is down. Timeouts,
+    connection errors, 429 (honouring ``Retry-After``) and 502-504 answers
+    are retried up to ``retries`` times with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = BASE_URL,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        per_host_limit: int = 10,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        rate_limit: float = 10.0,
+        burst: int = 20,
+        retries: int = 3,
+        backoff: float = 0.5,
+        breaker: CircuitBreaker | None = None,
+        http2: bool | None = None,
+        cache: ResponseCache | None = None,
+        store: CacheBackend | None = None,
+        page_param: str = "page",
+        stream_threshold: int = STREAM_THRESHOLD,
+        stream_cache_bytes: int = STREAM_CACHE_BYTES,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.headers = {"Authorization": f"Bearer {api_key}"}
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.per_host_limit = per_host_limit
+        self.page_param = page_param
+        self.stream_threshold = stream_threshold
+        self.stream_cache_bytes = stream_cache_bytes
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.rate_limiter = (
+            RateLimiter.for_key(api_key, rate=rate_limit, burst=burst)
+            if rate_limit > 0
+            else None
+        )
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.cache = cache
+        self.store = store
+        # Keeps accounts and API hosts apart in the shared persistent store
+        self.store_scope = store_scope(self.base_url, api_key)
+        self.single_flight = SingleFlight()
+        self._client: httpx.AsyncClient | None = None
+        # TLS settings for the pooled client, prepared off the event loop
+        self._verify = None
+        self._warming: asyncio.Future | None = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_env(cls, api_key: str | None = None) -> "DocketBirdClient":
+        """Build a client using the ``DOCKETBIRD_*`` environment variables."""
+        return cls(
+            api_key=api_key or os.getenv("DOCKETBIRD_API_KEY"),
+            base_url=os.getenv("DOCKETBIRD_BASE_URL", BASE_URL),
+            max_connections=int(os.getenv("DOCKETBIRD_MAX_CONNECTIONS", "100")),
+            per_host_limit=int(os.getenv("DOCKETBIRD_PER_HOST_LIMIT", "10")),
+            connect_timeout=float(os.getenv("DOCKETBIRD_CONNECT_TIMEOUT", "10")),
+            read_timeout=float(os.getenv("DOCKETBIRD_READ_TIMEOUT", "60")),
+            rate_limit=float(os.getenv("DOCKETBIRD_RATE_LIMIT", "10")),
+            burst=int(os.getenv("DOCKETBIRD_RATE_BURST", "20")),
+            retries=int(os.getenv("DOCKETBIRD_MAX_RETRIES", "3")),
+            breaker=CircuitBreaker(
+                threshold=int(os.getenv("DOCKETBIRD_BREAKER_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("DOCKETBIRD_BREAKER_RESET", "30")),
+            ),
+            cache=ResponseCache.from_env(),
+            store=SQLiteBackend.from_env(),
+            page_param=os.getenv("DOCKETBIRD_PAGE_PARAM", "page"),
+            stream_threshold=int(
+                os.getenv("DOCKETBIRD_STREAM_THRESHOLD", str(STREAM_THRESHOLD))
+            ),
+            stream_cache_bytes=int(
+                os.getenv("DOCKETBIRD_STREAM_CACHE_BYTES", str(STREAM_CACHE_BYTES))
+            ),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                follow_redirects=True,
+                verify=self._verify if self._verify is not None else True,
+            )
+        return self._client
+
+    async def warm_up(self) -> None:
+        """Load the HTTP stack in a worker thread, once.
+
+        The first ``httpx.AsyncClient`` imports httpcore and reads the CA
+        bundle, tens of milliseconds of blocking work. Every request awaits
+        this first, so that work never blocks the event loop, and a new
+        session starts it early so it overlaps with initialization.
+        """
+        if self._verify is not None:
+            return
+        if self._warming is None:
+            self._warming = asyncio.ensure_future(asyncio.to_thread(_load_http_stack))
+        try:
+            self._verify = await asyncio.shield(self._warming)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Let httpx report the problem when it builds the client itself
+            self._verify = True
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = self._host_limits[host] = asyncio.Semaphore(
+                self.per_host_limit
+            )
+        return semaphore
+
+    async def get_json(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        *,
+        use_cache: bool = True,
+        model=None,
+    ):
+        """GET an API endpoint and return the decoded JSON body.
+
+        With ``model`` (a class from ``docketbird_models``) the body is parsed
+        once with ``model.from_response`` and the model is returned and cached
+        instead of the raw JSON.
+
+        Successful responses are served from the response cache when one is
+        configured, keyed by endpoint, query parameters and model, then from
+        the persistent store. Concurrent misses for the same key share a
+        single upstream request.
+
+        Raises:
+            DocketBirdAPIError: For any request-related errors
+        """
+        key = cache_key(endpoint, params, model)
+        if use_cache and self.cache is not None:
+            cached = self.cache.get(key)
+            CACHE_LOOKUPS.inc("memory", "miss" if cached is None else "hit")
+            if cached is not None:
+                return cached
+
+        return await self.single_flight.do(
+            key, self._fetch_and_store, key, endpoint, params, model, use_cache
+        )
+
+    async def _fetch_and_store(
+        self, key: tuple, endpoint: str, params: dict | None, model, use_cache: bool
+    ):
+        stored = await self._load_stored(key) if use_cache else None
+        data = _decode_fresh(key, stored)
+        if data is not None:
+            return self._remember(key, model, data, len(stored.body), stored.validators)
+
+        stale = self._stale(key, stored) if use_cache else None
+        data, response = await self._fetch_json(
+            endpoint, params, _conditional_headers(stale)
+        )
+        _count_revalidation(stale, response)
+        if response.status_code == 304:
+            revalidated = await self._revalidated(key, model, stale, stored)
+            if revalidated is not None:
+                return revalidated
+            data, response = await self._fetch_json(endpoint, params)
+        await self._save_stored(key, response)
+        return self._remember(
+            key, model, data, len(response.content), _validators(response)
+        )
+
+    def _remember(self, key: tuple, model, data, size: int, validators):
+        if model is not None:
+            with track_decode(route_label(key[0])):
+                data = model.from_response(data)
+        if self.cache is not None:
+            self.cache.set(key, data, size, validators)
+        return data
+
+    def _stale(self, key: tuple, stored: StoredResponse | None) -> tuple | None:
+        """Pick the expired copy of ``key`` to revalidate, if it has validators.
+
+        Returns ``(value, size, validators)``. The parsed in-memory copy is
+        preferred, unless the persistent store holds a different (newer)
+        version; a ``value`` of None means the stored body must be decoded.
+        """
+        entry = self.cache.stale(key) if self.cache is not None else None
+        if entry is not None and entry[2] is not None:
+            if stored is None or stored.validators in (None, entry[2]):
+                return entry
+        if stored is not None and stored.validators is not None:
+            return None, len(stored.body), stored.validators
+        return None
+
+    async def _revalidated(
+        self, key: tuple, model, stale: tuple, stored: StoredResponse | None
+    ):
+        """Renew the copy picked by ``_stale`` after a 304 Not Modified.
+
+        Returns None if the stored body turns out to be unusable.
+        """
+        value, size, validators = stale
+        if value is None:
+            try:
+                with track_decode(route_label(key[0])):
+                    value = json.loads(stored.body)
+                    if model is not None:
+                        value = model.from_response(value)
+            except ValueError:
+                return None
+        if self.cache is not None:
+            self.cache.revalidations += 1
+            self.cache.set(key, value, size, validators)
+        if stored is not None and stored.validators == validators:
+            expires_at = time.time() + self._ttl_for(key[0])
+            await asyncio.to_thread(self.store.touch, self._store_key(key), expires_at)
+        return value
+
+    def _ttl_for(self, path: str) -> float:
+        return self.cache.ttl_for(path) if self.cache is not None else ttl_for(path)
+
+    def _store_key(self, key: tuple) -> str:
+        return backend_key(key, self.store_scope)
+
+    async def invalidate(self, endpoint: str, params: dict | None = None) -> None:
+        """Forget the cached responses to one request, in memory and on disk."""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint, params)
+        if self.store is not None:
+            key = self._store_key(cache_key(endpoint, params))
+            await asyncio.to_thread(self.store.delete, key)
+
+    async def _load_stored(self, key: tuple) -> StoredResponse | None:
+        if self.store is None:
+            return None
+        stored = await asyncio.to_thread(self.store.get, self._store_key(key))
+        fresh = stored is not None and stored.fresh
+        CACHE_LOOKUPS.inc("store", "hit" if fresh else "miss")
+        return stored
+
+    async def _save_stored(self, key: tuple, response: httpx.Response) -> None:
+        if self.store is None:
+            return
+        ttl = self._ttl_for(key[0])
+        if ttl <= 0:
+            return
+        now = time.time()
+        stored = StoredResponse(
+            body=response.content,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            expires_at=now + ttl,
+            stored_at=now,
+        )
+        await asyncio.to_thread(self.store.set, self._store_key(key), stored)
+
+    async def _fetch_json(
+        self, endpoint: str, params: dict | None, headers: dict | None = None
+    ) -> tuple[dict | None, httpx.Response]:
+        """GET ``endpoint``; a 304 answer is returned with no decoded body."""
+        url = f"{self.base_url}{endpoint}"
+        try:
+            async with self._request(
+                url, {**self.headers, **(headers or {})}, params
+            ) as response:
+                await response.aread()
+            if response.status_code == 304:
+                return None, response
+            check_response(response)
+            with track_decode(route_label(endpoint)):
+                return response.json(), response
+
+        except DocketBirdAPIError:
+            raise
+        except httpx.ConnectError:
+            raise DocketBirdAPIError(
+                "Failed to connect to DocketBird API. Please check your internet connection."
+            )
+        except httpx.TimeoutException:
+            raise DocketBirdAPIError("The request timed out. Please try again later.")
+        except ValueError:
+            raise DocketBirdAPIError("Received invalid JSON response from the server.")
+        except httpx.HTTPError as e:
+            raise DocketBirdAPIError(f"HTTP error: {str(e)}")
+        except Exception as e:
+            raise DocketBirdAPIError(f"An unexpected error occurred: {str(e)}")
+
+    async def post_json(self, endpoint: str, body: dict) -> dict:
+        """POST a JSON body to an API endpoint and return the decoded answer.
+
+        Several endpoints answer with an empty body, which yields ``{}``.
+
+        Raises:
+            DocketBirdAPIError: For any request-related errors
+        """
+        url = f"{self.base_url}{endpoint}"
+        try:
+            async with self._request(
+                url, self.headers, None, method="POST", body=body
+            ) as response:
+                await response.aread()
+            check_response(response)
+            return response.json() if response.content.strip() else {}
+
+        except DocketBirdAPIError:
+            raise
+        except httpx.ConnectError:
+            raise DocketBirdAPIError(
+                "Failed to connect to DocketBird API. Please check your internet connection."
+            )
+        except httpx.TimeoutException:
+            raise DocketBirdAPIError("The request timed out. Please try again later.")
+        except ValueError:
+            raise DocketBirdAPIError("Received invalid JSON response from the server.")
+        except httpx.HTTPError as e:
+            raise DocketBirdAPIError(f"HTTP error: {str(e)}")
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        *,
+        prefetch: bool = True,
+        max_pages: int = 1000,
+        model=None,
+    ):
+        """Yield each page of a paginated endpoint as soon as it arrives.
+
+        DocketBird marks truncated responses with ``has_more``; the following
+        pages are requested with the ``page_param`` query parameter. With
+        ``prefetch`` the next page is already being fetched while the caller
+        processes the current one. Pages are parsed with ``model`` if given.
+        """
+        params = dict(params or {})
+        page = 1
+        previous = None
+        pending = asyncio.ensure_future(
+            self.get_json(endpoint, params, model=model)
+        )
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+                # Stop if the server ignores the page parameter
+                if previous is not None and response == previous:
+                    return
+                previous = response
+
+                has_more = _has_more(response) and page < max_pages
+                if has_more:
+                    page += 1
+                    next_params = {**params, self.page_param: page}
+                    if prefetch:
+                        pending = asyncio.ensure_future(
+                            self.get_json(endpoint, next_params, model=model)
+                        )
+                yield response
+                if has_more and pending is None:
+                    pending = asyncio.ensure_future(
+                        self.get_json(endpoint, next_params, model=model)
+                    )
+        finally:
+            if pending is not None:
+                _discard(pending)
+
+    async def stream_json(self, endpoint: str, params: dict | None, model):
+        """Yield ``(prefix, item)`` pairs for each part of a response.
+
+        ``model`` describes the parts through ``model.ITEMS``, a mapping of
+        ijson-style prefixes (e.g. ``data.documents.item``) to item parsers.
+        Large responses are decoded incrementally straight off the socket, so
+        each item is yielded as soon as it has been parsed and the full tree
+        is never built. Cached and small responses are parsed into ``model``
+        normally (and cached), then walked with ``model.iter_items``. Only
+        those are written to the persistent store. Streamed items are also
+        collected into ``model.from_items`` for the in-memory cache when the
+        Content-Length is at most ``stream_cache_bytes``, so an expired copy
+        can be revalidated with a conditional request and reused on 304 Not
+        Modified. Larger and unsized bodies are not kept at all.
+
+        Raises:
+            DocketBirdAPIError: For any request-related errors
+        """
+        key = cache_key(endpoint, params, model)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            CACHE_LOOKUPS.inc("memory", "miss" if cached is None else "hit")
+            if cached is not None:
+                for item in cached.iter_items():
+                    yield item
+                return
+        stored = await self._load_stored(key)
+        data = _decode_fresh(key, stored)
+        if data is not None:
+            parsed = self._remember(
+                key, model, data, len(stored.body), stored.validators
+            )
+            for item in parsed.iter_items():
+                yield item
+            return
+
+        stale = self._stale(key, stored)
+        headers = {**self.headers, **(_conditional_headers(stale) or {})}
+        url = f"{self.base_url}{endpoint}"
+        try:
+            async with self._request(url, headers, params) as response:
+                _count_revalidation(stale, response)
+                if response.status_code == 304:
+                    parsed = await self._revalidated(key, model, stale, stored)
+                    if parsed is None:
+                        parsed = await self.get_json(
+                            endpoint, params, use_cache=False, model=model
+                        )
+                    for item in parsed.iter_items():
+                        yield item
+                    return
+                if response.is_error:
+                    await response.aread()
+                    check_response(response)
+
+                length = response.headers.get("content-length")
+                if ijson is None and (
+                    length is None or int(length) > self.stream_threshold
+                ):
+                    _warn_streaming_unavailable()
+                if ijson is None or (
+                    length is not None and int(length) <= self.stream_threshold
+                ):
+                    body = await response.aread()
+                    with track_decode(route_label(endpoint)):
+                        data = json.loads(body)
+                    parsed = self._remember(
+                        key, model, data, len(body), _validators(response)
+                    )
+                    await self._save_stored(key, response)
+                    for item in parsed.iter_items():
+                        yield item
+                    return
+
+                items = None
+                if (
+                    self.cache is not None
+                    and length is not None
+                    and int(length) <= self.stream_cache_bytes
+                ):
+                    items = []
+                async for prefix, value in _parse_stream(
+                    response, tuple(model.ITEMS)
+                ):
+                    item = model.ITEMS[prefix](value)
+                    if items is not None:
+                        if response.num_bytes_downloaded > self.stream_cache_bytes:
+                            # Content-Length understated the body; stop keeping it
+                            items = None
+                        else:
+                            items.append((prefix, item))
+                    yield prefix, item
+                if items is not None:
+                    self.cache.set(
+                        key,
+                        model.from_items(items),
+                        response.num_bytes_downloaded,
+                        _validators(response),
+                    )
+
+        except DocketBirdAPIError:
+            raise
+        except httpx.ConnectError:
+            raise DocketBirdAPIError(
+                "Failed to connect to DocketBird API. Please check your internet connection."
+            )
+        except httpx.TimeoutException:
+            raise DocketBirdAPIError("The request timed out. Please try again later.")
+        except JSON_ERRORS:
+            raise DocketBirdAPIError("Received invalid JSON response from the server.")
+        except httpx.HTTPError as e:
+            raise DocketBirdAPIError(f"HTTP error: {str(e)}")
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        url: str,
+        headers: dict,
+        params: dict | None,
+        *,
+        method: str = "GET",
+        body: dict | None = None,
+    ):
+        """Send an API request and yield the (streamed) response.
+
+        Waits for the rate limiter, refuses to call while the circuit is
+        open, and retries transient failures before yielding. If retries run
+        out on an error status, that response is yielded for the caller to
+        report. Requests other than GET are only retried when the server
+        cannot have acted on them (connection failures and 429). The breaker
+        sees one outcome per call, once its retries are used up.
+
+        Raises:
+            DocketBirdAPIError: If the circuit breaker is open
+        """
+        retry_in = self.breaker.retry_in()
+        if retry_in:
+            raise DocketBirdAPIError(
+                "The DocketBird API is failing repeatedly; requests are "
+                f"paused for {retry_in:.0f}s. Please try again later."
+            )
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            await self.warm_up()
+
+            async with self._host_limit(url):
+                with track_upstream("api", route_label(urlsplit(url).path)) as tracked:
+                    try:
+                        request = self.client.build_request(
+                            method, url, headers=headers, params=params, json=body
+                        )
+                        response = await self.client.send(request, stream=True)
+                    except httpx.TransportError as e:
+                        tracked["error"] = type(e).__name__
+                        if attempt > self.retries or (
+                            method != "GET" and not isinstance(e, httpx.ConnectError)
+                        ):
+                            self.breaker.record_failure()
+                            raise
+                        delay = backoff_delay(attempt, self.backoff)
+                    else:
+                        tracked["response"] = response
+                        delay = self._retry_delay(response, attempt, method == "GET")
+                        if delay is None:
+                            try:
+                                await self._record_outcome(response)
+                                yield response
+                            finally:
+                                await response.aclose()
+                            return
+                        await response.aclose()
+            await asyncio.sleep(delay)
+
+    def _retry_delay(
+        self, response: httpx.Response, attempt: int, idempotent: bool = True
+    ) -> float | None:
+        """Return a delay if ``response`` should be retried, else None."""
+        status = response.status_code
+        if status not in RETRY_STATUSES:
+            return None
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        if status == 429:
+            if self.rate_limiter is not None:
+                self.rate_limiter.throttle(retry_after)
+        elif not idempotent:
+            return None
+        if attempt > self.retries:
+            return None
+        return backoff_delay(attempt, self.backoff, retry_after=retry_after)
+
+    async def _record_outcome(self, response: httpx.Response) -> None:
+        """Tell the breaker and rate limiter how the call finally went."""
+        status = response.status_code
+        if status == 429:
+            # Throttling is the rate limiter's business, not an outage
+            return
+        if status not in RETRY_STATUSES:
+            self.breaker.record_success()
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_success()
+            return
+        if status == 504:
+            await response.aread()
+            if is_endpoint_timeout(response):
+                # One slow request (e.g. an oversized docket), not a failing API
+                return
+        self.breaker.record_failure()
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: dict | None = None):
+        """Stream a GET response, e.g. a pre-signed S3 document URL.
+
+        No API credentials are sent, since pre-signed URLs carry their own.
+        """
+        await self.warm_up()
+        async with self._host_limit(url):
+            with track_upstream("s3", "download") as tracked:
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    tracked["response"] = response
+                    yield response
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_limits.clear()
+
+
+def _load_http_stack():
+    import httpcore  # noqa: F401  (imported by httpx on first client)
+
+    return httpx.create_ssl_context()
+
+
+_streaming_warned = False
+
+
+def _warn_streaming_unavailable() -> None:
+    global _streaming_warned
+    if not _streaming_warned:
+        _streaming_warned = True
+        logger.warning(
+            "ijson is not installed; large responses are buffered in memory. "
+            "Install the 'streaming' extra to parse them incrementally."
+        )
+
+
+class _BodyReader:
+    """Minimal async file-like wrapper over a streamed response for ijson."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        while not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+async def _parse_stream(response: httpx.Response, prefixes: tuple):
+    """Incrementally build and yield the values found at ``prefixes``."""
+    builder = None
+    target = None
+    depth = 0
+    events = ijson.parse_async(_BodyReader(response), use_float=True)
+    async for prefix, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if depth == 0:
+                    yield target, builder.value
+                    builder = None
+            continue
+
+        if prefix in prefixes:
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                target = prefix
+                depth = 1
+            elif event != "map_key":
+                yield prefix, value
+
+
+def _decode_fresh(key: tuple, stored: StoredResponse | None):
+    """Decode a persisted body if it is still fresh (and still valid JSON)."""
+    if stored is None or not stored.fresh:
+        return None
+    try:
+        with track_decode(route_label(key[0])):
+            return json.loads(stored.body)
+    except ValueError:
+        return None
+
+
+def _count_revalidation(stale: tuple | None, response: httpx.Response) -> None:
+    if stale is not None:
+        CACHE_LOOKUPS.inc(
+            "revalidation", "hit" if response.status_code == 304 else "miss"
+        )
+
+
+def _validators(response: httpx.Response) -> tuple | None:
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if etag is None and last_modified is None:
+        return None
+    return etag, last_modified
+
+
+def _conditional_headers(stale: tuple | None) -> dict | None:
+    """``If-None-Match`` / ``If-Modified-Since`` headers for a stale copy."""
+    if stale is None:
+        return None
+    etag, last_modified = stale[2]
+    headers = {}
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    if last_modified is not None:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _has_more(page) -> bool:
+    if isinstance(page, dict):
+        return bool(page.get("has_more"))
+    return bool(getattr(page, "has_more", False))
+
+
+def _discard(task: asyncio.Future) -> None:
+    """Cancel a prefetch nobody will await, without leaking its exception."""
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+    else:
+        task.cancel()
+
+
+def is_endpoint_timeout(response: httpx.Response) -> bool:
+    """True for the API gateway's 504 for one request that took too long."""
+    if response.status_code != 504:
+        return False
+    try:
+        error_data = response.json()
+    except ValueError:
+        return False
+    return (
+        isinstance(error_data, dict)
+        and error_data.get("message") == "Endpoint request timed out"
+    )
+
+
+def check_response(response: httpx.Response) -> None:
+    """Translate DocketBird error responses into ``DocketBirdAPIError``."""
+    # Handle 504 Gateway Timeout specifically
+    if response.status_code == 504:
+        if is_endpoint_timeout(response):
+            raise DocketBirdAPIError(
+                "The DocketBird API request timed out. Please try again later."
+            )
+        raise DocketBirdAPIError(
+            "Gateway Timeout (504): The request to DocketBird API timed out"
+        )
+
+    # Handle other common status codes
+    if response.status_code == 401:
+        raise DocketBirdAPIError("Authentication failed. Please check your API key.")
+    elif response.status_code == 403:
+        raise DocketBirdAPIError(
+            "Access forbidden. You don't have permission to access this resource."
+        )
+    elif response.status_code == 404:
+        raise DocketBirdAPIError("Resource not found.", 404)
+    elif response.status_code == 429:
+        raise DocketBirdAPIError(
+            "Rate limited by the DocketBird API. Please try again later."
+        )
+    elif response.is_error:
+        raise DocketBirdAPIError(
+            f"HTTP Error {response.status_code}: {response.reason_phrase}"
+        )
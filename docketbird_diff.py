@@ -0,0 +1,208 @@
+"""Docket snapshots and "what's new since" diffs for polling cases."""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+
+from docketbird_models import Document
+
+# Fields that make up a docket entry's identity for change detection. The
+# pre-signed download URL changes on every fetch, so only its presence counts.
+FINGERPRINT_FIELDS = (
+    "title",
+    "filing_date",
+    "restricted",
+    "primary_docket_sheet_number",
+    "pacer_document_url",
+    "downloaded",
+    "custom_filename",
+    "description",
+)
+
+
+def fingerprint(doc: Document) -> str:
+    values = [getattr(doc, name) for name in FINGERPRINT_FIELDS]
+    values.append(bool(doc.docketbird_document_url))
+    encoded = json.dumps(values, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=12).hexdigest()
+
+
+def parse_cursor(cursor: str | int | None) -> tuple[str, object] | None:
+    """Parse a cursor into ``("number", int)`` or ``("date", "YYYY-MM-DD")``.
+
+    A cursor is the last seen primary docket sheet number or filing date.
+
+    Raises:
+        ValueError: If the cursor is neither
+    """
+    if cursor is None or cursor == "":
+        return None
+    text = str(cursor).strip()
+    if text.isdigit():
+        return "number", int(text)
+    try:
+        return "date", date.fromisoformat(text[:10]).isoformat()
+    except ValueError:
+        raise ValueError(
+            f"Invalid cursor '{cursor}': use a docket number (e.g. 42) "
+            "or a filing date (YYYY-MM-DD)"
+        )
+
+
+def _after(doc: Document, cursor: tuple[str, object]) -> bool:
+    kind, value = cursor
+    if kind == "number":
+        number = doc.primary_docket_sheet_number
+        return number is not None and number > value
+    filed = (doc.filing_date or "")[:10]
+    return bool(filed) and filed > value
+
+
+def next_cursor(documents, kind: str = "number") -> str | None:
+    """The cursor pointing at the latest entry of ``documents``.
+
+    Falls back to the latest filing date when no entry has a docket number.
+    """
+    if kind == "number":
+        numbers = [
+            doc.primary_docket_sheet_number
+            for doc in documents
+            if doc.primary_docket_sheet_number is not None
+        ]
+        if numbers:
+            return str(max(numbers))
+    dates = [doc.filing_date[:10] for doc in documents if doc.filing_date]
+    return max(dates) if dates else None
+
+
+@dataclass
+class DocketDiff:
+    case_id: str
+    new: list[Document] = field(default_factory=list)
+    changed: list[Document] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    cursor: str | None = None
+    total: int = 0
+    # True when there was neither a snapshot nor a cursor to compare against
+    baseline: bool = False
+
+
+def diff_docket(
+    case_id: str,
+    documents: list[Document],
+    previous: dict[str, str] | None,
+    cursor: tuple[str, object] | None,
+) -> DocketDiff:
+    """Compare the current docket with a snapshot and/or a cursor.
+
+    Entries past the cursor, and entries the snapshot has never seen, are
+    new; entries whose fingerprint differs from the snapshot are changed.
+    """
+    diff = DocketDiff(case_id, total=len(documents))
+    diff.cursor = next_cursor(documents, cursor[0] if cursor else "number")
+    if previous is None and cursor is None:
+        diff.baseline = True
+        return diff
+
+    seen = set()
+    for doc in documents:
+        if doc.id is None:
+            continue
+        seen.add(doc.id)
+        old = previous.get(doc.id) if previous is not None else None
+        if cursor is not None and _after(doc, cursor):
+            diff.new.append(doc)
+        elif previous is not None and old is None:
+            diff.new.append(doc)
+        elif old is not None and old != fingerprint(doc):
+            diff.changed.append(doc)
+    if previous is not None:
+        diff.removed = [doc_id for doc_id in previous if doc_id not in seen]
+    return diff
+
+
+class SnapshotStore:
+    """Fingerprints of each case's last seen docket, persisted to ``directory``.
+
+    Snapshots are built, read and written in a worker thread, and only
+    rewritten when the docket changed.
+    """
+
+    def __init__(self, directory: str | None):
+        self.directory = directory
+        self._snapshots: dict[str, dict[str, str]] = {}
+
+    @classmethod
+    def from_env(cls) -> "SnapshotStore":
+        directory = os.getenv(
+            "DOCKETBIRD_SNAPSHOT_DIR",
+            os.path.join(os.path.expanduser("~"), ".docketbird", "snapshots"),
+        )
+        return cls(directory or None)
+
+    async def get(self, case_id: str) -> dict[str, str] | None:
+        snapshot = self._snapshots.get(case_id)
+        if snapshot is None:
+            snapshot = await asyncio.to_thread(self._load, case_id)
+            if snapshot is not None:
+                snapshot = self._snapshots.setdefault(case_id, snapshot)
+        return snapshot
+
+    async def update(
+        self, case_id: str, documents, diff: DocketDiff | None = None
+    ) -> None:
+        """Record ``documents`` as the last seen docket of ``case_id``.
+
+        With the ``diff`` just computed against the current snapshot, nothing
+        is done if it found no new, changed or removed entries.
+        """
+        if (
+            diff is not None
+            and case_id in self._snapshots
+            and not (diff.new or diff.changed or diff.removed)
+        ):
+            return
+        documents = list(documents)
+        snapshot = await asyncio.to_thread(self._build_and_save, case_id, documents)
+        self._snapshots[case_id] = snapshot
+
+    def _build_and_save(self, case_id: str, documents: list) -> dict[str, str]:
+        snapshot = {doc.id: fingerprint(doc) for doc in documents if doc.id}
+        self._save(case_id, snapshot)
+        return snapshot
+
+    def _path(self, case_id: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9._-]", "_", case_id)
+        return os.path.join(self.directory, f"{safe}.json")
+
+    def _load(self, case_id: str) -> dict[str, str] | None:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(case_id), "r") as f:
+                return json.load(f)["documents"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save(self, case_id: str, snapshot: dict[str, str]) -> None:
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(case_id)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {"case_id": case_id, "taken_at": time.time(), "documents": snapshot},
+                    f,
+                )
+            os.replace(tmp_path, path)
+        except OSError:
+            # Persistence is best effort; the in-memory snapshot still works
+            pass
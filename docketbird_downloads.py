@@ -0,0 +1,328 @@
+"""Document download helpers, including the parallel bulk downloader."""
+
+import asyncio
+import hashlib
+import os
+import random
+import re
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+from docketbird_blobs import BlobStore
+from docketbird_client import DocketBirdAPIError, DocketBirdClient
+from docketbird_models import Document, display
+
+# Fewer, larger chunks mean fewer writes and hash updates per document
+CHUNK_SIZE = 256 * 1024
+READ_BUFFER_SIZE = 1024 * 1024
+
+# S3 answers an expired pre-signed URL with 403 (or 400 for a malformed one)
+EXPIRED_URL_STATUSES = {400, 403}
+RETRYABLE_STATUSES = {408, 416, 429, 500, 502, 503, 504}
+
+
+class DownloadError(Exception):
+    """Raised when a document download fails."""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def filename_from_url(url: str) -> str:
+    """Extract the object name from a (pre-signed) S3 URL."""
+    return url.split("/")[-1].split("?")[0]
+
+
+def safe_filename(name: str) -> str:
+    """Make a DocketBird title or id safe to use as a file name."""
+    name = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", name).strip(" .")
+    return name[:240] or "document"
+
+
+@dataclass
+class FetchedFile:
+    path: str
+    bytes: int
+    sha256: str
+    resumed_from: int = 0
+    # Placed from the blob store without downloading anything
+    reused: bool = False
+
+
+def _hash_existing(path: str) -> tuple:
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as file:
+        while chunk := file.read(READ_BUFFER_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest, size
+
+
+async def fetch_to_file(
+    client: DocketBirdClient,
+    url: str,
+    save_location: str,
+    filename: str | None = None,
+    resume: bool = False,
+    blobs: BlobStore | None = None,
+    document_id: str | None = None,
+) -> FetchedFile:
+    """Stream ``url`` into ``save_location`` and hash it on the way.
+
+    The body is written to a ``.part`` file and renamed into place once
+    complete, so an interrupted download never leaves a truncated document.
+    With ``resume`` the ``.part`` file is kept on failure and the next call
+    continues it with an HTTP Range request.
+
+    With ``blobs`` a document already in the blob store (by ``document_id``
+    or S3 object) is copied from there instead, and a downloaded one is
+    added to it if ``save_location`` is on the store's filesystem.
+
+    Raises:
+        DownloadError: If S3 answers with an unexpected status
+    """
+    save_location = os.path.abspath(os.path.expanduser(save_location))
+    full_path = os.path.join(save_location, filename or filename_from_url(url))
+    part_path = f"{full_path}.part"
+    os.makedirs(save_location, exist_ok=True)
+
+    if blobs is not None:
+        try:
+            blob = await asyncio.to_thread(blobs.lookup, url, document_id)
+            if blob is not None:
+                await asyncio.to_thread(blobs.place, blob, full_path)
+                return FetchedFile(full_path, blob.size, blob.sha256, reused=True)
+        except OSError:
+            # E.g. the blob was pruned meanwhile; download it instead
+            pass
+        if not blobs.shares_device(save_location):
+            blobs = None
+
+    offset = 0
+    headers = None
+    if resume and os.path.exists(part_path):
+        offset = os.path.getsize(part_path)
+        if offset:
+            headers = {"Range": f"bytes={offset}-"}
+
+    async with client.stream(url, headers=headers) as response:
+        if offset and response.status_code == 416:
+            # The part file no longer matches the object; retry from scratch
+            os.remove(part_path)
+            raise DownloadError("HTTP Error 416: Stale partial download", 416)
+        if offset and response.status_code == 206:
+            digest, offset = await asyncio.to_thread(_hash_existing, part_path)
+            mode = "ab"
+        elif response.status_code == 200:
+            # Full body, either requested or because Range was not honoured
+            digest, offset, mode = hashlib.sha256(), 0, "wb"
+        else:
+            raise DownloadError(
+                f"HTTP Error {response.status_code}: Failed to download file",
+                response.status_code,
+            )
+
+        size = offset
+        try:
+            with open(part_path, mode, buffering=READ_BUFFER_SIZE) as file:
+                async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                    file.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+        except BaseException:
+            if not resume and os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+    sha256 = digest.hexdigest()
+    if blobs is not None:
+        try:
+            await asyncio.to_thread(
+                _store_blob, blobs, part_path, sha256, url, document_id
+            )
+        except OSError:
+            # The store is an optimisation; keep the download regardless
+            pass
+    os.replace(part_path, full_path)
+    return FetchedFile(full_path, size, sha256, offset)
+
+
+def _store_blob(
+    blobs: BlobStore, part_path: str, sha256: str, url: str, document_id: str | None
+) -> None:
+    blob = blobs.add(part_path, sha256)
+    if blob is not None:
+        blobs.record(blob, url, document_id)
+
+
+@dataclass
+class DownloadResult:
+    document_id: str
+    title: str
+    status: str
+    path: str | None = None
+    bytes: int = 0
+    attempts: int = 0
+    error: str | None = None
+    sha256: str | None = None
+    reused: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "downloaded"
+
+
+@dataclass
+class DownloadSummary:
+    results: list[DownloadResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def bytes(self) -> int:
+        return sum(result.bytes for result in self.results)
+
+    @property
+    def failures(self) -> list[DownloadResult]:
+        return [result for result in self.results if result.status == "failed"]
+
+    @property
+    def downloaded(self) -> int:
+        return sum(1 for result in self.results if result.ok)
+
+    @property
+    def reused(self) -> int:
+        return sum(1 for result in self.results if result.reused)
+
+    @property
+    def throughput(self) -> float:
+        """Average throughput in bytes per second."""
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def format_totals(self) -> list[str]:
+        mb = self.bytes / (1024 * 1024)
+        return [
+            f"Downloaded: {self.downloaded}/{len(self.results)} files",
+            f"Total Size: {mb:.2f} MB in {self.elapsed:.1f}s "
+            f"({self.throughput / (1024 * 1024):.2f} MB/s)",
+            f"Reused from local store: {self.reused}",
+            f"Failed: {len(self.failures)}",
+        ]
+
+
+class BulkDownloader:
+    """Download many documents concurrently with retries.
+
+    At most ``workers`` downloads run at once (the client's per-host limit
+    also applies). Transient failures are retried with jittered exponential
+    backoff, and an expired pre-signed URL is replaced by re-fetching
+    ``/documents/{id}`` once per document. ``filename_for`` maps a document
+    to its file name; by default the S3 object name is used. Documents found
+    in ``blobs`` are placed from disk rather than downloaded.
+    """
+
+    def __init__(
+        self,
+        client: DocketBirdClient,
+        workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        resume: bool = False,
+        filename_for=None,
+        blobs: BlobStore | None = None,
+    ):
+        self.client = client
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.resume = resume
+        self.filename_for = filename_for
+        self.blobs = blobs
+
+    async def download_all(
+        self, documents: list[Document], save_path: str, on_result=None
+    ) -> DownloadSummary:
+        """Download ``documents`` into ``save_path``.
+
+        ``on_result`` is awaited with each ``DownloadResult`` as soon as that
+        document is finished. Cancelling the call cancels every download.
+        """
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def bounded(doc: Document) -> DownloadResult:
+            async with semaphore:
+                result = await self.download_one(doc, save_path)
+            if on_result is not None:
+                await on_result(result)
+            return result
+
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(
+                bounded(doc)
+                for doc in documents
+                if doc.docketbird_document_url
+            )
+        )
+        return DownloadSummary(list(results), time.monotonic() - start)
+
+    async def download_one(self, doc: Document, save_path: str) -> DownloadResult:
+        doc_id = display(doc.id)
+        result = DownloadResult(doc_id, display(doc.title), "failed")
+        url = doc.docketbird_document_url
+        filename = self.filename_for(doc) if self.filename_for else None
+        refreshed = False
+
+        while True:
+            result.attempts += 1
+            try:
+                fetched = await fetch_to_file(
+                    self.client,
+                    url,
+                    save_path,
+                    filename,
+                    resume=self.resume,
+                    blobs=self.blobs,
+                    document_id=doc_id,
+                )
+                result.path = fetched.path
+                if not fetched.reused:
+                    result.bytes = fetched.bytes - fetched.resumed_from
+                result.sha256 = fetched.sha256
+                result.reused = fetched.reused
+                result.status = "downloaded"
+                result.error = None
+                return result
+            except DownloadError as e:
+                result.error = str(e)
+                if e.status_code in EXPIRED_URL_STATUSES and not refreshed:
+                    refreshed = True
+                    fresh_url = await self._fresh_url(doc_id)
+                    if fresh_url:
+                        url = fresh_url
+                        continue
+                retryable = e.status_code in RETRYABLE_STATUSES
+            except (httpx.TransportError, DocketBirdAPIError) as e:
+                result.error = str(e) or type(e).__name__
+                retryable = True
+            except Exception as e:
+                result.error = str(e)
+                retryable = False
+
+            if not retryable or result.attempts > self.retries:
+                return result
+            delay = self.backoff * 2 ** (result.attempts - 1)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+    async def _fresh_url(self, doc_id: str) -> str | None:
+        """Re-fetch a document to obtain a newly signed download URL."""
+        try:
+            document = await self.client.get_json(
+                f"/documents/{doc_id}", use_cache=False, model=Document
+            )
+        except DocketBirdAPIError:
+            return None
+        return document.docketbird_document_url if document else None
@@ -0,0 +1,110 @@
+"""Rendering of docket entries for tool output.
+
+Tools can render documents as labelled text blocks (the classic format), as
+one compact line per document, or as JSON, optionally restricted to a subset
+of fields.
+"""
+
+from dataclasses import fields as dataclass_fields
+from datetime import date
+
+from docketbird_models import Document, display
+
+FORMATS = ("text", "compact", "json")
+
+# Labels used by the text format, in display order
+DOCUMENT_LABELS = {
+    "id": "Document ID",
+    "title": "Title",
+    "filing_date": "Filed",
+    "restricted": "Restricted",
+    "primary_docket_sheet_number": "Primary Docket Sheet Number",
+    "pacer_document_url": "PACER Document URL",
+    "downloaded": "Downloaded",
+    "docketbird_document_url": "DocketBird Document URL",
+    "custom_filename": "Custom Filename",
+    "description": "Description",
+}
+DOCUMENT_FIELDS = tuple(field.name for field in dataclass_fields(Document))
+COMPACT_FIELDS = ("primary_docket_sheet_number", "filing_date", "title", "id")
+
+
+def select_fields(requested: list[str] | None, default: tuple) -> tuple:
+    """Validate a field selection, keeping the canonical field order.
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if not requested:
+        return default
+    unknown = [name for name in requested if name not in DOCUMENT_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown document field(s): {', '.join(unknown)}. "
+            f"Valid fields are: {', '.join(DOCUMENT_FIELDS)}"
+        )
+    return tuple(name for name in DOCUMENT_FIELDS if name in requested)
+
+
+def parse_date(value: str | None, name: str) -> str | None:
+    """Check an ISO ``YYYY-MM-DD`` date argument and return it.
+
+    Raises:
+        ValueError: If the date is not in ISO format
+    """
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"{name} must be a date in YYYY-MM-DD format, got '{value}'")
+
+
+def filed_between(doc: Document, start: str | None, end: str | None) -> bool:
+    """True if ``doc`` was filed within ``start``..``end`` (inclusive).
+
+    Documents without a filing date only match when no range is given.
+    """
+    if start is None and end is None:
+        return True
+    filed = (doc.filing_date or "")[:10]
+    if not filed:
+        return False
+    return (start is None or filed >= start) and (end is None or filed <= end)
+
+
+def in_page(position: int, offset: int, limit: int | None) -> bool:
+    """True if the ``position``-th (1-based) match falls on the requested page."""
+    return position > offset and (limit is None or position <= offset + limit)
+
+
+def page_window(matched: int, offset: int, limit: int | None) -> tuple[int, int | None]:
+    """Return how many of ``matched`` documents a page shows, and the next offset.
+
+    The next offset is None once the page reaches the last match.
+    """
+    end = matched if limit is None else min(matched, offset + limit)
+    shown = max(0, end - offset)
+    next_offset = offset + shown if offset + shown < matched else None
+    return shown, next_offset
+
+
+def document_text(doc: Document, number: int, fields: tuple) -> list[str]:
+    lines = [f"\nDocument #{number}"]
+    for name in fields:
+        value = getattr(doc, name)
+        # Descriptions are long and often empty, so they are only shown if set
+        if name == "description" and not value:
+            continue
+        lines.append(f"{DOCUMENT_LABELS[name]}: {display(value)}")
+    return lines
+
+
+def document_line(doc: Document, number: int, fields: tuple) -> str:
+    return " | ".join(
+        [f"#{number}"] + [display(getattr(doc, name)) for name in fields]
+    )
+
+
+def document_dict(doc: Document, fields: tuple) -> dict:
+    return {name: getattr(doc, name) for name in fields}
@@ -1,97 +1,276 @@
-from mcp.server.fastmcp import FastMCP
-from starlette.applications import Starlette
-from mcp.server.sse import SseServerTransport
-from starlette.requests import Request
-from starlette.routing import Mount, Route
+from mcp.server.fastmcp import Context, FastMCP
 from mcp.server import Server
-import uvicorn
-import requests
+import asyncio
+import heapq
 import os
 import json
+import sys
+import time
 from pathlib import Path
 import argparse
-from termcolor import colored
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from docketbird_blobs import BlobStore
+from docketbird_calendar import CalendarStore, CaseCalendar, merge_ranges
+from docketbird_catalog import CatalogLoader
+from docketbird_client import DocketBirdAPIError, DocketBirdClient
+from docketbird_models import (
+    CalendarEntries,
+    CalendarEntry,
+    Case,
+    CaseList,
+    DocketPage,
+    Document,
+    display,
+)
+from docketbird_diff import SnapshotStore, diff_docket, parse_cursor
+from docketbird_downloads import (
+    BulkDownloader,
+    DownloadError,
+    fetch_to_file,
+    safe_filename,
+)
+from docketbird_format import (
+    COMPACT_FIELDS,
+    DOCUMENT_FIELDS,
+    FORMATS,
+    document_dict,
+    document_line,
+    document_text,
+    filed_between,
+    in_page,
+    page_window,
+    parse_date,
+    select_fields,
+)
+from docketbird_metrics import (
+    OPERATION_IN_FLIGHT,
+    OPERATION_SECONDS,
+    instrument,
+    render as render_metrics,
+    tool_metrics,
+)
+from docketbird_poller import CasePoller, FollowedCases
+from docketbird_progress import ProgressReporter
+from docketbird_search import CaseIndex, IndexStore, QueryError
+from docketbird_sync import CaseSync
+
+# The HTTP stack is only imported when the SSE app is built, so that stdio
+# sessions (spawned per conversation by desktop clients) start faster
+if TYPE_CHECKING:
+    from starlette.applications import Starlette
+
+    from docketbird_sessions import SessionBroker
+
+
+@asynccontextmanager
+async def session_lifespan(server: FastMCP):
+    # Load the HTTP stack while the client is still initializing the session
+    warm_up = asyncio.ensure_future(client.warm_up())
+    try:
+        yield {}
+    finally:
+        if not warm_up.done():
+            warm_up.cancel()
 
 
 # Initialize FastMCP server with environment variables
-mcp = FastMCP("docketbird")
+mcp = FastMCP("docketbird", lifespan=session_lifespan)
 
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent.resolve()
 
-# API Configuration
-BASE_URL = "https://api.docketbird.com"
-HEADERS = {"Authorization": f"Bearer {os.getenv('DOCKETBIRD_API_KEY')}"}
+# Court and case type catalog, loaded on first use
+catalog_loader = CatalogLoader(
+    SCRIPT_DIR / "courts.json", SCRIPT_DIR / "case_types.json"
+)
 
-# Set up the SSE transport
-sse = SseServerTransport("/messages")
+# API Configuration
+client = DocketBirdClient.from_env()
+DOWNLOAD_WORKERS = int(os.getenv("DOCKETBIRD_DOWNLOAD_WORKERS", "8"))
+CROSS_CASE_CONCURRENCY = int(os.getenv("DOCKETBIRD_CROSS_CASE_CONCURRENCY", "8"))
+MAX_DOCKET_PAGES = 1000
+search_indexes = IndexStore.from_env()
+docket_snapshots = SnapshotStore.from_env()
+calendars = CalendarStore.from_env()
+# Downloaded documents, stored once and placed into every requested folder
+blobs = BlobStore.from_env()
+# Followed cases can be mirrored here by the background poller
+MIRROR_DIR = os.getenv("DOCKETBIRD_MIRROR_DIR", "")
+followed_cases = FollowedCases.from_env()
+
+def check_case_id(case_id: str) -> str | None:
+    """Validate a case ID against the court catalog before calling the API.
+
+    Returns an error message, or None if the ID looks valid (or the catalog
+    files are unavailable, in which case the API gets to decide).
+    """
+    try:
+        return catalog_loader.get().validate_case_id(case_id)
+    except (OSError, ValueError):
+        return None
 
 
 # Helper function for making requests
-def make_request(endpoint, params=None):
+@instrument(OPERATION_SECONDS, OPERATION_IN_FLIGHT)
+async def make_request(endpoint, params=None, model=None):
     """Make a request to the DocketBird API with proper error handling.
 
+    Requests go through the shared pooled client, so concurrent tool calls
+    never block the event loop. With ``model`` the response is parsed into
+    that model from ``docketbird_models`` once, and the model is cached.
+    Expired entries are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since``, and a 304 reuses the cached model as is.
+
     Raises:
-        requests.exceptions.RequestException: For any request-related errors
+        DocketBirdAPIError: For any request-related errors
     """
-    url = f"{BASE_URL}{endpoint}"
-    try:
-        response = requests.get(url, headers=HEADERS, params=params)
+    return await client.get_json(endpoint, params=params, model=model)
 
-        # Handle 504 Gateway Timeout specifically
-        if response.status_code == 504:
-            try:
-                error_data = response.json()
-                if error_data.get("message") == "Endpoint request timed out":
-                    raise requests.exceptions.RequestException(
-                        "The DocketBird API request timed out. Please try again later."
-                    )
-            except (ValueError, AttributeError):
-                raise requests.exceptions.RequestException(
-                    "Gateway Timeout (504): The request to DocketBird API timed out"
-                )
 
-        # Handle other common status codes
-        if response.status_code == 401:
-            raise requests.exceptions.RequestException(
-                "Authentication failed. Please check your API key."
-            )
-        elif response.status_code == 403:
-            raise requests.exceptions.RequestException(
-                "Access forbidden. You don't have permission to access this resource."
+async def iter_case_pages(case_id: str):
+    """Yield each ``DocketPage`` of a case's docket as it arrives.
+
+    The next page is prefetched while the current one is being processed.
+    """
+    async for page in client.iter_pages(
+        "/documents", {"case_id": case_id}, model=DocketPage
+    ):
+        yield page
+
+
+async def fetch_case_documents(case_id: str) -> list[Document]:
+    """Collect the documents from every page of a case's docket."""
+    documents = []
+    async for page in iter_case_pages(case_id):
+        documents.extend(page.documents)
+    return documents
+
+
+async def stream_case_docket(case_id: str):
+    """Yield ``(prefix, model)`` pairs for a case's docket across all pages.
+
+    Prefixes are ``data.case``, ``data.parties.item`` and
+    ``data.documents.item``. Documents are yielded one at a time as they are
+    decoded, so large dockets never exist in memory as a single tree.
+    """
+    params = {"case_id": case_id}
+    previous_first = None
+    for page in range(1, MAX_DOCKET_PAGES + 1):
+        has_more = False
+        first_id = None
+        async for prefix, value in client.stream_json("/documents", params, DocketPage):
+            if prefix == "has_more":
+                has_more = value
+            elif prefix == "data.documents.item":
+                if first_id is None:
+                    first_id = value.id
+                    # Stop if the server ignores the page parameter
+                    if page > 1 and first_id == previous_first:
+                        return
+                yield prefix, value
+            elif page == 1:
+                yield prefix, value
+        if not has_more:
+            return
+        previous_first = first_id
+        params = {"case_id": case_id, client.page_param: page + 1}
+
+
+async def get_case_index(case_id: str, refresh: bool = False) -> CaseIndex:
+    """Return the search index for a case, refreshing it if it is stale.
+
+    Only new or changed docket entries are re-indexed on refresh.
+    """
+    index = await search_indexes.get(case_id)
+    if refresh or not search_indexes.is_fresh(index):
+        documents = await fetch_case_documents(case_id)
+        index = await search_indexes.update(case_id, documents)
+    return index
+
+
+def download_progress(progress: ProgressReporter):
+    """``on_result`` callback reporting each finished download to the client."""
+
+    async def on_result(item) -> None:
+        if item.ok:
+            message = f"Downloaded {item.title} (ID: {item.document_id})"
+        else:
+            message = f"Failed {item.title} (ID: {item.document_id}): {item.error}"
+        await progress.advance(nbytes=item.bytes, message=message)
+
+    return on_result
+
+
+async def get_case_calendar(case_id: str, refresh: bool = False) -> CaseCalendar:
+    """Return a case's calendar, re-fetching it if it is stale.
+
+    A case without an AutoCalendar gets an empty calendar marked unavailable.
+    """
+    calendar = await calendars.get(case_id)
+    if refresh or not calendars.is_fresh(calendar):
+        try:
+            response = await make_request(
+                "/calendar_entries", {"case_id": case_id}, model=CalendarEntries
             )
-        elif response.status_code == 404:
-            raise requests.exceptions.RequestException("Resource not found.")
+        except DocketBirdAPIError as e:
+            if e.status_code != 404:
+                raise
+            return await calendars.update(case_id, (), available=False)
+        calendar = await calendars.update(case_id, response.entries)
+    return calendar
 
-        # Ensure the response was successful
-        response.raise_for_status()
-        return response.json()
 
-    except requests.exceptions.ConnectionError:
-        raise requests.exceptions.RequestException(
-            "Failed to connect to DocketBird API. Please check your internet connection."
-        )
-    except requests.exceptions.Timeout:
-        raise requests.exceptions.RequestException(
-            "The request timed out. Please try again later."
-        )
-    except requests.exceptions.JSONDecodeError:
-        raise requests.exceptions.RequestException(
-            "Received invalid JSON response from the server."
-        )
-    except requests.exceptions.RequestException:
-        # Re-raise any other request exceptions
-        raise
-    except Exception as e:
-        raise requests.exceptions.RequestException(
-            f"An unexpected error occurred: {str(e)}"
+def format_calendar_entry(entry: CalendarEntry) -> str:
+    when = display(entry.iso8601_datetime).replace("T", " ")
+    line = f"- {when}: {display(entry.title)}"
+    if entry.document_id:
+        line += f" (Document ID: {entry.document_id})"
+    return line
+
+
+async def refresh_followed_case(case_id: str) -> None:
+    """Warm everything an agent may ask about for a followed case.
+
+    Re-reads the docket (through the response cache, so unchanged dockets
+    cost a 304), updates the search index and the calendar and, with
+    ``DOCKETBIRD_MIRROR_DIR``, syncs the documents into
+    ``<mirror dir>/<case id>``.
+    """
+    documents = await fetch_case_documents(case_id)
+    await search_indexes.update(case_id, documents)
+    await get_case_calendar(case_id)
+    if MIRROR_DIR:
+        save_path = os.path.join(MIRROR_DIR, safe_filename(case_id))
+        await CaseSync(client, workers=DOWNLOAD_WORKERS, blobs=blobs).sync(
+            case_id, documents, save_path
         )
 
 
+poller = CasePoller.from_env(followed_cases, refresh_followed_case)
+
+
 @mcp.tool()
-async def get_case_details(case_id: str) -> str:
+@tool_metrics
+async def get_case_details(
+    case_id: str,
+    offset: int = 0,
+    limit: int | None = None,
+    filed_from: str | None = None,
+    filed_to: str | None = None,
+    fields: list[str] | None = None,
+    format: str = "text",
+    ctx: Context = None,
+) -> str:
     """Get comprehensive details about a case including all documents.
 
+    For large dockets, narrow the output with a filing date range,
+    offset/limit paging, a field selection and the compact format. The
+    number of documents read so far is sent as progress notifications.
+
     Args:
         case_id: The DocketBird case ID to retrieve details for.
                 Format: {court_id}-{district}:{year}-{type}-{number}
@@ -139,8 +318,16 @@ async def get_case_details(case_id: str) -> str:
                 type: Case type (e.g. cv for civil, wr for writ)
                 number: Case number (e.g. 01697, 08028)
                 For more information on courts, see list_courts_and_types tool
-
-
+        offset: Number of matching documents to skip
+        limit: Maximum number of documents to return (all if omitted)
+        filed_from: Only include documents filed on or after this date (YYYY-MM-DD)
+        filed_to: Only include documents filed on or before this date (YYYY-MM-DD)
+        fields: Document fields to include, e.g. ["id", "title", "filing_date"].
+                Valid fields: id, title, filing_date, restricted,
+                primary_docket_sheet_number, pacer_document_url, downloaded,
+                docketbird_document_url, custom_filename, description
+        format: "text" (labelled blocks), "compact" (one line per document)
+                or "json"
 
     Returns:
         A formatted string containing comprehensive case details including:
@@ -157,160 +344,409 @@ async def get_case_details(case_id: str) -> str:
         Filed: 2023-01-15
         ...
     """
+    error = check_case_id(case_id)
+    if error:
+        return f"Error: {error}"
+    if format not in FORMATS:
+        return f"Error: format must be one of {', '.join(FORMATS)}"
+    if offset < 0 or (limit is not None and limit < 0):
+        return "Error: offset and limit must not be negative"
     try:
-        # Get case details and documents
-        docs_response = make_request(f"/documents?case_id={case_id}")
+        filed_from = parse_date(filed_from, "filed_from")
+        filed_to = parse_date(filed_to, "filed_to")
+        default_fields = COMPACT_FIELDS if format == "compact" else DOCUMENT_FIELDS
+        fields = select_fields(fields, default_fields)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    progress = ProgressReporter(ctx)
 
-        if not docs_response:
+    try:
+        case = None
+        parties = []
+        doc_lines = []
+        doc_count = 0
+        matched = 0
+
+        # Only the requested documents are formatted, as they are decoded
+        async for prefix, value in stream_case_docket(case_id):
+            if prefix == "data.case":
+                case = value
+            elif prefix == "data.parties.item":
+                parties.append(value)
+            elif prefix == "data.documents.item":
+                doc_count += 1
+                await progress.advance()
+                if not filed_between(value, filed_from, filed_to):
+                    continue
+                matched += 1
+                if not in_page(matched, offset, limit):
+                    continue
+                if format == "json":
+                    doc_lines.append(document_dict(value, fields))
+                elif format == "compact":
+                    doc_lines.append(document_line(value, doc_count, fields))
+                else:
+                    doc_lines.extend(document_text(value, doc_count, fields))
+
+        if case is None and not parties and not doc_count:
             return "Failed to retrieve case details or documents"
-
-        # Get case data safely using .get()
-        case = docs_response.get("data", {}).get("case", {})
+        case = case or Case()
+
+        shown, next_offset = page_window(matched, offset, limit)
+
+        if format == "json":
+            return json.dumps(
+                {
+                    "case": asdict(case),
+                    "parties": [asdict(party) for party in parties],
+                    "total_documents": doc_count,
+                    "matching_documents": matched,
+                    "offset": offset,
+                    "next_offset": next_offset,
+                    "documents": doc_lines,
+                }
+            )
 
         # Format basic case info
         output = []
         output.append("=== CASE DETAILS ===")
-        output.append(f"Title: {case.get('title', 'N/A')}")
-        output.append(f"Court: {case.get('court_id', 'N/A')}")
-        output.append(f"Filed: {case.get('date_filed', 'N/A')}")
-        output.append(f"Closed: {case.get('date_closed', 'N/A')}")
-        output.append(f"URL: {case.get('url', 'N/A')}")
-        output.append(f"PACER Case ID: {case.get('pacer_case_id', 'N/A')}")
-        output.append(f"Client Code: {case.get('client_code', 'N/A')}")
+        output.append(f"Title: {display(case.title)}")
+        output.append(f"Court: {display(case.court_id)}")
+        output.append(f"Filed: {display(case.date_filed)}")
+        output.append(f"Closed: {display(case.date_closed)}")
+        output.append(f"URL: {display(case.url)}")
+        output.append(f"PACER Case ID: {display(case.pacer_case_id)}")
+        output.append(f"Client Code: {display(case.client_code)}")
 
         # Add parties if available
-        parties = docs_response.get("data", {}).get("parties", [])
         if parties:
             output.append("\n=== PARTIES ===")
             for party in parties:
                 output.append(
-                    f"- {party.get('name', 'N/A')} ({party.get('type', 'N/A')})"
+                    f"- {display(party.name)} ({display(party.type)})"
                 )
 
         # Add documents if available
-        documents = docs_response.get("data", {}).get("documents", [])
-        if documents:
+        if doc_lines:
             output.append("\n=== DOCUMENTS ===")
-            for idx, doc in enumerate(documents, 1):
-                output.append(f"\nDocument #{idx}")
-                output.append(f"Document ID: {doc.get('id', 'N/A')}")
-                output.append(f"Title: {doc.get('title', 'N/A')}")
-                output.append(f"Filed: {doc.get('filing_date', 'N/A')}")
-                output.append(f"Restricted: {doc.get('restricted', 'N/A')}")
-                output.append(
-                    f"Primary Docket Sheet Number: {doc.get('primary_docket_sheet_number', 'N/A')}"
-                )
-                output.append(
-                    f"PACER Document URL: {doc.get('pacer_document_url', 'N/A')}"
-                )
-                output.append(f"Downloaded: {doc.get('downloaded', 'N/A')}")
-                output.append(
-                    f"DocketBird Document URL: {doc.get('docketbird_document_url', 'N/A')}"
-                )
-                output.append(f"Custom Filename: {doc.get('custom_filename', 'N/A')}")
-                if doc.get("description"):
-                    output.append(f"Description: {doc.get('description')}")
+            if format == "compact":
+                output.append("#N | " + " | ".join(fields))
+            output.extend(doc_lines)
+
+        if shown < matched or matched < doc_count:
+            output.append(
+                f"\nShowing {shown} of {matched} matching documents "
+                f"({doc_count} in the docket)"
+            )
+            if next_offset is not None:
+                output.append(f"Use offset={next_offset} to see more")
 
         return "\n".join(output)
 
-    except requests.exceptions.RequestException as e:
+    except DocketBirdAPIError as e:
         return f"Error retrieving case details: {str(e)}"
     except Exception as e:
         return f"An unexpected error occurred: {str(e)}"
 
 
 @mcp.tool()
-async def search_case_documents(case_id: str, search_term: str) -> str:
+@tool_metrics
+async def get_docket_updates(
+    case_id: str, cursor: str | None = None, format: str = "compact"
+) -> str:
+    """Get only the docket entries that are new or changed since the last check.
+
+    Entries are compared with the snapshot saved by the previous call for
+    this case and/or with a cursor. Pass the returned cursor to the next call
+    when polling. The first call without a cursor only records a baseline.
+
+    Args:
+        case_id: The DocketBird case ID to check (see get_case_details for the format)
+        cursor: Last seen primary docket sheet number (e.g. "42") or filing
+                date (YYYY-MM-DD); entries after it are reported as new
+        format: "compact" (one line per entry) or "json"
+    """
+    error = check_case_id(case_id)
+    if error:
+        return f"Error: {error}"
+    if format not in ("compact", "json"):
+        return "Error: format must be one of compact, json"
+    try:
+        parsed_cursor = parse_cursor(cursor)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+
+    try:
+        documents = await fetch_case_documents(case_id)
+        diff = diff_docket(
+            case_id, documents, await docket_snapshots.get(case_id), parsed_cursor
+        )
+        await docket_snapshots.update(case_id, documents, diff)
+        # The docket was fetched anyway, so keep the search index current
+        await search_indexes.update(case_id, documents)
+
+        if format == "json":
+            return json.dumps(
+                {
+                    "case_id": case_id,
+                    "cursor": diff.cursor,
+                    "baseline": diff.baseline,
+                    "total_documents": diff.total,
+                    "new": [document_dict(doc, DOCUMENT_FIELDS) for doc in diff.new],
+                    "changed": [
+                        document_dict(doc, DOCUMENT_FIELDS) for doc in diff.changed
+                    ],
+                    "removed": diff.removed,
+                }
+            )
+
+        if diff.baseline:
+            return (
+                f"Saved a baseline of {diff.total} docket entries for {case_id}.\n"
+                f"Cursor: {display(diff.cursor)}"
+            )
+
+        output = [
+            f"=== DOCKET UPDATES FOR {case_id} ===",
+            f"New: {len(diff.new)}, Changed: {len(diff.changed)}, "
+            f"Removed: {len(diff.removed)} ({diff.total} entries in the docket)",
+            f"Cursor: {display(diff.cursor)}",
+        ]
+        for title, docs in (("NEW", diff.new), ("CHANGED", diff.changed)):
+            if docs:
+                output.append(f"\n=== {title} ===")
+                output.append("# | " + " | ".join(COMPACT_FIELDS))
+                output.extend(
+                    document_line(doc, position, COMPACT_FIELDS)
+                    for position, doc in enumerate(docs, 1)
+                )
+        if diff.removed:
+            output.append("\n=== REMOVED ===")
+            output.extend(f"Document ID: {doc_id}" for doc_id in diff.removed)
+
+        return "\n".join(output)
+
+    except DocketBirdAPIError as e:
+        return f"Error retrieving docket updates: {str(e)}"
+    except Exception as e:
+        return f"An unexpected error occurred: {str(e)}"
+
+
+@mcp.tool()
+@tool_metrics
+async def search_case_documents(case_id: str, search_term: str, limit: int = 50) -> str:
     """Search for specific documents within a case using a search term.
 
+    Titles and descriptions are matched word by word (so "filed" also finds
+    "filing"), and results are ranked by relevance. Multiple words must all
+    match. Also supported: "quoted phrases", OR, NOT or -word, and parentheses,
+    e.g. "motion to dismiss" OR (stipulation -order).
+
     Args:
         case_id: The DocketBird case ID to search in
         search_term: Term to search for in document titles and descriptions
+        limit: Maximum number of matching documents to return
     """
-    try:
-        docs_response = make_request(f"/documents?case_id={case_id}")
+    error = check_case_id(case_id)
+    if error:
+        return f"Error: {error}"
 
-        if not docs_response:
-            return "Failed to retrieve case documents"
-
-        documents = docs_response.get("data", {}).get("documents", [])
-        if not documents:
+    try:
+        index = await get_case_index(case_id)
+        if not len(index):
             return "No documents found for this case"
 
-        # Search through documents
-        search_term = search_term.lower()
-        matching_docs = []
+        try:
+            total, results = index.search(search_term, limit)
+        except QueryError as e:
+            return f"Invalid search query: {str(e)}"
 
-        for doc in documents:
-            title = doc.get("title", "").lower()
-            desc = doc.get("description", "").lower()
-
-            if search_term in title or search_term in desc:
-                doc_info = [
-                    f"\nDocument ID: {doc.get('id', 'N/A')}",
-                    f"Title: {doc.get('title', 'N/A')}",
-                    f"Filed: {doc.get('filing_date', 'N/A')}",
-                    f"DocketBird URL: {doc.get('docketbird_document_url', 'N/A')}",
-                ]
-                if doc.get("description"):
-                    doc_info.append(f"Description: {doc.get('description')}")
-                matching_docs.append("\n".join(doc_info))
-
-        if not matching_docs:
+        if not results:
             return f"No documents found matching search term: {search_term}"
 
-        output = [f"Found {len(matching_docs)} matching documents:"]
+        matching_docs = []
+        for doc, _score in results:
+            doc_info = [
+                f"\nDocument ID: {display(doc.id)}",
+                f"Title: {display(doc.title)}",
+                f"Filed: {display(doc.filing_date)}",
+                f"DocketBird URL: {display(doc.docketbird_document_url)}",
+            ]
+            if doc.description:
+                doc_info.append(f"Description: {doc.description}")
+            matching_docs.append("\n".join(doc_info))
+
+        output = [f"Found {total} matching documents:"]
+        if total > len(results):
+            output.append(f"Showing the {len(results)} most relevant")
         output.extend(matching_docs)
         return "\n".join(output)
 
-    except requests.exceptions.RequestException as e:
+    except DocketBirdAPIError as e:
         return f"Error searching case documents: {str(e)}"
     except Exception as e:
         return f"An unexpected error occurred while searching: {str(e)}"
 
 
 @mcp.tool()
-async def download_available_files(case_id: str, save_path: str) -> str:
+@tool_metrics
+async def search_all_cases(
+    search_term: str,
+    scope: str = "company",
+    limit: int = 25,
+    max_concurrency: int = CROSS_CASE_CONCURRENCY,
+) -> str:
+    """Search documents across every case returned by list_cases.
+
+    Uses the same query syntax as search_case_documents. Cases are searched
+    in parallel using their local search indexes (only stale or unseen cases
+    are fetched from DocketBird), and the best matches overall are returned.
+
+    Args:
+        search_term: Term to search for in document titles and descriptions
+        scope: Either "company" or "user" to specify whose cases to search
+        limit: Maximum number of matching documents to return
+        max_concurrency: Maximum number of cases fetched at the same time
+    """
+    try:
+        if scope not in ["company", "user"]:
+            return "Error: scope must be either 'company' or 'user'"
+        if limit < 1:
+            return "Error: limit must be at least 1"
+
+        # Validate the query once before fanning out
+        try:
+            CaseIndex("").search(search_term)
+        except QueryError as e:
+            return f"Invalid search query: {str(e)}"
+
+        response = await make_request("/cases", {"scope": scope}, model=CaseList)
+        cases = [case for case in response.cases if case.id]
+        if not cases:
+            return f"No cases found for {scope} scope"
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        top = []  # min-heap of (score, tiebreak, case, document)
+        total = 0
+        matched_cases = 0
+        failed = []
+
+        async def search_case(position: int, case) -> None:
+            nonlocal total, matched_cases
+            try:
+                async with semaphore:
+                    index = await get_case_index(case.id)
+                count, results = index.search(search_term, limit)
+            except DocketBirdAPIError as e:
+                failed.append(f"- {case.id}: {str(e)}")
+                return
+            if count:
+                total += count
+                matched_cases += 1
+            for rank, (doc, score) in enumerate(results):
+                entry = (score, -position, -rank, case, doc)
+                if len(top) < limit:
+                    heapq.heappush(top, entry)
+                elif entry[:3] > top[0][:3]:
+                    heapq.heapreplace(top, entry)
+                else:
+                    # Results are sorted, so the rest of this case cannot win
+                    break
+
+        await asyncio.gather(
+            *(search_case(position, case) for position, case in enumerate(cases))
+        )
+
+        if not top and not failed:
+            return f"No documents found matching search term: {search_term}"
+
+        output = [
+            f"Found {total} matching documents in {matched_cases} of {len(cases)} cases:"
+        ]
+        if total > len(top):
+            output.append(f"Showing the {len(top)} most relevant")
+        for _score, _position, _rank, case, doc in sorted(
+            top, key=lambda entry: entry[:3], reverse=True
+        ):
+            doc_info = [
+                f"\nCase: {case.id} - {display(case.title)}",
+                f"Document ID: {display(doc.id)}",
+                f"Title: {display(doc.title)}",
+                f"Filed: {display(doc.filing_date)}",
+                f"DocketBird URL: {display(doc.docketbird_document_url)}",
+            ]
+            if doc.description:
+                doc_info.append(f"Description: {doc.description}")
+            output.append("\n".join(doc_info))
+
+        if failed:
+            output.append(f"\n=== {len(failed)} cases could not be searched ===")
+            output.extend(failed)
+
+        return "\n".join(output)
+
+    except DocketBirdAPIError as e:
+        return f"Error searching cases: {str(e)}"
+    except Exception as e:
+        return f"An unexpected error occurred while searching: {str(e)}"
+
+
+@mcp.tool()
+@tool_metrics
+async def download_available_files(
+    case_id: str,
+    save_path: str,
+    max_workers: int = DOWNLOAD_WORKERS,
+    ctx: Context = None,
+) -> str:
     """Download all available S3 documents for a specific case.
 
+    Documents are downloaded in parallel, with retries for transient failures
+    and automatic renewal of expired download links. Each finished document
+    is reported as it completes, with progress (count, bytes, ETA).
+
     Args:
         case_id: The DocketBird case ID to download documents from
         save_path: Absolute path where files should be saved. It should be a folder path.
+        max_workers: Maximum number of files to download at the same time
     """
-    try:
-        docs_response = make_request(f"/documents?case_id={case_id}")
+    error = check_case_id(case_id)
+    if error:
+        return f"Error: {error}"
 
-        if not docs_response:
-            return "Failed to retrieve case documents"
+    try:
+        documents = await fetch_case_documents(case_id)
 
-        documents = docs_response.get("data", {}).get("documents", [])
         if not documents:
             return "No documents found for this case"
 
+        progress = ProgressReporter(
+            ctx, total=sum(1 for doc in documents if doc.docketbird_document_url)
+        )
+        downloader = BulkDownloader(client, workers=max_workers, blobs=blobs)
+        summary = await downloader.download_all(
+            documents, save_path, on_result=download_progress(progress)
+        )
+
         # Track download results
         download_results = []
-
-        for doc in documents:
-            try:
-                doc_id = doc.get("id", "N/A")
-                doc_title = doc.get("title", "N/A")
-                s3_url = doc.get("docketbird_document_url")
-
-                if s3_url:
-                    result = download_s3_document(s3_url, save_path)
-                    download_results.append(
-                        f"Document: {doc_title} (ID: {doc_id})\nStatus: {result}\n"
-                    )
-            except Exception as e:
-                download_results.append(
-                    f"Document: {doc_title} (ID: {doc_id})\nStatus: Failed - {str(e)}\n"
-                )
-                continue
+        for item in summary.results:
+            if item.ok:
+                status = f"Successfully downloaded to {item.path}"
+                if item.reused:
+                    status += " (from local store)"
+            else:
+                status = f"Failed after {item.attempts} attempt(s) - {item.error}"
+            download_results.append(
+                f"Document: {item.title} (ID: {item.document_id})\nStatus: {status}\n"
+            )
 
         # Prepare result message
         result = []
         result.append(f"\nDownload Results for Case {case_id}:")
-        result.append(f"Save Location: {save_path}\n")
+        result.append(f"Save Location: {save_path}")
+        result.extend(summary.format_totals())
+        result.append("")
         result.append("=== Individual File Results ===")
         result.extend(
             download_results
@@ -320,13 +756,74 @@ async def download_available_files(case_id: str, save_path: str) -> str:
 
         return "\n".join(result)
 
-    except requests.exceptions.RequestException as e:
+    except DocketBirdAPIError as e:
         return f"Error retrieving case documents: {str(e)}"
     except Exception as e:
         return f"An unexpected error occurred during download: {str(e)}"
 
 
 @mcp.tool()
+@tool_metrics
+async def sync_case_documents(
+    case_id: str,
+    save_path: str,
+    max_workers: int = DOWNLOAD_WORKERS,
+    ctx: Context = None,
+) -> str:
+    """Incrementally mirror a case's documents into a local folder.
+
+    Only documents that are new or changed since the last sync into the same
+    folder are downloaded, and interrupted downloads are resumed. A manifest
+    of what was synced is kept in a .docketbird folder inside save_path.
+
+    Args:
+        case_id: The DocketBird case ID to sync documents from
+        save_path: Absolute path of the folder that mirrors the case
+        max_workers: Maximum number of files to download at the same time
+    """
+    error = check_case_id(case_id)
+    if error:
+        return f"Error: {error}"
+
+    try:
+        documents = await fetch_case_documents(case_id)
+
+        if not documents:
+            return "No documents found for this case"
+
+        sync = CaseSync(client, workers=max_workers, blobs=blobs)
+        result = await sync.sync(
+            case_id,
+            documents,
+            save_path,
+            on_result=download_progress(ProgressReporter(ctx)),
+        )
+
+        output = []
+        output.append(f"\nSync Results for Case {case_id}:")
+        output.append(f"Save Location: {save_path}")
+        output.append(f"New: {len(result.new)}")
+        output.append(f"Updated: {len(result.updated)}")
+        output.append(f"Unchanged: {result.unchanged}")
+        output.extend(result.summary.format_totals())
+
+        if result.summary.failures:
+            output.append("\n=== Failed Files ===")
+            for item in result.summary.failures:
+                output.append(
+                    f"Document: {item.title} (ID: {item.document_id})\nStatus: Failed - {item.error}\n"
+                )
+
+        return "\n".join(output)
+
+    except DocketBirdAPIError as e:
+        return f"Error retrieving case documents: {str(e)}"
+    except Exception as e:
+        return f"An unexpected error occurred during sync: {str(e)}"
+
+
+@mcp.tool()
+@tool_metrics
 async def download_document_by_id(document_id: str, save_path: str) -> str:
     """Download a specific document by its docketbird ID if an S3 link is available.
 
@@ -334,29 +831,379 @@ async def download_document_by_id(document_id: str, save_path: str) -> str:
         document_id: The DocketBird document ID to download
         save_path: Absolute path where the file should be saved. It should be a folder path.
     """
-    # Get document details
-    doc_response = make_request(f"/documents/{document_id}")
+    try:
+        # Get document details
+        document = await make_request(f"/documents/{document_id}", model=Document)
+
+        if not document:
+            return f"Document with ID {document_id} not found"
+
+        doc_title = display(document.title)
+        s3_url = document.docketbird_document_url
+
+        if not s3_url:
+            return f"No downloadable S3 link available for document: {doc_title} (ID: {document_id})"
+
+        # Download the document
+        result = await download_s3_document(s3_url, save_path, document_id=document_id)
+
+        return f"Document: {doc_title} (ID: {document_id})\nStatus: {result}"
+
+    except DocketBirdAPIError as e:
+        return f"Error downloading document: {str(e)}"
+    except Exception as e:
+        return f"An unexpected error occurred during download: {str(e)}"
+
+
+@mcp.tool()
+@tool_metrics
+async def download_documents_by_ids(
+    document_ids: list[str],
+    save_path: str,
+    max_workers: int = DOWNLOAD_WORKERS,
+    ctx: Context = None,
+) -> str:
+    """Download several documents by their DocketBird IDs in one call.
+
+    Document details are looked up and files downloaded in parallel. Every
+    document gets its own status, so one missing or failed document does not
+    fail the batch.
+
+    Args:
+        document_ids: The DocketBird document IDs to download
+        save_path: Absolute path where the files should be saved. It should be a folder path.
+        max_workers: Maximum number of documents fetched at the same time
+    """
+    document_ids = list(dict.fromkeys(document_ids))
+    if not document_ids:
+        return "Error: no document IDs given"
+
+    try:
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def lookup(document_id: str):
+            try:
+                async with semaphore:
+                    document = await make_request(
+                        f"/documents/{document_id}", model=Document
+                    )
+            except DocketBirdAPIError as e:
+                return None, f"Error - {str(e)}"
+            if not document:
+                return None, "Not found"
+            if not document.docketbird_document_url:
+                return document, "No downloadable S3 link available"
+            return document, None
+
+        lookups = await asyncio.gather(*(lookup(i) for i in document_ids))
+
+        pending = [
+            (document_id, document)
+            for document_id, (document, status) in zip(document_ids, lookups)
+            if status is None
+        ]
+        downloader = BulkDownloader(client, workers=max_workers, blobs=blobs)
+        summary = await downloader.download_all(
+            [document for _, document in pending],
+            save_path,
+            on_result=download_progress(ProgressReporter(ctx, total=len(pending))),
+        )
+        downloads = {
+            document_id: item
+            for (document_id, _), item in zip(pending, summary.results)
+        }
+
+        output = ["\nBatch Download Results:", f"Save Location: {save_path}"]
+        output.append(f"Requested: {len(document_ids)} documents")
+        output.extend(summary.format_totals())
+        output.append("")
+        output.append("=== Individual Document Results ===")
+        for document_id, (document, status) in zip(document_ids, lookups):
+            title = display(document.title) if document else "N/A"
+            item = downloads.get(document_id)
+            if item is not None:
+                if item.ok:
+                    status = f"Successfully downloaded to {item.path}"
+                    if item.reused:
+                        status += " (from local store)"
+                else:
+                    status = f"Failed after {item.attempts} attempt(s) - {item.error}"
+            output.append(f"Document: {title} (ID: {document_id})\nStatus: {status}\n")
+
+        return "\n".join(output)
+
+    except Exception as e:
+        return f"An unexpected error occurred during download: {str(e)}"
+
+
+@mcp.tool()
+@tool_metrics
+async def get_cases(
+    case_ids: list[str], max_concurrency: int = CROSS_CASE_CONCURRENCY
+) -> str:
+    """Get the basic details of several cases in one call.
+
+    Cases are fetched in parallel and each one gets its own status, so an
+    invalid or unknown case ID does not fail the batch. Use get_case_details
+    for a single case's parties and documents.
+
+    Args:
+        case_ids: The DocketBird case IDs to look up (see get_case_details for the format)
+        max_concurrency: Maximum number of cases fetched at the same time
+    """
+    case_ids = list(dict.fromkeys(case_ids))
+    if not case_ids:
+        return "Error: no case IDs given"
+
+    try:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def lookup(case_id: str):
+            error = check_case_id(case_id)
+            if error:
+                return None, f"Error - {error}"
+            try:
+                async with semaphore:
+                    case = await make_request(f"/cases/{case_id}", model=Case)
+            except DocketBirdAPIError as e:
+                return None, f"Error - {str(e)}"
+            if case == Case():
+                return None, "Not found"
+            return case, "OK"
+
+        lookups = await asyncio.gather(*(lookup(i) for i in case_ids))
+        found = sum(1 for case, _ in lookups if case is not None)
+
+        output = [f"Retrieved {found} of {len(case_ids)} cases:"]
+        for case_id, (case, status) in zip(case_ids, lookups):
+            output.append(f"\nCase ID: {case_id}")
+            output.append(f"Status: {status}")
+            if case is None:
+                continue
+            output.append(f"Title: {display(case.title)}")
+            output.append(f"Court: {display(case.court_id)}")
+            output.append(f"Case Number: {display(case.case_number)}")
+            output.append(f"Filed: {display(case.date_filed)}")
+            output.append(f"Closed: {display(case.date_closed)}")
+            output.append(f"URL: {display(case.url)}")
+            output.append(f"PACER Case ID: {display(case.pacer_case_id)}")
+            output.append(f"Client Code: {display(case.client_code)}")
+
+        return "\n".join(output)
+
+    except Exception as e:
+        return f"An unexpected error occurred while retrieving cases: {str(e)}"
 
-    if not doc_response:
-        return f"Failed to retrieve document with ID: {document_id}"
 
-    document = doc_response.get("data", {}).get("document", {})
-    if not document:
-        return f"Document with ID {document_id} not found"
+@mcp.tool()
+@tool_metrics
+async def follow_case(case_id: str) -> str:
+    """Follow a case so DocketBird keeps its docket up to date.
 
-    doc_title = document.get("title", "N/A")
-    s3_url = document.get("docketbird_document_url")
+    Federal cases are refreshed by DocketBird twice per weekday and state
+    cases once per weekday. Applicable court fees may apply. Followed cases
+    are also kept warm by this server's background poller when it is enabled.
 
-    if not s3_url:
-        return f"No downloadable S3 link available for document: {doc_title} (ID: {document_id})"
+    Args:
+        case_id: The DocketBird case ID to follow (see get_case_details for the format)
+    """
+    error = check_case_id(case_id)
+    if error:
+        return f"Error: {error}"
 
-    # Download the document
-    result = download_s3_document(s3_url, save_path)
+    try:
+        await client.post_json("/follow_case", {"case_id": case_id})
+        followed_cases.add(case_id)
+        return f"Now following case {case_id}"
 
-    return f"Document: {doc_title} (ID: {document_id})\nStatus: {result}"
+    except DocketBirdAPIError as e:
+        return f"Error following case: {str(e)}"
+    except Exception as e:
+        return f"An unexpected error occurred: {str(e)}"
 
 
 @mcp.tool()
+@tool_metrics
+async def list_followed_cases() -> str:
+    """List the cases followed through this server and their background refresh status."""
+    if not len(followed_cases):
+        return "No followed cases"
+
+    output = [f"=== FOLLOWED CASES ({len(followed_cases)}) ==="]
+    rounds, statuses = poller.shared_status()
+    if poller.enabled:
+        output.append(
+            f"Background refresh every {poller.interval:.0f}s "
+            f"({rounds} rounds completed)"
+        )
+    else:
+        output.append("Background refresh is disabled")
+    for case_id in followed_cases:
+        status = statuses.get(case_id)
+        if status is None or not status.last_refresh:
+            line = f"- {case_id}: not refreshed yet"
+        else:
+            when = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(status.last_refresh)
+            )
+            line = f"- {case_id}: refreshed {when} in {status.duration:.1f}s"
+            if status.error:
+                line += f" (failed: {status.error})"
+        output.append(line)
+    return "\n".join(output)
+
+
+@mcp.tool()
+@tool_metrics
+async def get_calendar_entries(
+    case_id: str, start: str | None = None, end: str | None = None
+) -> str:
+    """Get the AutoCalendar entries (hearings and deadlines) of a case.
+
+    Args:
+        case_id: The DocketBird case ID (see get_case_details for the format)
+        start: Only include entries on or after this date (YYYY-MM-DD)
+        end: Only include entries on or before this date (YYYY-MM-DD)
+    """
+    error = check_case_id(case_id)
+    if error:
+        return f"Error: {error}"
+    try:
+        start = parse_date(start, "start")
+        end = parse_date(end, "end")
+    except ValueError as e:
+        return f"Error: {str(e)}"
+
+    try:
+        calendar = await get_case_calendar(case_id)
+        if not calendar.available:
+            return (
+                f"No AutoCalendar exists for case {case_id}. "
+                "Use create_autocalendar to create one."
+            )
+
+        entries = calendar.between(start, end)
+        if not entries:
+            return f"No calendar entries found for case {case_id} in that range"
+
+        output = [f"=== CALENDAR FOR {case_id} ({len(entries)} entries) ==="]
+        output.extend(format_calendar_entry(entry) for entry in entries)
+        return "\n".join(output)
+
+    except DocketBirdAPIError as e:
+        return f"Error retrieving calendar entries: {str(e)}"
+    except Exception as e:
+        return f"An unexpected error occurred: {str(e)}"
+
+
+@mcp.tool()
+@tool_metrics
+async def create_autocalendar(case_id: str) -> str:
+    """Queue the creation of an AutoCalendar for a case.
+
+    DocketBird updates the case's docket sheet first, so the calendar may
+    take a while to appear. Court fees may apply.
+
+    Args:
+        case_id: The DocketBird case ID (see get_case_details for the format)
+    """
+    error = check_case_id(case_id)
+    if error:
+        return f"Error: {error}"
+
+    try:
+        await client.post_json("/create_autocalendar", {"case_id": case_id})
+        # Make the next lookup ask the API again
+        calendars.invalidate(case_id)
+        await client.invalidate("/calendar_entries", {"case_id": case_id})
+        return f"AutoCalendar creation queued for case {case_id}"
+
+    except DocketBirdAPIError as e:
+        return f"Error creating AutoCalendar: {str(e)}"
+    except Exception as e:
+        return f"An unexpected error occurred: {str(e)}"
+
+
+@mcp.tool()
+@tool_metrics
+async def get_upcoming_deadlines(
+    days: int = 14,
+    start: str | None = None,
+    scope: str = "company",
+    max_concurrency: int = CROSS_CASE_CONCURRENCY,
+) -> str:
+    """Get calendar entries across all cases of an account within a date range.
+
+    Calendars are cached per case and only re-fetched when stale, so this is
+    mostly answered from local data.
+
+    Args:
+        days: Number of days to cover, starting with the start date
+        start: First day of the range (YYYY-MM-DD); defaults to today
+        scope: Either "company" or "user" to specify whose cases to include
+        max_concurrency: Maximum number of calendars fetched at the same time
+    """
+    if scope not in ["company", "user"]:
+        return "Error: scope must be either 'company' or 'user'"
+    if days < 1:
+        return "Error: days must be at least 1"
+    try:
+        start = parse_date(start, "start")
+        first = date.fromisoformat(start) if start else date.today()
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    last = first + timedelta(days=days - 1)
+
+    try:
+        response = await make_request("/cases", {"scope": scope}, model=CaseList)
+        cases = [case for case in response.cases if case.id]
+        if not cases:
+            return f"No cases found for {scope} scope"
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        failed = []
+
+        async def load(case) -> CaseCalendar | None:
+            try:
+                async with semaphore:
+                    return await get_case_calendar(case.id)
+            except DocketBirdAPIError as e:
+                failed.append(f"- {case.id}: {str(e)}")
+                return None
+
+        loaded = await asyncio.gather(*(load(case) for case in cases))
+        entries = list(
+            merge_ranges(
+                [calendar for calendar in loaded if calendar is not None],
+                first.isoformat(),
+                last.isoformat(),
+            )
+        )
+
+        titles = {case.id: case.title for case in cases}
+        output = [
+            f"=== {len(entries)} CALENDAR ENTRIES FROM {first} TO {last} "
+            f"({len(cases)} cases) ==="
+        ]
+        for entry in entries:
+            line = format_calendar_entry(entry)
+            if entry.case_id:
+                title = display(titles.get(entry.case_id))
+                line += f"\n  Case: {entry.case_id} - {title}"
+            output.append(line)
+        if failed:
+            output.append(f"\n=== {len(failed)} calendars could not be loaded ===")
+            output.extend(failed)
+        return "\n".join(output)
+
+    except DocketBirdAPIError as e:
+        return f"Error retrieving deadlines: {str(e)}"
+    except Exception as e:
+        return f"An unexpected error occurred: {str(e)}"
+
+
+@mcp.tool()
+@tool_metrics
 async def list_cases(scope: str) -> str:
     """Get a list of cases belonging to an account.
 
@@ -369,12 +1216,9 @@ async def list_cases(scope: str) -> str:
             return "Error: scope must be either 'company' or 'user'"
 
         # Make request to /cases endpoint with scope parameter
-        response = make_request(f"/cases?scope={scope}")
-
-        if not response:
-            return "Failed to retrieve cases"
+        response = await make_request("/cases", {"scope": scope}, model=CaseList)
 
-        cases = response.get("data", {}).get("cases", [])
+        cases = response.cases
         if not cases:
             return f"No cases found for {scope} scope"
 
@@ -383,22 +1227,23 @@ async def list_cases(scope: str) -> str:
         output.append(f"\n=== {scope.upper()} CASES ===\n")
 
         for case in cases:
-            output.append(f"ID: {case.get('id', 'N/A')}")
-            output.append(f"Title: {case.get('title', 'N/A')}")
-            output.append(f"Court: {case.get('court_id', 'N/A')}")
-            output.append(f"Case Number: {case.get('case_number', 'N/A')}")
-            output.append(f"Date Filed: {case.get('date_filed', 'N/A')}")
+            output.append(f"ID: {display(case.id)}")
+            output.append(f"Title: {display(case.title)}")
+            output.append(f"Court: {display(case.court_id)}")
+            output.append(f"Case Number: {display(case.case_number)}")
+            output.append(f"Date Filed: {display(case.date_filed)}")
             output.append("")  # Empty line between cases
 
         return "\n".join(output)
 
-    except requests.exceptions.RequestException as e:
+    except DocketBirdAPIError as e:
         return f"Error retrieving cases list: {str(e)}"
     except Exception as e:
         return f"An unexpected error occurred while listing cases: {str(e)}"
 
 
 @mcp.tool()
+@tool_metrics
 async def list_courts_and_types() -> str:
     """Get a comprehensive list of all available courts and case types.
 
@@ -426,81 +1271,8 @@ async def list_courts_and_types() -> str:
     """
 
     try:
-        # Read courts from courts.json using relative path
-        courts_path = SCRIPT_DIR / "courts.json"
-        case_types_path = SCRIPT_DIR / "case_types.json"
-
-        with open(courts_path, "r") as f:
-            courts_data = json.load(f)
-
-        # Read case types from case_types.json
-        with open(case_types_path, "r") as f:
-            case_types_data = json.load(f)
-
-        # Initialize court type categories
-        circuit_courts = []
-        district_courts = []
-        bankruptcy_courts = []
-        state_courts = []
-        other_courts = []
-
-        # Categorize courts
-        for court in courts_data["courts"]:
-            name = court["court_name"]
-            code = court["value"]
-            entry = f"- {code}: {name}"
-
-            if "Circuit Court" in name or "Circuit" in name and "District" not in name:
-                circuit_courts.append(entry)
-            elif "Bankruptcy" in name:
-                bankruptcy_courts.append(entry)
-            elif "District" in name and "Bankruptcy" not in name:
-                district_courts.append(entry)
-            elif any(
-                state in name
-                for state in ["Superior Court", "Supreme Court", "County Court"]
-            ):
-                state_courts.append(entry)
-            else:
-                other_courts.append(entry)
-
-        # Build output
-        output = []
-        output.append("=== COURTS ===\n")
-
-        if circuit_courts:
-            output.append("Circuit Courts:")
-            output.extend(sorted(circuit_courts))
-            output.append("")
-
-        if district_courts:
-            output.append("District Courts:")
-            output.extend(sorted(district_courts))
-            output.append("")
-
-        if bankruptcy_courts:
-            output.append("Bankruptcy Courts:")
-            output.extend(sorted(bankruptcy_courts))
-            output.append("")
-
-        if state_courts:
-            output.append("State Courts:")
-            output.extend(sorted(state_courts))
-            output.append("")
-
-        if other_courts:
-            output.append("Other Courts:")
-            output.extend(sorted(other_courts))
-            output.append("")
-
-        # Add case types from case_types.json
-        output.append("=== CASE TYPES ===")
-        for case_type in case_types_data["case_types"]:
-            output.append(f"- {case_type['abbreviature']}: {case_type['name']}")
-            output.append(f"  Example: {case_type['example']}")
-            output.append("")
-
-        return "\n".join(output)
+        # Loaded once and rebuilt only when courts.json or case_types.json change
+        return catalog_loader.get().rendered
 
     except FileNotFoundError as e:
         if "courts.json" in str(e):
@@ -514,54 +1286,58 @@ async def list_courts_and_types() -> str:
         return f"Error: {str(e)}"
 
 
-def download_s3_document(url: str, save_location: str) -> str:
+@instrument(OPERATION_SECONDS, OPERATION_IN_FLIGHT)
+async def download_s3_document(
+    url: str, save_location: str, document_id: str | None = None
+) -> str:
     """Download a document from S3 using a pre-signed URL.
 
+    A document already in the blob store is placed from disk instead.
+
     Args:
         url: Pre-signed S3 URL for the document
         save_location: Directory path where the file should be saved (absolute path)
+        document_id: The DocketBird document ID, if known, for the blob store index
 
     Returns:
         str: Success message or error description
     """
     try:
-        response = requests.get(url, stream=True)
-        if response.status_code == 200:
-            # Extract filename from S3 URL
-            filename = url.split("/")[-1].split("?")[0]
-            # Convert to absolute path if not already
-            import os
-
-            save_location = os.path.abspath(os.path.expanduser(save_location))
-            full_path = os.path.join(save_location, filename)
-
-            # Create directory if it doesn't exist
-            os.makedirs(save_location, exist_ok=True)
-
-            with open(full_path, "wb") as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
-            return f"Successfully downloaded to {full_path}"
-        else:
-            return f"HTTP Error {response.status_code}: Failed to download file"
+        fetched = await fetch_to_file(
+            client, url, save_location, blobs=blobs, document_id=document_id
+        )
+        if fetched.reused:
+            return f"Successfully downloaded to {fetched.path} (from local store)"
+        return f"Successfully downloaded to {fetched.path}"
+    except DownloadError as e:
+        return str(e)
     except Exception as e:
         return f"Error downloading file: {str(e)}"
 
 
-# Define the SSE handler
-async def handle_sse(scope, receive, send):
-    async with sse.connect_sse(scope, receive, send) as streams:
-        await mcp.run(streams[0], streams[1], mcp.create_initialization_options())
+def create_starlette_app(
+    mcp_server: Server, *, debug: bool = False, broker: "SessionBroker | None" = None
+) -> "Starlette":
+    """Create a Starlette application that can server the provied mcp server with SSE.
 
+    With a ``broker`` that has a worker ID, clients are told to post their
+    messages to ``/messages/{worker_id}/`` and messages for sessions owned by
+    another worker process are forwarded to it.
+    """
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
 
-# Define the message handler
-async def handle_messages(scope, receive, send):
-    await sse.handle_post_message(scope, receive, send)
-
+    from docketbird_sessions import LocalBroker, SessionRouter
 
-def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
-    """Create a Starlette application that can server the provied mcp server with SSE."""
-    sse = SseServerTransport("/messages/")
+    broker = broker or LocalBroker()
+    if broker.worker_id is None:
+        sse = SseServerTransport("/messages/")
+    else:
+        sse = SseServerTransport(f"/messages/{broker.worker_id}/")
+    router = SessionRouter(sse, broker)
 
     async def handle_sse(request: Request) -> None:
         async with sse.connect_sse(
@@ -575,15 +1351,45 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
                 mcp_server.create_initialization_options(),
             )
 
+    async def handle_metrics(request: Request) -> Response:
+        return Response(
+            render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        # Keep followed cases warm (only if DOCKETBIRD_POLL_INTERVAL is set)
+        poller.start()
+        await broker.start(router.deliver)
+        yield
+        await broker.stop()
+        await poller.stop()
+        # Release pooled connections when the server shuts down
+        await client.aclose()
+
     return Starlette(
         debug=debug,
+        lifespan=lifespan,
         routes=[
             Route("/sse", endpoint=handle_sse),
+            Route("/metrics", endpoint=handle_metrics),
+            Route("/messages/{worker_id}/", endpoint=router, methods=["POST"]),
             Mount("/messages/", app=sse.handle_post_message),
         ],
     )
 
 
+def create_app() -> "Starlette":
+    """Build the SSE app configured from the environment.
+
+    Used as a uvicorn factory by every worker process when the server runs
+    with several workers (``--workers`` or ``uvicorn --factory``).
+    """
+    from docketbird_sessions import broker_from_env
+
+    return create_starlette_app(mcp._mcp_server, broker=broker_from_env())
+
+
 if __name__ == "__main__":
     # Parse command-line arguments
     parser = argparse.ArgumentParser(
@@ -597,22 +1403,36 @@ if __name__ == "__main__":
     )
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="SSE worker processes; sessions are shared through Unix sockets",
+    )
     args = parser.parse_args()
 
     # Check for required environment variables
     if not os.getenv("DOCKETBIRD_API_KEY"):
-        print("Error: DOCKETBIRD_API_KEY environment variable is required")
-        print("Please set it using: export DOCKETBIRD_API_KEY=your_api_key")
+        print("Error: DOCKETBIRD_API_KEY environment variable is required", file=sys.stderr)
+        print(
+            "Please set it using: export DOCKETBIRD_API_KEY=your_api_key",
+            file=sys.stderr,
+        )
         exit(1)
 
     # Run the server based on the chosen transport
     if args.transport == "stdio":
-        print(
-            colored("Starting DocketBird MCP server with stdio transport...", "green")
-        )
-        print(colored("Server is running! Waiting for client connections...", "green"))
+        # stdout carries the protocol, so say hello on stderr
+        print("Starting DocketBird MCP server with stdio transport...", file=sys.stderr)
         mcp.run(transport="stdio")
     elif args.transport == "sse":
+        import tempfile
+
+        import uvicorn
+        from termcolor import colored
+
+        from docketbird_sessions import broker_from_env
+
         # Bind SSE request handling to MCP server
         print(
             colored(
@@ -620,5 +1440,21 @@ if __name__ == "__main__":
                 "green",
             )
         )
-        starlette_app = create_starlette_app(mcp._mcp_server, debug=True)
-        uvicorn.run(starlette_app, host=args.host, port=args.port)
+        if args.workers > 1:
+            # Workers find each other through sockets in a shared directory
+            os.environ.setdefault("DOCKETBIRD_SESSION_BROKER", "unix")
+            os.environ.setdefault(
+                "DOCKETBIRD_SESSION_DIR", tempfile.mkdtemp(prefix="docketbird-sessions-")
+            )
+            uvicorn.run(
+                "docketbird_mcp:create_app",
+                factory=True,
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+            )
+        else:
+            starlette_app = create_starlette_app(
+                mcp._mcp_server, debug=True, broker=broker_from_env()
+            )
+            uvicorn.run(starlette_app, host=args.host, port=args.port)
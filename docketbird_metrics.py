@@ -0,0 +1,369 @@
+"""Prometheus metrics for tool calls, upstream requests and caches.
+
+Metrics are plain in-process counters rendered in the Prometheus text
+format on demand, so recording one costs a dict lookup and an addition and
+nothing happens between scrapes. With ``DOCKETBIRD_TIMING_LOG`` set, every
+tool call also logs where its time went (API, S3, JSON decoding and the
+rest, which is mostly formatting).
+"""
+
+import bisect
+import contextvars
+import functools
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+# Seconds; covers cached answers (sub-millisecond) to slow bulk downloads
+DEFAULT_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+# Tools report failures as text instead of raising
+ERROR_PREFIXES = ("Error", "An unexpected error", "Failed")
+
+logger = logging.getLogger("docketbird.timing")
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, object] = {}
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for values, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, values)} {_number(value)}")
+        return lines
+
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    TYPE = "gauge"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+    def set(self, *labels, value: float) -> None:
+        self._values[labels] = value
+
+
+class Histogram(Metric):
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels) -> None:
+        series = self._values.get(labels)
+        if series is None:
+            # Per-bucket counts (plus +Inf), then sum and count
+            series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        bounds = (*self.buckets, float("inf"))
+        for values, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                le = f'le="{_number(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.labelnames, values, le)} {cumulative}"
+                )
+            labels = _labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """A set of metrics plus callbacks that refresh gauges before a scrape."""
+
+    def __init__(self):
+        self._metrics: list[Metric] = []
+        self._collectors = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+TOOL_SECONDS = REGISTRY.register(
+    Histogram(
+        "docketbird_tool_duration_seconds",
+        "Time spent in MCP tool calls.",
+        ("tool", "outcome"),
+    )
+)
+TOOL_IN_FLIGHT = REGISTRY.register(
+    Gauge("docketbird_tool_in_flight", "MCP tool calls in progress.", ("tool",))
+)
+OPERATION_SECONDS = REGISTRY.register(
+    Histogram(
+        "docketbird_operation_duration_seconds",
+        "Time spent in API helpers (make_request, download_s3_document), "
+        "including cache lookups.",
+        ("operation", "outcome"),
+    )
+)
+OPERATION_IN_FLIGHT = REGISTRY.register(
+    Gauge(
+        "docketbird_operation_in_flight",
+        "API helper calls in progress.",
+        ("operation",),
+    )
+)
+UPSTREAM_SECONDS = REGISTRY.register(
+    Histogram(
+        "docketbird_upstream_request_duration_seconds",
+        "Time of each HTTP request to DocketBird or S3, until the body is consumed.",
+        ("target", "route", "status"),
+    )
+)
+UPSTREAM_IN_FLIGHT = REGISTRY.register(
+    Gauge(
+        "docketbird_upstream_in_flight",
+        "HTTP requests to DocketBird or S3 in progress.",
+        ("target",),
+    )
+)
+UPSTREAM_BYTES = REGISTRY.register(
+    Counter(
+        "docketbird_upstream_bytes_total",
+        "Response bytes received from DocketBird or S3.",
+        ("target",),
+    )
+)
+UPSTREAM_ERRORS = REGISTRY.register(
+    Counter(
+        "docketbird_upstream_errors_total",
+        "Failed HTTP requests by status code, or by exception for transport errors.",
+        ("target", "route", "status"),
+    )
+)
+DECODE_SECONDS = REGISTRY.register(
+    Histogram(
+        "docketbird_decode_duration_seconds",
+        "Time spent decoding and parsing API responses.",
+        ("route",),
+    )
+)
+CACHE_LOOKUPS = REGISTRY.register(
+    Counter(
+        "docketbird_cache_lookups_total",
+        "Cache lookups by layer and result. The revalidation layer counts "
+        "conditional requests, where a 304 Not Modified is a hit; the blobs layer "
+        "counts documents placed from the local store instead of downloaded.",
+        ("layer", "result"),
+    )
+)
+CACHE_HIT_RATIO = REGISTRY.register(
+    Gauge(
+        "docketbird_cache_hit_ratio",
+        "Share of lookups answered by each cache layer.",
+        ("layer",),
+    )
+)
+
+
+def route_label(path: str) -> str:
+    """Collapse IDs in an API path, e.g. ``/documents/abc`` -> ``/documents/{id}``."""
+    parts = path.strip("/").split("/", 1)
+    return f"/{parts[0]}/{{id}}" if len(parts) > 1 else f"/{parts[0]}"
+
+
+def update_cache_ratios() -> None:
+    totals: dict[str, list[float]] = {}
+    for (layer, result), count in CACHE_LOOKUPS._values.items():
+        hits, lookups = totals.setdefault(layer, [0, 0])
+        totals[layer] = [hits + (count if result == "hit" else 0), lookups + count]
+    for layer, (hits, lookups) in totals.items():
+        CACHE_HIT_RATIO.set(layer, value=hits / lookups if lookups else 0.0)
+
+
+REGISTRY.add_collector(update_cache_ratios)
+
+
+# Per-call timing breakdown, only collected when DOCKETBIRD_TIMING_LOG is set
+TIMING_LOG = os.getenv("DOCKETBIRD_TIMING_LOG", "").lower() in ("1", "true", "yes")
+_timings: contextvars.ContextVar[dict | None] = contextvars.ContextVar(
+    "docketbird_timings", default=None
+)
+
+
+def add_timing(phase: str, seconds: float) -> None:
+    """Charge ``seconds`` of ``phase`` (api, s3, decode) to the current tool call."""
+    timings = _timings.get()
+    if timings is not None:
+        total, calls = timings.get(phase, (0.0, 0))
+        timings[phase] = (total + seconds, calls + 1)
+
+
+def _log_timings(tool: str, elapsed: float, timings: dict) -> None:
+    parts = [f"tool={tool}", f"total={elapsed * 1000:.1f}ms"]
+    spent = 0.0
+    for phase, (seconds, calls) in sorted(timings.items()):
+        spent += seconds
+        parts.append(f"{phase}={seconds * 1000:.1f}ms/{calls}")
+    # Concurrent requests overlap, so the phases can add up to more than total
+    parts.append(f"other={max(0.0, elapsed - spent) * 1000:.1f}ms")
+    logger.info(" ".join(parts))
+
+
+def _outcome(result) -> str:
+    if isinstance(result, str) and result.startswith(ERROR_PREFIXES):
+        return "error"
+    return "ok"
+
+
+def instrument(
+    histogram: Histogram,
+    in_flight: Gauge,
+    name: str | None = None,
+    *,
+    breakdown: bool = False,
+):
+    """Decorate an async function to record its duration, outcome and concurrency.
+
+    With ``breakdown`` the call also collects and logs its timing breakdown
+    when ``DOCKETBIRD_TIMING_LOG`` is set. ``functools.wraps`` keeps the
+    signature, so FastMCP still sees the original parameters.
+    """
+
+    def decorator(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            token = _timings.set({}) if breakdown and TIMING_LOG else None
+            in_flight.inc(label)
+            start = time.perf_counter()
+            outcome = "exception"
+            try:
+                result = await fn(*args, **kwargs)
+                outcome = _outcome(result)
+                return result
+            finally:
+                elapsed = time.perf_counter() - start
+                in_flight.dec(label)
+                histogram.observe(elapsed, label, outcome)
+                if token is not None:
+                    _log_timings(label, elapsed, _timings.get())
+                    _timings.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+# Decorator for every @mcp.tool()
+tool_metrics = instrument(TOOL_SECONDS, TOOL_IN_FLIGHT, breakdown=True)
+
+
+@contextmanager
+def track_upstream(target: str, route: str):
+    """Time one HTTP request to ``target`` (``api`` or ``s3``).
+
+    Yields a dict the caller stores the response in under ``"response"``;
+    the request is timed until the block exits, i.e. until its body has
+    been consumed.
+    """
+    UPSTREAM_IN_FLIGHT.inc(target)
+    start = time.perf_counter()
+    tracked = {}
+    try:
+        yield tracked
+    except BaseException as e:
+        tracked.setdefault("error", type(e).__name__)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        UPSTREAM_IN_FLIGHT.dec(target)
+        response = tracked.get("response")
+        if response is not None:
+            status = str(response.status_code)
+            UPSTREAM_BYTES.inc(target, amount=response.num_bytes_downloaded)
+            failed = response.status_code >= 400
+        else:
+            status = tracked.get("error", "exception")
+            failed = status != "CancelledError"
+        UPSTREAM_SECONDS.observe(elapsed, target, route, status)
+        if failed:
+            UPSTREAM_ERRORS.inc(target, route, status)
+        add_timing(target, elapsed)
+
+
+@contextmanager
+def track_decode(route: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        DECODE_SECONDS.observe(elapsed, route)
+        add_timing("decode", elapsed)
+
+
+def render() -> str:
+    return REGISTRY.render()
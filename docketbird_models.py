@@ -0,0 +1,227 @@
+"""Compact models for DocketBird API objects.
+
+Responses are parsed into these once, right after decoding, and the models
+(not the raw JSON) are what gets cached and shared between tools. Every model
+uses ``__slots__`` and repeated short strings such as court ids are interned,
+which keeps large cached dockets small.
+"""
+
+import sys
+from dataclasses import dataclass
+
+
+def _str(value) -> str | None:
+    return None if value is None else str(value)
+
+
+def _code(value) -> str | None:
+    """Intern short identifiers that repeat across thousands of objects."""
+    return None if value is None else sys.intern(str(value))
+
+
+def _int(value) -> int | None:
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bool(value) -> bool | None:
+    return None if value is None else bool(value)
+
+
+def display(value) -> str:
+    """Render an optional field the way the tools print missing values."""
+    return "N/A" if value is None else str(value)
+
+
+@dataclass(slots=True)
+class Case:
+    id: str | None = None
+    title: str | None = None
+    court_id: str | None = None
+    case_number: str | None = None
+    date_filed: str | None = None
+    date_closed: str | None = None
+    url: str | None = None
+    pacer_case_id: str | None = None
+    client_code: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Case":
+        return cls(
+            id=_str(data.get("id")),
+            title=_str(data.get("title")),
+            court_id=_code(data.get("court_id")),
+            case_number=_str(data.get("case_number")),
+            date_filed=_str(data.get("date_filed")),
+            date_closed=_str(data.get("date_closed")),
+            url=_str(data.get("url")),
+            pacer_case_id=_str(data.get("pacer_case_id")),
+            client_code=_str(data.get("client_code")),
+        )
+
+    @classmethod
+    def from_response(cls, response: dict) -> "Case":
+        """Parse a ``/cases/{case_id}`` response."""
+        return cls.from_dict((response.get("data") or {}).get("case") or {})
+
+
+@dataclass(slots=True)
+class Party:
+    name: str | None = None
+    type: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Party":
+        return cls(name=_str(data.get("name")), type=_code(data.get("type")))
+
+
+@dataclass(slots=True)
+class Document:
+    id: str | None = None
+    title: str | None = None
+    filing_date: str | None = None
+    restricted: bool | None = None
+    primary_docket_sheet_number: int | None = None
+    pacer_document_url: str | None = None
+    downloaded: int | None = None
+    docketbird_document_url: str | None = None
+    custom_filename: str | None = None
+    description: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Document":
+        return cls(
+            id=_str(data.get("id")),
+            title=_str(data.get("title")),
+            # The list schema calls it date_filed, the document schema filing_date
+            filing_date=_code(data.get("filing_date") or data.get("date_filed")),
+            restricted=_bool(data.get("restricted")),
+            primary_docket_sheet_number=_int(data.get("primary_docket_sheet_number")),
+            pacer_document_url=_str(data.get("pacer_document_url")),
+            downloaded=_int(data.get("downloaded")),
+            docketbird_document_url=_str(data.get("docketbird_document_url")),
+            custom_filename=_str(data.get("custom_filename")),
+            description=_str(data.get("description")),
+        )
+
+    @classmethod
+    def from_response(cls, response: dict) -> "Document | None":
+        """Parse a ``/documents/{document_id}`` response."""
+        document = (response.get("data") or {}).get("document")
+        return cls.from_dict(document) if document else None
+
+
+@dataclass(slots=True)
+class DocketPage:
+    """One page of a ``/documents?case_id=...`` response."""
+
+    case: Case | None = None
+    parties: tuple[Party, ...] = ()
+    documents: tuple[Document, ...] = ()
+    has_more: bool = False
+
+    # Where each part lives in the raw JSON, and how to parse it. Used to
+    # build pages incrementally from a streamed response.
+    ITEMS = {
+        "data.case": Case.from_dict,
+        "data.parties.item": Party.from_dict,
+        "data.documents.item": Document.from_dict,
+        "has_more": bool,
+    }
+
+    @classmethod
+    def from_response(cls, response: dict) -> "DocketPage":
+        data = response.get("data") or {}
+        case = data.get("case")
+        return cls(
+            case=Case.from_dict(case) if case else None,
+            parties=tuple(Party.from_dict(p) for p in data.get("parties") or ()),
+            documents=tuple(
+                Document.from_dict(d) for d in data.get("documents") or ()
+            ),
+            has_more=bool(response.get("has_more")),
+        )
+
+    @classmethod
+    def from_items(cls, items) -> "DocketPage":
+        """Assemble a page from the ``(prefix, model)`` pairs of a stream."""
+        page = cls()
+        parties, documents = [], []
+        for prefix, item in items:
+            if prefix == "data.case":
+                page.case = item
+            elif prefix == "data.parties.item":
+                parties.append(item)
+            elif prefix == "data.documents.item":
+                documents.append(item)
+            elif prefix == "has_more":
+                page.has_more = item
+        page.parties, page.documents = tuple(parties), tuple(documents)
+        return page
+
+    def iter_items(self):
+        """Yield ``(prefix, model)`` pairs in the same shape as a stream."""
+        if self.case is not None:
+            yield "data.case", self.case
+        for party in self.parties:
+            yield "data.parties.item", party
+        for document in self.documents:
+            yield "data.documents.item", document
+        yield "has_more", self.has_more
+
+
+@dataclass(slots=True)
+class CaseList:
+    """A ``/cases?scope=...`` response."""
+
+    cases: tuple[Case, ...] = ()
+
+    @classmethod
+    def from_response(cls, response: dict) -> "CaseList":
+        data = response.get("data") or {}
+        return cls(cases=tuple(Case.from_dict(c) for c in data.get("cases") or ()))
+
+
+@dataclass(slots=True)
+class CalendarEntry:
+    id: int | None = None
+    uuid: str | None = None
+    case_id: str | None = None
+    document_id: str | None = None
+    # An ISO 8601 date, or date and time with the court's UTC offset
+    iso8601_datetime: str | None = None
+    title: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CalendarEntry":
+        return cls(
+            id=_int(data.get("id")),
+            uuid=_str(data.get("uuid")),
+            case_id=_code(data.get("case_id")),
+            document_id=_str(data.get("document_id")),
+            iso8601_datetime=_str(data.get("iso8601_datetime")),
+            title=_str(data.get("title")),
+        )
+
+    @property
+    def date(self) -> str:
+        """The (court-local) ``YYYY-MM-DD`` day of the entry."""
+        return (self.iso8601_datetime or "")[:10]
+
+
+@dataclass(slots=True)
+class CalendarEntries:
+    """A ``/calendar_entries?case_id=...`` response."""
+
+    entries: tuple[CalendarEntry, ...] = ()
+
+    @classmethod
+    def from_response(cls, response: dict) -> "CalendarEntries":
+        data = response.get("data") or {}
+        return cls(
+            entries=tuple(
+                CalendarEntry.from_dict(e) for e in data.get("calendar_entries") or ()
+            )
+        )
@@ -0,0 +1,282 @@
+"""Background refresh of followed cases.
+
+DocketBird re-checks followed cases with the courts during the day. The
+poller re-reads them on a schedule so that caches, search indexes and local
+mirrors are already warm when an agent asks about one of them.
+
+With several worker processes only one of them polls: the one holding an
+exclusive lock on ``poller.lock`` in the shared session directory. It also
+publishes the refresh status there for the other workers to report.
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass
+
+try:
+    import fcntl
+except ImportError:  # Windows: no locking, every process polls
+    fcntl = None
+
+# Seconds between attempts of a standby worker to take over polling
+LEADER_RETRY = 30.0
+
+
+@dataclass
+class PollStatus:
+    last_refresh: float = 0.0
+    duration: float = 0.0
+    error: str | None = None
+
+
+class FollowedCases:
+    """The set of followed case IDs, persisted as a JSON list in ``path``.
+
+    The API has no endpoint listing followed cases, so the server keeps its
+    own record of the cases it followed, plus any given in ``seed``. The file
+    is re-read whenever its mtime changes, so cases followed through another
+    worker process are picked up.
+    """
+
+    def __init__(self, path: str | None, seed=()):
+        self.path = path
+        self._seed = [case_id for case_id in seed if case_id]
+        self._cases: dict[str, None] = {}
+        self._mtime: int | None = None
+        self._reload()
+
+    @classmethod
+    def from_env(cls) -> "FollowedCases":
+        path = os.getenv(
+            "DOCKETBIRD_FOLLOWED_FILE",
+            os.path.join(os.path.expanduser("~"), ".docketbird", "followed.json"),
+        )
+        seed = os.getenv("DOCKETBIRD_FOLLOWED_CASES", "").split(",")
+        return cls(path or None, seed=[case_id.strip() for case_id in seed])
+
+    def __iter__(self):
+        self._reload()
+        return iter(list(self._cases))
+
+    def __len__(self) -> int:
+        self._reload()
+        return len(self._cases)
+
+    def __contains__(self, case_id: str) -> bool:
+        self._reload()
+        return case_id in self._cases
+
+    def add(self, case_id: str) -> None:
+        # Merge with cases another process may have added meanwhile
+        self._reload()
+        if case_id not in self._cases:
+            self._cases[case_id] = None
+            self._save()
+
+    def _file_mtime(self) -> int | None:
+        try:
+            return os.stat(self.path).st_mtime_ns if self.path else None
+        except OSError:
+            return None
+
+    def _reload(self) -> None:
+        mtime = self._file_mtime()
+        if mtime == self._mtime and self._cases:
+            return
+        cases = dict.fromkeys(self._seed)
+        cases.update(dict.fromkeys(self._load()))
+        # Keep cases not written yet (an unwritable file) as well
+        cases.update(self._cases)
+        self._cases = cases
+        self._mtime = mtime
+
+    def _load(self) -> list[str]:
+        if not self.path:
+            return []
+        try:
+            with open(self.path, "r") as f:
+                return [str(case_id) for case_id in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return []
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(list(self._cases), f)
+            os.replace(tmp_path, self.path)
+            self._mtime = self._file_mtime()
+        except OSError:
+            pass
+
+
+class CasePoller:
+    """Periodically run ``refresh(case_id)`` for every followed case.
+
+    A round starts every ``interval`` seconds (± ``jitter`` as a fraction),
+    and each case's refresh is delayed by a random part of the jitter window
+    so that several server processes do not hit the API in lockstep. At most
+    ``concurrency`` cases are refreshed at once.
+
+    With a ``lock_dir`` shared by several workers, only the worker holding
+    its lock polls; the others retry every ``LEADER_RETRY`` seconds and take
+    over if that worker exits.
+    """
+
+    def __init__(
+        self,
+        cases: FollowedCases,
+        refresh,
+        interval: float = 1800.0,
+        concurrency: int = 4,
+        jitter: float = 0.1,
+        lock_dir: str | None = None,
+    ):
+        self.cases = cases
+        self.refresh = refresh
+        self.interval = interval
+        self.concurrency = max(1, concurrency)
+        self.jitter = jitter
+        self.status: dict[str, PollStatus] = {}
+        self.rounds = 0
+        self.lock_dir = lock_dir
+        self._lock_file = None
+        self._leading = False
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_env(cls, cases: FollowedCases, refresh) -> "CasePoller":
+        return cls(
+            cases,
+            refresh,
+            interval=float(os.getenv("DOCKETBIRD_POLL_INTERVAL", "0")),
+            concurrency=int(os.getenv("DOCKETBIRD_POLL_CONCURRENCY", "4")),
+            jitter=float(os.getenv("DOCKETBIRD_POLL_JITTER", "0.1")),
+            # Set for the workers started by --workers
+            lock_dir=os.getenv("DOCKETBIRD_SESSION_DIR") or None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def leading(self) -> bool:
+        """True if this process is the one refreshing followed cases."""
+        return self.running and self._leading
+
+    def _acquire(self) -> bool:
+        if self.lock_dir is None or fcntl is None or self._lock_file is not None:
+            self._leading = True
+            return True
+        try:
+            os.makedirs(self.lock_dir, exist_ok=True)
+            lock_file = open(os.path.join(self.lock_dir, "poller.lock"), "a")
+        except OSError:
+            return False
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        # Held until stop() or until the process exits
+        self._lock_file = lock_file
+        self._leading = True
+        return True
+
+    def _release(self) -> None:
+        self._leading = False
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _status_path(self) -> str | None:
+        if self.lock_dir is None:
+            return None
+        return os.path.join(self.lock_dir, "poller-status.json")
+
+    def _publish_status(self) -> None:
+        path = self._status_path()
+        if path is None:
+            return
+        data = {
+            "rounds": self.rounds,
+            "status": {case_id: asdict(s) for case_id, s in self.status.items()},
+        }
+        try:
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def shared_status(self) -> tuple[int, dict[str, PollStatus]]:
+        """Rounds and per-case status, as published by the polling worker."""
+        path = self._status_path()
+        if path is None or self.leading:
+            return self.rounds, self.status
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            status = {
+                case_id: PollStatus(**values)
+                for case_id, values in data.get("status", {}).items()
+            }
+            return int(data.get("rounds", 0)), status
+        except (OSError, ValueError, TypeError, AttributeError):
+            return self.rounds, self.status
+
+    def start(self) -> None:
+        if self.enabled and not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._release()
+
+    async def _run(self) -> None:
+        while not self._acquire():
+            await asyncio.sleep(min(self.interval, LEADER_RETRY))
+        while True:
+            await self.poll_once()
+            spread = self.interval * self.jitter
+            await asyncio.sleep(self.interval + random.uniform(-spread, spread))
+
+    async def poll_once(self) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        spread = self.interval * self.jitter
+
+        async def refresh_case(case_id: str) -> None:
+            await asyncio.sleep(random.uniform(0, spread))
+            async with semaphore:
+                start = time.monotonic()
+                status = self.status.setdefault(case_id, PollStatus())
+                try:
+                    await self.refresh(case_id)
+                    status.error = None
+                except Exception as e:
+                    # One failing case must not stop the others or the loop
+                    status.error = str(e) or type(e).__name__
+                status.last_refresh = time.time()
+                status.duration = time.monotonic() - start
+
+        await asyncio.gather(*(refresh_case(case_id) for case_id in self.cases))
+        self.rounds += 1
+        self._publish_status()
@@ -0,0 +1,86 @@
+"""Progress reporting for long-running tools over MCP.
+
+``ProgressReporter`` wraps FastMCP's request ``Context``: it sends progress
+notifications (throttled, so a fast loop does not flood the transport) and
+log messages with partial results. Without a context, e.g. when a tool is
+called directly, every method is a no-op.
+"""
+
+import asyncio
+import time
+
+# Give cancellation a chance every this many steps of a loop that may not
+# otherwise await (such as walking a cached docket)
+YIELD_EVERY = 256
+
+
+def format_eta(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+class ProgressReporter:
+    """Report how far a tool has got, at most every ``interval`` seconds."""
+
+    def __init__(self, ctx=None, total: float | None = None, interval: float = 0.5):
+        self.ctx = ctx
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.bytes = 0
+        self.started = time.monotonic()
+        self._last_sent = 0.0
+
+    def eta(self) -> float | None:
+        """Estimated seconds until ``total`` is reached, if it can be told."""
+        if not self.total or not self.done:
+            return None
+        elapsed = time.monotonic() - self.started
+        return elapsed / self.done * (self.total - self.done)
+
+    def summary(self) -> str:
+        parts = [f"{self.done}/{self.total}" if self.total else str(self.done)]
+        if self.bytes:
+            parts.append(f"{self.bytes / (1024 * 1024):.2f} MB")
+        eta = self.eta()
+        if eta is not None and self.done < self.total:
+            parts.append(f"ETA {format_eta(eta)}")
+        return ", ".join(parts)
+
+    async def advance(self, steps: int = 1, nbytes: int = 0, message: str | None = None):
+        """Count finished steps; optionally log ``message`` as a partial result."""
+        self.done += steps
+        self.bytes += nbytes
+        if message is not None:
+            await self.log(f"{message} ({self.summary()})")
+        now = time.monotonic()
+        finished = self.total is not None and self.done >= self.total
+        if finished or now - self._last_sent >= self.interval:
+            self._last_sent = now
+            await self._send_progress()
+        elif self.done % YIELD_EVERY == 0:
+            await asyncio.sleep(0)
+
+    async def log(self, message: str) -> None:
+        if self.ctx is None:
+            return
+        try:
+            await self.ctx.info(message)
+        except Exception:
+            # Progress is best effort; a vanished client cancels the tool anyway
+            pass
+
+    async def _send_progress(self) -> None:
+        if self.ctx is None:
+            await asyncio.sleep(0)
+            return
+        try:
+            await self.ctx.report_progress(self.done, self.total)
+        except Exception:
+            pass
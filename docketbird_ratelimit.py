@@ -0,0 +1,143 @@
+"""Client-side traffic shaping for the DocketBird API.
+
+``RateLimiter`` is a token bucket shared by every client using the same API
+key, ``CircuitBreaker`` fails fast while the API is down, and
+``backoff_delay`` / ``parse_retry_after`` schedule retries.
+"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+
+class RateLimiter:
+    """Adaptive token bucket: ``rate`` requests per second, bursts of ``burst``.
+
+    A 429 halves the rate (down to ``min_rate``) and, with a ``Retry-After``,
+    holds every request until then; each success then raises the rate by a
+    twentieth of ``max_rate`` again. Waiters are served in arrival order.
+    """
+
+    _shared: dict[str, "RateLimiter"] = {}
+
+    def __init__(self, rate: float = 10.0, burst: int = 20, min_rate: float = 0.5):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_key(cls, api_key: str | None, **kwargs) -> "RateLimiter":
+        """Return the limiter shared by all clients using ``api_key``."""
+        limiter = cls._shared.get(api_key or "")
+        if limiter is None:
+            limiter = cls._shared[api_key or ""] = cls(**kwargs)
+        return limiter
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.blocked_until - now
+                if wait <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep(max(wait, (1 - self.tokens) / self.rate))
+
+    def throttle(self, retry_after: float | None = None) -> None:
+        """Back off after the server answered 429 Too Many Requests."""
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = min(self.tokens, 0.0)
+        if retry_after:
+            self.blocked_until = max(
+                self.blocked_until, time.monotonic() + retry_after
+            )
+
+    def record_success(self) -> None:
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class CircuitBreaker:
+    """Stop calling an API that keeps failing.
+
+    Callers record one outcome per logical request, after its retries. After
+    ``threshold`` consecutive failures the circuit opens and requests are
+    refused for ``reset_timeout`` seconds. Then a single probe request is let
+    through: its success closes the circuit, its failure re-opens it. A probe
+    that never reports back frees the slot after another ``reset_timeout``.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probe_started: float | None = None
+
+    def retry_in(self) -> float:
+        """Seconds until requests are allowed again (0 if this one may go).
+
+        In the half-open state only the first caller gets 0 and becomes the
+        probe; the others are refused until it reports.
+        """
+        if self.opened_at is None:
+            return 0.0
+        now = time.monotonic()
+        remaining = self.opened_at + self.reset_timeout - now
+        if remaining > 0:
+            return remaining
+        if self.probe_started is not None:
+            probe_remaining = self.probe_started + self.reset_timeout - now
+            if probe_remaining > 0:
+                return probe_remaining
+        self.probe_started = now
+        return 0.0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.probe_started is not None or (
+            self.threshold > 0 and self.failures >= self.threshold
+        ):
+            self.opened_at = time.monotonic()
+            self.probe_started = None
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.probe_started = None
+
+
+def backoff_delay(
+    attempt: int, base: float = 0.5, cap: float = 30.0, retry_after: float | None = None
+) -> float:
+    """Jittered exponential delay before retry number ``attempt`` (from 1).
+
+    A server-provided ``retry_after`` is used as the lower bound.
+    """
+    delay = min(cap, base * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+    return max(delay, retry_after or 0.0)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,427 @@
+"""Per-case full-text index over document titles and descriptions."""
+
+import asyncio
+import bisect
+import heapq
+import json
+import math
+import os
+import re
+import time
+from dataclasses import asdict
+
+from docketbird_models import Document
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+QUERY_RE = re.compile(r'"([^"]*)"|(\()|(\))|(-?[^\s()"]+)')
+
+# Description positions start here so phrases never span title and description
+DESCRIPTION_OFFSET = 100_000
+TITLE_WEIGHT = 2.0
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_SUFFIXES = (
+    ("ational", "ate"),
+    ("ization", "ize"),
+    ("fulness", "ful"),
+    ("ousness", "ous"),
+    ("iveness", "ive"),
+    ("ments", "ment"),
+    ("ities", "ity"),
+    ("ings", ""),
+    ("ing", ""),
+    ("ies", "y"),
+    ("edly", ""),
+    ("ed", ""),
+    ("es", ""),
+    ("ly", ""),
+    ("s", ""),
+)
+
+
+def stem(token: str) -> str:
+    """Light suffix-stripping stemmer.
+
+    Maps common inflections onto one stem, e.g. file/filed/filing -> fil and
+    motion/motions -> motion. It is deliberately simpler than Porter.
+    """
+    if len(token) <= 3 or token.isdigit():
+        return token
+    for suffix, replacement in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            if suffix == "s" and token.endswith("ss"):
+                break
+            token = token[: -len(suffix)] + replacement
+            # stopped -> stopp -> stop
+            if (
+                suffix in ("ed", "ing")
+                and len(token) > 3
+                and token[-1] == token[-2]
+                and token[-1] not in "aeiouls"
+            ):
+                token = token[:-1]
+            break
+    if len(token) > 3 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str | None) -> list[str]:
+    return [stem(token) for token in TOKEN_RE.findall((text or "").lower())]
+
+
+class QueryError(ValueError):
+    """Raised for malformed search queries."""
+
+
+class CaseIndex:
+    """Inverted index over one case's docket entries.
+
+    Supports ranked (BM25) multi-term queries, ``"quoted phrases"``, the
+    ``AND``/``OR``/``NOT`` operators (``-term`` is short for ``NOT term``),
+    and parentheses. Terms are combined with ``AND`` by default.
+    """
+
+    def __init__(self, case_id: str):
+        self.case_id = case_id
+        self.documents: dict[str, Document] = {}
+        self.postings: dict[str, dict[str, list[int]]] = {}
+        self.lengths: dict[str, int] = {}
+        self.total_length = 0
+        self.updated_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def update(self, documents) -> int:
+        """Index the case's full docket ``documents``.
+
+        New documents are added, changed ones re-indexed, and documents no
+        longer on the docket (sealed or deleted) removed. Returns the number
+        of documents added, changed or removed.
+        """
+        changed = 0
+        seen = set()
+        for doc in documents:
+            if doc.id is None:
+                continue
+            seen.add(doc.id)
+            current = self.documents.get(doc.id)
+            if current is not None:
+                if (current.title, current.description) == (
+                    doc.title,
+                    doc.description,
+                ):
+                    # Keep metadata such as download URLs fresh
+                    self.documents[doc.id] = doc
+                    continue
+                self._remove(doc.id)
+            self._add(doc)
+            changed += 1
+        for doc_id in [doc_id for doc_id in self.documents if doc_id not in seen]:
+            self._remove(doc_id)
+            changed += 1
+        self.updated_at = time.time()
+        return changed
+
+    def _add(self, doc: Document) -> None:
+        self.documents[doc.id] = doc
+        positions: dict[str, list[int]] = {}
+        title_tokens = tokenize(doc.title)
+        description_tokens = tokenize(doc.description)
+        for pos, token in enumerate(title_tokens):
+            positions.setdefault(token, []).append(pos)
+        for pos, token in enumerate(description_tokens, DESCRIPTION_OFFSET):
+            positions.setdefault(token, []).append(pos)
+        for token, token_positions in positions.items():
+            self.postings.setdefault(token, {})[doc.id] = token_positions
+        self.lengths[doc.id] = len(title_tokens) + len(description_tokens)
+        self.total_length += self.lengths[doc.id]
+
+    def _remove(self, doc_id: str) -> None:
+        doc = self.documents.pop(doc_id)
+        self.total_length -= self.lengths.pop(doc_id, 0)
+        for token in set(tokenize(doc.title)) | set(tokenize(doc.description)):
+            postings = self.postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[token]
+
+    def search(
+        self, query: str, limit: int | None = None
+    ) -> tuple[int, list[tuple[Document, float]]]:
+        """Find documents matching ``query``.
+
+        Returns the total number of matches and up to ``limit``
+        ``(document, score)`` pairs, best first.
+
+        Raises:
+            QueryError: If the query cannot be parsed
+        """
+        node = _Parser(query).parse()
+        if node is None:
+            return 0, []
+        matches = self._evaluate(node)
+        terms = _positive_terms(node)
+        total_docs = len(self.documents)
+        avg_length = (self.total_length / total_docs) if total_docs else 0.0
+        scored = (
+            (self._score(doc_id, terms, total_docs, avg_length), doc_id)
+            for doc_id in matches
+        )
+        key = lambda item: (-item[0], item[1])  # noqa: E731
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, scored, key=key)
+        else:
+            ranked = sorted(scored, key=key)
+        return len(matches), [
+            (self.documents[doc_id], score) for score, doc_id in ranked
+        ]
+
+    def _evaluate(self, node) -> set[str]:
+        kind = node[0]
+        if kind == "term":
+            return set(self.postings.get(node[1], ()))
+        if kind == "phrase":
+            return self._phrase(node[1])
+        if kind == "not":
+            return set(self.documents) - self._evaluate(node[1])
+        results = [self._evaluate(child) for child in node[1]]
+        if kind == "and":
+            return set.intersection(*results) if results else set()
+        return set.union(*results) if results else set()
+
+    def _phrase(self, tokens: list[str]) -> set[str]:
+        candidates = None
+        for token in tokens:
+            docs = set(self.postings.get(token, ()))
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return set()
+        matches = set()
+        for doc_id in candidates:
+            starts = set(self.postings[tokens[0]][doc_id])
+            for offset, token in enumerate(tokens[1:], 1):
+                starts &= {p - offset for p in self.postings[token][doc_id]}
+                if not starts:
+                    break
+            if starts:
+                matches.add(doc_id)
+        return matches
+
+    def _score(
+        self, doc_id: str, terms: list[str], total_docs: int, avg_length: float
+    ) -> float:
+        length = self.lengths.get(doc_id, 0)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (avg_length or 1))
+        score = 0.0
+        for term in terms:
+            postings = self.postings.get(term)
+            positions = postings.get(doc_id) if postings else None
+            if not positions:
+                continue
+            # Positions are sorted, so title hits come first
+            title_hits = bisect.bisect_left(positions, DESCRIPTION_OFFSET)
+            tf = len(positions) + (TITLE_WEIGHT - 1) * title_hits
+            df = len(postings)
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return score
+
+    def to_dict(self) -> dict:
+        return _index_dict(self.case_id, self.updated_at, self.documents.values())
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CaseIndex":
+        index = cls(data["case_id"])
+        for doc in data.get("documents", ()):
+            index._add(Document.from_dict(doc))
+        index.updated_at = data.get("updated_at", 0.0)
+        return index
+
+
+def _index_dict(case_id: str, updated_at: float, documents) -> dict:
+    return {
+        "case_id": case_id,
+        "updated_at": updated_at,
+        "documents": [asdict(doc) for doc in documents],
+    }
+
+
+class _Parser:
+    """Recursive-descent parser producing a small query tree.
+
+    Nodes are ``("term", stem)``, ``("phrase", [stems])``, ``("not", node)``,
+    ``("and", [nodes])`` and ``("or", [nodes])``.
+    """
+
+    def __init__(self, query: str):
+        self.tokens = []
+        for phrase, lparen, rparen, word in QUERY_RE.findall(query):
+            if lparen or rparen:
+                self.tokens.append(lparen or rparen)
+            elif word:
+                self.tokens.append(word)
+            else:
+                self.tokens.append(("phrase", phrase))
+        self.pos = 0
+
+    def parse(self):
+        if not self.tokens:
+            return None
+        node = self._or()
+        if self.pos < len(self.tokens):
+            raise QueryError(f"Unexpected '{self.tokens[self.pos]}' in query")
+        return node
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _or(self):
+        children = [self._and()]
+        while self._peek() == "OR":
+            self.pos += 1
+            children.append(self._and())
+        return children[0] if len(children) == 1 else ("or", children)
+
+    def _and(self):
+        children = [self._not()]
+        while self._peek() not in (None, ")", "OR"):
+            if self._peek() == "AND":
+                self.pos += 1
+            children.append(self._not())
+        children = [child for child in children if child is not None]
+        if not children:
+            raise QueryError("Query has no searchable terms")
+        return children[0] if len(children) == 1 else ("and", children)
+
+    def _not(self):
+        token = self._peek()
+        if token == "NOT":
+            self.pos += 1
+            return _negate(self._atom())
+        if isinstance(token, str) and token.startswith("-") and len(token) > 1:
+            self.tokens[self.pos] = token[1:]
+            return _negate(self._atom())
+        return self._atom()
+
+    def _atom(self):
+        token = self._peek()
+        if token is None:
+            raise QueryError("Query ends unexpectedly")
+        self.pos += 1
+        if token == "(":
+            node = self._or()
+            if self._peek() != ")":
+                raise QueryError("Missing closing parenthesis")
+            self.pos += 1
+            return node
+        if token == ")":
+            raise QueryError("Unexpected ')' in query")
+        if isinstance(token, tuple):
+            stems = tokenize(token[1])
+            if not stems:
+                return None
+            return ("phrase", stems) if len(stems) > 1 else ("term", stems[0])
+        stems = tokenize(token)
+        if not stems:
+            return None
+        if len(stems) == 1:
+            return ("term", stems[0])
+        # Words like "motion-to-dismiss" are treated as phrases
+        return ("phrase", stems)
+
+
+def _negate(node):
+    # NOT of something without searchable terms (NOT "!!!") is dropped too
+    return None if node is None else ("not", node)
+
+
+def _positive_terms(node) -> list[str]:
+    kind = node[0]
+    if kind == "term":
+        return [node[1]]
+    if kind == "phrase":
+        return list(node[1])
+    if kind == "not":
+        return []
+    return [term for child in node[1] for term in _positive_terms(child)]
+
+
+class IndexStore:
+    """Keeps case indexes in memory and persists them to ``directory``.
+
+    An index is refreshed from the API at most once per ``max_age`` seconds;
+    searches in between are answered from memory. Indexes are read and
+    written in a worker thread, and only written when documents changed.
+    """
+
+    def __init__(self, directory: str | None, max_age: float = 600.0):
+        self.directory = directory
+        self.max_age = max_age
+        self._indexes: dict[str, CaseIndex] = {}
+        self._save_locks: dict[str, asyncio.Lock] = {}
+
+    @classmethod
+    def from_env(cls) -> "IndexStore":
+        directory = os.getenv(
+            "DOCKETBIRD_INDEX_DIR",
+            os.path.join(os.path.expanduser("~"), ".docketbird", "index"),
+        )
+        return cls(
+            directory or None,
+            max_age=float(os.getenv("DOCKETBIRD_INDEX_MAX_AGE", "600")),
+        )
+
+    async def get(self, case_id: str) -> CaseIndex:
+        index = self._indexes.get(case_id)
+        if index is None:
+            loaded = await asyncio.to_thread(self._load, case_id)
+            # Another caller may have loaded or created it meanwhile
+            index = self._indexes.setdefault(case_id, loaded or CaseIndex(case_id))
+        return index
+
+    def is_fresh(self, index: CaseIndex) -> bool:
+        return len(index) > 0 and time.time() - index.updated_at < self.max_age
+
+    async def update(self, case_id: str, documents) -> CaseIndex:
+        index = await self.get(case_id)
+        if index.update(documents):
+            await self._save(index)
+        return index
+
+    def _path(self, case_id: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9._-]", "_", case_id)
+        return os.path.join(self.directory, f"{safe}.json")
+
+    def _load(self, case_id: str) -> CaseIndex | None:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(case_id), "r") as f:
+                return CaseIndex.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    async def _save(self, index: CaseIndex) -> None:
+        if not self.directory:
+            return
+        # Snapshot on the loop; the index may change while the thread writes
+        snapshot = (index.case_id, index.updated_at, list(index.documents.values()))
+        lock = self._save_locks.setdefault(index.case_id, asyncio.Lock())
+        async with lock:
+            await asyncio.to_thread(self._write, *snapshot)
+
+    def _write(self, case_id: str, updated_at: float, documents: list) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(case_id)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(_index_dict(case_id, updated_at, documents), f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Persistence is best effort; the in-memory index still works
+            pass
@@ -0,0 +1,190 @@
+"""Route SSE client messages to the worker process that owns the session.
+
+An MCP SSE session lives in the process that holds its ``/sse`` stream, but
+the client's messages are separate POSTs that a load balancer (or several
+uvicorn workers sharing a socket) may hand to any process. Each worker
+therefore advertises a message endpoint containing its own ID,
+``/messages/{worker_id}/``, and a ``SessionBroker`` forwards messages that
+arrive at the wrong worker to the right one.
+
+``LocalBroker`` is the single-process case and keeps the plain
+``/messages/`` endpoint. ``UnixSocketBroker`` connects the workers on one
+host through Unix sockets in a shared directory. Brokers spanning hosts
+(e.g. over Redis) can implement the same three methods.
+"""
+
+import asyncio
+import os
+import struct
+import tempfile
+
+from starlette.responses import Response
+
+# Upper bound for a forwarded message; MCP requests are small JSON documents
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class SessionBroker:
+    """Deliver messages between the worker processes serving SSE sessions."""
+
+    # None means "single process": messages are never forwarded
+    worker_id: str | None = None
+
+    async def start(self, deliver) -> None:
+        """Accept messages for this worker's sessions.
+
+        ``deliver(query_string, body)`` hands one to the local SSE transport
+        and returns its ``(status, body)`` answer.
+        """
+
+    async def stop(self) -> None:
+        pass
+
+    async def forward(
+        self, worker_id: str, query_string: bytes, body: bytes
+    ) -> tuple[int, bytes]:
+        """Deliver a message to the worker owning its session."""
+        return 404, b"Could not find session"
+
+
+class LocalBroker(SessionBroker):
+    """One worker process that owns every session."""
+
+
+class UnixSocketBroker(SessionBroker):
+    """Workers on one host, each listening on ``{directory}/{worker_id}.sock``.
+
+    A forwarded message is one exchange on a fresh connection: the query
+    string line, then the body with a 4-byte length prefix; the owner answers
+    with a status line and a length-prefixed body.
+    """
+
+    def __init__(self, directory: str, worker_id: str | None = None):
+        self.directory = directory
+        self.worker_id = worker_id or str(os.getpid())
+        self._server: asyncio.AbstractServer | None = None
+
+    def _path(self, worker_id: str) -> str:
+        return os.path.join(self.directory, f"{worker_id}.sock")
+
+    async def start(self, deliver) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(self.worker_id)
+        if os.path.exists(path):
+            # Left behind by an earlier process with the same PID
+            os.remove(path)
+
+        async def handle(reader, writer):
+            try:
+                query_string, body = await _read_message(reader)
+                status, answer = await deliver(query_string, body)
+                await _write_message(writer, str(status).encode(), answer)
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                pass
+            finally:
+                writer.close()
+
+        self._server = await asyncio.start_unix_server(handle, path)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            try:
+                os.remove(self._path(self.worker_id))
+            except OSError:
+                pass
+
+    async def forward(
+        self, worker_id: str, query_string: bytes, body: bytes
+    ) -> tuple[int, bytes]:
+        # Worker IDs come from the URL; never let one name another path
+        if not worker_id.isdigit():
+            return 404, b"Could not find session"
+        try:
+            reader, writer = await asyncio.open_unix_connection(self._path(worker_id))
+        except OSError:
+            # The owner is gone (restarted or scaled down); the client reconnects
+            return 404, b"Could not find session"
+        try:
+            await _write_message(writer, query_string, body)
+            status, answer = await _read_message(reader)
+            return int(status), answer
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            return 502, b"Session owner did not answer"
+        finally:
+            writer.close()
+
+
+async def _write_message(writer: asyncio.StreamWriter, head: bytes, body: bytes):
+    writer.write(head + b"\n" + struct.pack(">I", len(body)) + body)
+    await writer.drain()
+
+
+async def _read_message(reader: asyncio.StreamReader) -> tuple[bytes, bytes]:
+    head = (await reader.readline()).rstrip(b"\n")
+    (length,) = struct.unpack(">I", await reader.readexactly(4))
+    if length > MAX_MESSAGE_BYTES:
+        raise ValueError("Message too large")
+    return head, await reader.readexactly(length)
+
+
+def broker_from_env() -> SessionBroker:
+    """The broker selected by ``DOCKETBIRD_SESSION_BROKER`` (``local`` or ``unix``)."""
+    kind = os.getenv("DOCKETBIRD_SESSION_BROKER", "local")
+    if kind == "unix":
+        directory = os.getenv("DOCKETBIRD_SESSION_DIR") or os.path.join(
+            tempfile.gettempdir(), "docketbird-sessions"
+        )
+        return UnixSocketBroker(directory)
+    if kind != "local":
+        raise ValueError(f"Unknown DOCKETBIRD_SESSION_BROKER '{kind}'")
+    return LocalBroker()
+
+
+class SessionRouter:
+    """ASGI app for ``/messages/{worker_id}/``: handle locally or forward."""
+
+    def __init__(self, transport, broker: SessionBroker):
+        self.transport = transport
+        self.broker = broker
+
+    async def __call__(self, scope, receive, send) -> None:
+        worker_id = scope["path_params"]["worker_id"]
+        if worker_id == self.broker.worker_id:
+            await self.transport.handle_post_message(scope, receive, send)
+            return
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        status, answer = await self.broker.forward(
+            worker_id, scope.get("query_string", b""), body
+        )
+        await Response(answer, status_code=status)(scope, receive, send)
+
+    async def deliver(self, query_string: bytes, body: bytes) -> tuple[int, bytes]:
+        """Pass a forwarded message to the local transport as a POST."""
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/messages/",
+            "query_string": query_string,
+            "headers": [(b"content-type", b"application/json")],
+        }
+        answer = {"status": 500, "body": b""}
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                answer["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                answer["body"] += message.get("body", b"")
+
+        await self.transport.handle_post_message(scope, receive, send)
+        return answer["status"], answer["body"]
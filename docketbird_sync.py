@@ -0,0 +1,188 @@
+"""Incremental, resumable sync of a case's documents to a local folder."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+from docketbird_blobs import BlobStore
+from docketbird_client import DocketBirdClient
+from docketbird_downloads import BulkDownloader, DownloadSummary, safe_filename
+from docketbird_models import Document, display
+
+MANIFEST_DIR = ".docketbird"
+
+
+@dataclass
+class ManifestEntry:
+    document_id: str
+    filename: str
+    size: int
+    sha256: str
+    filing_date: str | None = None
+    title: str | None = None
+    synced_at: float = 0.0
+
+
+@dataclass
+class CaseManifest:
+    """Record of what has already been mirrored for one case.
+
+    Stored as JSON in ``<save_path>/.docketbird/<case_id>.json``.
+    """
+
+    case_id: str
+    path: str
+    documents: dict[str, ManifestEntry] = field(default_factory=dict)
+    last_sync: float = 0.0
+
+    @classmethod
+    def load(cls, save_path: str, case_id: str) -> "CaseManifest":
+        path = manifest_path(save_path, case_id)
+        manifest = cls(case_id, path)
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            documents = {
+                doc_id: ManifestEntry(**entry)
+                for doc_id, entry in data.get("documents", {}).items()
+            }
+            last_sync = data.get("last_sync", 0.0)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing, unreadable or from another version: sync everything
+            return manifest
+        manifest.documents = documents
+        manifest.last_sync = last_sync
+        return manifest
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            "case_id": self.case_id,
+            "last_sync": self.last_sync,
+            "documents": {
+                doc_id: asdict(entry) for doc_id, entry in self.documents.items()
+            },
+        }
+        # Unique per process and thread: the poller and a tool may save at once
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def is_current(self, doc: Document, save_path: str) -> bool:
+        """True if ``doc`` is already mirrored and unchanged on disk."""
+        entry = self.documents.get(doc.id)
+        if entry is None:
+            return False
+        if entry.filing_date != doc.filing_date or entry.title != doc.title:
+            return False
+        local_path = os.path.join(save_path, entry.filename)
+        try:
+            return os.path.getsize(local_path) == entry.size
+        except OSError:
+            return False
+
+
+def manifest_path(save_path: str, case_id: str) -> str:
+    return os.path.join(save_path, MANIFEST_DIR, f"{safe_filename(case_id)}.json")
+
+
+def document_filename(doc: Document) -> str:
+    """Stable local file name for a document.
+
+    DocketBird's ``custom_filename`` is preferred since it is unique per
+    document and human readable; otherwise the document id is used.
+    """
+    if doc.custom_filename:
+        return safe_filename(doc.custom_filename)
+    return safe_filename(f"{doc.id or 'document'}.pdf")
+
+
+@dataclass
+class SyncResult:
+    case_id: str
+    new: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    summary: DownloadSummary = field(default_factory=DownloadSummary)
+
+
+class CaseSync:
+    """Mirror a case's downloadable documents, fetching only what changed.
+
+    A document is skipped when the manifest already has it with the same
+    title and filing date and the local file still has the recorded size.
+    Interrupted downloads are resumed from their ``.part`` file, and
+    documents already in ``blobs`` are placed without downloading them.
+    """
+
+    def __init__(
+        self,
+        client: DocketBirdClient,
+        workers: int = 8,
+        blobs: BlobStore | None = None,
+    ):
+        self.downloader = BulkDownloader(
+            client,
+            workers=workers,
+            resume=True,
+            filename_for=document_filename,
+            blobs=blobs,
+        )
+
+    async def sync(
+        self,
+        case_id: str,
+        documents: list[Document],
+        save_path: str,
+        on_result=None,
+    ) -> SyncResult:
+        save_path = os.path.abspath(os.path.expanduser(save_path))
+        manifest = await asyncio.to_thread(CaseManifest.load, save_path, case_id)
+        result = SyncResult(case_id)
+
+        pending = []
+        for doc in documents:
+            if not doc.docketbird_document_url:
+                continue
+            if manifest.is_current(doc, save_path):
+                result.unchanged += 1
+            else:
+                pending.append(doc)
+
+        result.summary = await self.downloader.download_all(
+            pending, save_path, on_result=on_result
+        )
+
+        by_id = {display(doc.id): doc for doc in pending}
+        now = time.time()
+        for item in result.summary.results:
+            if not item.ok:
+                continue
+            doc = by_id[item.document_id]
+            previous = manifest.documents.get(item.document_id)
+            if previous is None:
+                result.new.append(item.document_id)
+            else:
+                result.updated.append(item.document_id)
+                # A renamed document leaves its old copy behind
+                if previous.filename != os.path.basename(item.path):
+                    old_path = os.path.join(save_path, previous.filename)
+                    if os.path.exists(old_path):
+                        os.remove(old_path)
+            manifest.documents[item.document_id] = ManifestEntry(
+                document_id=item.document_id,
+                filename=os.path.basename(item.path),
+                size=os.path.getsize(item.path),
+                sha256=item.sha256,
+                filing_date=doc.filing_date,
+                title=doc.title,
+                synced_at=now,
+            )
+
+        manifest.last_sync = now
+        await asyncio.to_thread(manifest.save)
+        return result
@@ -0,0 +1,97 @@
+import pytest
+
+import docketbird_cache
+from docketbird_cache import ResponseCache, cache_key, ttl_for
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(docketbird_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def key(path, **params):
+    return cache_key(path, params)
+
+
+def test_ttl_for_uses_longest_prefix():
+    assert ttl_for("/documents/123") == 300.0
+    assert ttl_for("/documents") == 600.0
+    assert ttl_for("/cases/abc") == 900.0
+    assert ttl_for("/other", default=42.0) == 42.0
+
+
+def test_cache_key_merges_query_strings():
+    assert cache_key("/documents?case_id=x") == cache_key(
+        "/documents", {"case_id": "x"}
+    )
+    assert cache_key("/documents", {"page": None}) == cache_key("/documents")
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(ttls={"/a": 10.0})
+    cache.set(key("/a"), "value", 5)
+    assert cache.get(key("/a")) == "value"
+    clock[0] += 10.0
+    assert cache.get(key("/a")) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_are_kept_for_revalidation(clock):
+    cache = ResponseCache(ttls={"/a": 10.0})
+    cache.set(key("/a"), "value", 5, validators=('"etag"', None))
+    clock[0] += 60.0
+    assert cache.get(key("/a")) is None
+    assert cache.stale(key("/a")) == ("value", 5, ('"etag"', None))
+    assert cache.current_bytes == 5
+
+
+def test_zero_ttl_and_oversized_entries_are_not_cached(clock):
+    cache = ResponseCache(max_bytes=10, ttls={"/a": 10.0, "/never": 0.0})
+    cache.set(key("/never"), "value", 1)
+    cache.set(key("/a"), "big", 11)
+    assert cache.stale(key("/never")) is None
+    assert cache.stale(key("/a")) is None
+    assert cache.current_bytes == 0
+
+
+def test_lru_eviction_by_bytes(clock):
+    cache = ResponseCache(max_bytes=10, ttls={"/": 60.0})
+    cache.set(key("/a"), "a", 4)
+    cache.set(key("/b"), "b", 4)
+    # Touch /a so /b is the least recently used
+    assert cache.get(key("/a")) == "a"
+    cache.set(key("/c"), "c", 4)
+    assert cache.stale(key("/b")) is None
+    assert cache.get(key("/a")) == "a"
+    assert cache.get(key("/c")) == "c"
+    assert cache.current_bytes == 8
+    assert cache.evictions == 1
+
+
+def test_lru_eviction_by_entry_count(clock):
+    cache = ResponseCache(max_entries=2, ttls={"/": 60.0})
+    for name in ("/a", "/b", "/c"):
+        cache.set(key(name), name, 1)
+    assert cache.stale(key("/a")) is None
+    assert len(cache._entries) == 2
+
+
+def test_replacing_an_entry_keeps_byte_count(clock):
+    cache = ResponseCache(ttls={"/": 60.0})
+    cache.set(key("/a"), "old", 4)
+    cache.set(key("/a"), "new", 6)
+    assert cache.get(key("/a")) == "new"
+    assert cache.current_bytes == 6
+
+
+def test_invalidate_drops_raw_and_parsed_entries(clock):
+    cache = ResponseCache(ttls={"/": 60.0})
+    cache.set(cache_key("/documents", {"case_id": "x"}), "raw", 1)
+    cache.set(cache_key("/documents", {"case_id": "x"}, model=dict), "parsed", 1)
+    cache.set(cache_key("/documents", {"case_id": "y"}), "other", 1)
+    assert cache.invalidate("/documents", {"case_id": "x"})
+    assert cache.current_bytes == 1
+    assert cache.invalidate_case("y") == 1
+    assert cache.current_bytes == 0
@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from docketbird_catalog import Catalog, is_federal_trial_court
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    with open(ROOT / "courts.json") as f:
+        courts = json.load(f)
+    with open(ROOT / "case_types.json") as f:
+        case_types = json.load(f)
+    return Catalog.build(courts, case_types)
+
+
+@pytest.mark.parametrize(
+    "code, name, expected",
+    [
+        ("txnd", "Northern District of Texas", True),
+        ("txnb", "Northern District of Texas (Bankruptcy)", True),
+        ("dcd", "District of Columbia", True),
+        ("ca5", "5th Circuit Court of Appeals", False),
+        ("uc-ok-distct-7ny3dytZ4CL4mq", "Oklahoma County District Court", False),
+        ("scc", "Santa Clara County Superior Court", False),
+    ],
+)
+def test_is_federal_trial_court(code, name, expected):
+    assert is_federal_trial_court(code, name) is expected
+
+
+@pytest.mark.parametrize(
+    "case_id",
+    [
+        "txnd-3:2007-cv-01697",
+        "txnb-3:19-bk-30001",
+        "txnd-3:2007-mj-00001",
+    ],
+)
+def test_valid_federal_case_ids(catalog, case_id):
+    assert catalog.validate_case_id(case_id) is None
+
+
+@pytest.mark.parametrize("case_id", ["txnd-2007-cv-01697", "txnd-3:cv-01697"])
+def test_malformed_federal_case_ids(catalog, case_id):
+    assert catalog.validate_case_id(case_id).startswith("Malformed case ID")
+
+
+@pytest.mark.parametrize(
+    "case_id",
+    [
+        "ca5-2021-30580",
+        "nyap1-2023-01234",
+        "uc-ok-distct-7ny3dytZ4CL4mq-CJ-2020-1234",
+        "scc-20CV123456",
+    ],
+)
+def test_other_courts_do_not_need_the_federal_layout(catalog, case_id):
+    assert catalog.validate_case_id(case_id) is None
+
+
+def test_court_for_case_tries_hyphenated_codes(catalog):
+    court = catalog.court_for_case("uc-ok-distct-7ny3dytZ4CL4mq-CJ-2020-1234")
+    assert court.code == "uc-ok-distct-7ny3dytZ4CL4mq"
+
+
+def test_unknown_court_and_empty_case_id(catalog):
+    assert catalog.validate_case_id("zzzz-3:2007-cv-01697").startswith("Unknown court")
+    assert catalog.validate_case_id("  ") == "case_id is required"
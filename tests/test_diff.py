@@ -0,0 +1,137 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from docketbird_diff import (
+    SnapshotStore,
+    diff_docket,
+    fingerprint,
+    next_cursor,
+    parse_cursor,
+)
+from docketbird_models import Document
+
+CASE_ID = "txnd-3:2007-cv-01697"
+
+DOCKET = [
+    Document(
+        id="1",
+        title="Complaint",
+        filing_date="2024-01-02",
+        primary_docket_sheet_number=1,
+    ),
+    Document(
+        id="2", title="Answer", filing_date="2024-02-03", primary_docket_sheet_number=2
+    ),
+    Document(
+        id="3",
+        title="Motion to Dismiss",
+        filing_date="2024-03-04",
+        primary_docket_sheet_number=3,
+    ),
+]
+
+
+def snapshot(documents):
+    return {doc.id: fingerprint(doc) for doc in documents}
+
+
+def ids(documents):
+    return [doc.id for doc in documents]
+
+
+@pytest.mark.parametrize(
+    "cursor, expected",
+    [
+        (None, None),
+        ("", None),
+        ("42", ("number", 42)),
+        (42, ("number", 42)),
+        (" 7 ", ("number", 7)),
+        ("2024-03-04", ("date", "2024-03-04")),
+        ("2024-03-04T10:00:00Z", ("date", "2024-03-04")),
+    ],
+)
+def test_parse_cursor(cursor, expected):
+    assert parse_cursor(cursor) == expected
+
+
+@pytest.mark.parametrize("cursor", ["yesterday", "2024-13-01", "-1"])
+def test_parse_cursor_rejects_garbage(cursor):
+    with pytest.raises(ValueError):
+        parse_cursor(cursor)
+
+
+def test_next_cursor_prefers_numbers_then_dates():
+    assert next_cursor(DOCKET) == "3"
+    assert next_cursor(DOCKET, "date") == "2024-03-04"
+    undated = [Document(id="9", filing_date="2024-05-06")]
+    assert next_cursor(undated) == "2024-05-06"
+    assert next_cursor([]) is None
+
+
+def test_first_diff_without_snapshot_or_cursor_is_a_baseline():
+    diff = diff_docket(CASE_ID, DOCKET, None, None)
+    assert diff.baseline
+    assert (diff.new, diff.changed, diff.removed) == ([], [], [])
+    assert diff.cursor == "3"
+    assert diff.total == 3
+
+
+def test_diff_against_snapshot_finds_new_changed_and_removed():
+    previous = snapshot(DOCKET[:3])
+    current = [
+        DOCKET[0],
+        replace(DOCKET[1], title="Amended Answer"),
+        Document(
+            id="4",
+            title="Order",
+            filing_date="2024-04-05",
+            primary_docket_sheet_number=4,
+        ),
+    ]
+    diff = diff_docket(CASE_ID, current, previous, None)
+    assert ids(diff.new) == ["4"]
+    assert ids(diff.changed) == ["2"]
+    assert diff.removed == ["3"]
+    assert not diff.baseline
+
+
+def test_new_download_url_alone_is_not_a_change():
+    previous = snapshot(DOCKET)
+    current = [replace(DOCKET[0], docketbird_document_url="https://s3/a?sig=1")]
+    assert fingerprint(current[0]) != previous["1"]
+    signed = snapshot(current)
+    again = [replace(DOCKET[0], docketbird_document_url="https://s3/a?sig=2")]
+    assert diff_docket(CASE_ID, again, signed, None).changed == []
+
+
+def test_diff_against_number_cursor():
+    diff = diff_docket(CASE_ID, DOCKET, None, parse_cursor("1"))
+    assert ids(diff.new) == ["2", "3"]
+    assert diff.removed == []
+
+
+def test_diff_against_date_cursor():
+    diff = diff_docket(CASE_ID, DOCKET, None, parse_cursor("2024-02-03"))
+    assert ids(diff.new) == ["3"]
+    assert diff.cursor == "2024-03-04"
+
+
+def test_snapshot_store_skips_unchanged_dockets(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path))
+    writes = []
+    save = store._save
+    monkeypatch.setattr(
+        store, "_save", lambda *args: writes.append(args) or save(*args)
+    )
+
+    async def run():
+        await store.update(CASE_ID, DOCKET)
+        diff = diff_docket(CASE_ID, DOCKET, await store.get(CASE_ID), None)
+        await store.update(CASE_ID, DOCKET, diff)
+        return await SnapshotStore(str(tmp_path)).get(CASE_ID)
+
+    assert asyncio.run(run()) == snapshot(DOCKET)
+    assert len(writes) == 1
@@ -0,0 +1,69 @@
+import pytest
+
+from docketbird_format import (
+    COMPACT_FIELDS,
+    DOCUMENT_FIELDS,
+    filed_between,
+    in_page,
+    page_window,
+    parse_date,
+    select_fields,
+)
+from docketbird_models import Document
+
+
+def test_select_fields_defaults_and_keeps_canonical_order():
+    assert select_fields(None, COMPACT_FIELDS) == COMPACT_FIELDS
+    assert select_fields([], DOCUMENT_FIELDS) == DOCUMENT_FIELDS
+    assert select_fields(["title", "id", "title"], DOCUMENT_FIELDS) == ("id", "title")
+
+
+def test_select_fields_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="Unknown document field"):
+        select_fields(["title", "judge"], DOCUMENT_FIELDS)
+
+
+def test_parse_date():
+    assert parse_date(None, "filed_from") is None
+    assert parse_date("2024-03-04", "filed_from") == "2024-03-04"
+    with pytest.raises(ValueError, match="filed_to"):
+        parse_date("03/04/2024", "filed_to")
+
+
+@pytest.mark.parametrize(
+    "filing_date, start, end, expected",
+    [
+        ("2024-03-04", None, None, True),
+        (None, None, None, True),
+        (None, "2024-01-01", None, False),
+        ("2024-03-04", "2024-03-04", "2024-03-04", True),
+        ("2024-03-04T15:00:00Z", "2024-03-04", "2024-03-04", True),
+        ("2024-03-04", "2024-03-05", None, False),
+        ("2024-03-04", None, "2024-03-03", False),
+    ],
+)
+def test_filed_between(filing_date, start, end, expected):
+    doc = Document(id="1", filing_date=filing_date)
+    assert filed_between(doc, start, end) is expected
+
+
+def test_in_page():
+    assert [p for p in range(1, 8) if in_page(p, 2, 3)] == [3, 4, 5]
+    assert [p for p in range(1, 5) if in_page(p, 0, None)] == [1, 2, 3, 4]
+    assert [p for p in range(1, 5) if in_page(p, 1, 0)] == []
+
+
+@pytest.mark.parametrize(
+    "matched, offset, limit, expected",
+    [
+        (10, 0, None, (10, None)),
+        (10, 0, 4, (4, 4)),
+        (10, 4, 4, (4, 8)),
+        (10, 8, 4, (2, None)),
+        (10, 12, 4, (0, None)),
+        (10, 3, 0, (0, 3)),
+        (0, 0, 5, (0, None)),
+    ],
+)
+def test_page_window(matched, offset, limit, expected):
+    assert page_window(matched, offset, limit) == expected
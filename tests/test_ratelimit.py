@@ -0,0 +1,108 @@
+import httpx
+import pytest
+
+import docketbird_ratelimit
+from docketbird_client import DocketBirdClient
+from docketbird_ratelimit import CircuitBreaker, backoff_delay, parse_retry_after
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(docketbird_ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(threshold=3, reset_timeout=30.0)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.retry_in() == 0.0
+    breaker.record_failure()
+    assert breaker.retry_in() == 30.0
+    clock[0] += 10.0
+    assert breaker.retry_in() == 20.0
+
+
+def test_breaker_success_resets_failures(clock):
+    breaker = CircuitBreaker(threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.retry_in() == 0.0
+
+
+def test_half_open_lets_a_single_probe_through(clock):
+    breaker = CircuitBreaker(threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+    clock[0] += 30.0
+    assert breaker.retry_in() == 0.0
+    # Everyone else waits while the probe is out
+    assert breaker.retry_in() == 30.0
+    breaker.record_success()
+    assert breaker.retry_in() == 0.0
+    assert breaker.retry_in() == 0.0
+
+
+def test_failed_probe_reopens_the_circuit(clock):
+    breaker = CircuitBreaker(threshold=5, reset_timeout=30.0)
+    for _ in range(5):
+        breaker.record_failure()
+    clock[0] += 30.0
+    assert breaker.retry_in() == 0.0
+    breaker.record_failure()
+    assert breaker.retry_in() == 30.0
+
+
+def test_lost_probe_frees_the_slot_after_reset_timeout(clock):
+    breaker = CircuitBreaker(threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+    clock[0] += 30.0
+    assert breaker.retry_in() == 0.0
+    clock[0] += 30.0
+    assert breaker.retry_in() == 0.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_delay_is_jittered_capped_and_bounded_by_retry_after():
+    for attempt in range(1, 10):
+        delay = backoff_delay(attempt, base=0.5, cap=4.0)
+        assert 0.25 * min(8, 2 ** (attempt - 1)) <= delay <= 6.0
+    assert backoff_delay(1, base=0.5, retry_after=10.0) == 10.0
+
+
+@pytest.fixture
+def client():
+    return DocketBirdClient(api_key="test-key", rate_limit=0, retries=2, backoff=0.5)
+
+
+def response(status, **headers):
+    return httpx.Response(status, headers=headers)
+
+
+def test_retry_delay_honours_retry_after(client):
+    assert client._retry_delay(response(503, **{"Retry-After": "7"}), 1) == 7.0
+    assert client._retry_delay(response(429, **{"Retry-After": "12"}), 2) == 12.0
+
+
+def test_retry_delay_only_for_transient_statuses(client):
+    assert client._retry_delay(response(404), 1) is None
+    assert client._retry_delay(response(500), 1) is None
+    assert 0.0 < client._retry_delay(response(502), 1) <= 0.75
+
+
+def test_retry_delay_stops_after_retries(client):
+    assert client._retry_delay(response(503), 2) is not None
+    assert client._retry_delay(response(503), 3) is None
+
+
+def test_retry_delay_skips_non_idempotent_requests_except_429(client):
+    assert client._retry_delay(response(503), 1, idempotent=False) is None
+    assert client._retry_delay(response(429), 1, idempotent=False) is not None
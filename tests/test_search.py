@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from docketbird_models import Document
+from docketbird_search import CaseIndex, IndexStore, QueryError, _Parser, stem, tokenize
+
+
+def parse(query):
+    return _Parser(query).parse()
+
+
+DOCKET = [
+    Document(id="1", title="Motion to Dismiss", description="Filed by defendant."),
+    Document(id="2", title="Order granting motion to dismiss"),
+    Document(id="3", title="Stipulation of dismissal"),
+    Document(id="4", title="Notice of filing", description="Exhibit A"),
+]
+
+
+@pytest.fixture
+def index():
+    index = CaseIndex("txnd-3:2007-cv-01697")
+    index.update(DOCKET)
+    return index
+
+
+def ids(result):
+    return {doc.id for doc, _score in result[1]}
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("filed", "fil"),
+        ("filing", "fil"),
+        ("files", "fil"),
+        ("motions", "motion"),
+        ("stopped", "stop"),
+        ("class", "class"),
+        ("2007", "2007"),
+        ("act", "act"),
+    ],
+)
+def test_stem(word, expected):
+    assert stem(word) == expected
+
+
+def test_tokenize_lowercases_and_splits_on_punctuation():
+    tokens = tokenize("Motion-to-Dismiss (Doc. 12)")
+    assert tokens == ["motion", "to", "dismiss", "doc", "12"]
+    assert tokenize(None) == []
+
+
+def test_parse_terms_are_anded():
+    assert parse("motion dismiss") == ("and", [("term", "motion"), ("term", "dismiss")])
+    assert parse("motion AND dismiss") == parse("motion dismiss")
+
+
+def test_parse_or_binds_looser_than_and():
+    assert parse("a1 b1 OR c1") == (
+        "or",
+        [("and", [("term", "a1"), ("term", "b1")]), ("term", "c1")],
+    )
+
+
+def test_parse_phrases_and_hyphenated_words():
+    assert parse('"motion to dismiss"') == ("phrase", ["motion", "to", "dismiss"])
+    assert parse("motion-to-dismiss") == ("phrase", ["motion", "to", "dismiss"])
+    assert parse('"order"') == ("term", "order")
+
+
+def test_parse_not_and_minus():
+    assert parse("NOT order") == ("not", ("term", "order"))
+    assert parse("motion -order") == (
+        "and",
+        [("term", "motion"), ("not", ("term", "order"))],
+    )
+
+
+def test_parse_parentheses():
+    assert parse("(motion OR notice) -order") == (
+        "and",
+        [("or", [("term", "motion"), ("term", "notic")]), ("not", ("term", "order"))],
+    )
+
+
+def test_parse_empty_query():
+    assert parse("") is None
+    assert parse("   ") is None
+
+
+def test_empty_not_is_dropped():
+    assert parse('motion NOT "!!!"') == ("term", "motion")
+    assert parse("motion -!!!") == ("term", "motion")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        'NOT "!!!"',
+        "-!!!",
+        "!!!",
+        '""',
+        "(!!!)",
+        "motion NOT",
+        "(motion",
+        "motion)",
+        "motion OR",
+    ],
+)
+def test_malformed_queries_raise_query_error(query):
+    with pytest.raises(QueryError):
+        parse(query)
+
+
+def test_search_ranks_and_filters(index):
+    total, results = index.search("motion dismiss")
+    assert total == 2
+    assert ids(index.search("dismiss -order")) == {"1"}
+    assert ids(index.search('"motion to dismiss" OR stipulation')) == {"1", "2", "3"}
+    # Title hits rank above description hits
+    total, results = index.search("filed")
+    assert [doc.id for doc, _score in results] == ["4", "1"]
+
+
+def test_search_limit_keeps_total(index):
+    total, results = index.search("dismiss", limit=1)
+    assert total == 2
+    assert len(results) == 1
+
+
+def test_search_empty_not_raises(index):
+    with pytest.raises(QueryError):
+        index.search('NOT "!!!"')
+
+
+def test_update_reports_changes(index):
+    assert index.update(list(DOCKET)) == 0
+    amended = Document(id="1", title="Amended motion to dismiss")
+    assert index.update([amended, *DOCKET[1:]]) == 1
+    assert ids(index.search("amended")) == {"1"}
+
+
+def test_update_removes_documents_no_longer_on_the_docket(index):
+    assert index.update(DOCKET[:2]) == 2
+    assert len(index) == 2
+    assert ids(index.search("dismiss OR filing")) == {"1", "2"}
+    assert "stipul" not in index.postings
+
+
+def test_index_store_saves_only_changes(tmp_path, monkeypatch):
+    store = IndexStore(str(tmp_path))
+    documents = [Document(id="1", title="Motion to Dismiss")]
+    writes = []
+    write = store._write
+    monkeypatch.setattr(
+        store, "_write", lambda *args: writes.append(args) or write(*args)
+    )
+
+    async def run():
+        await store.update("case", documents)
+        await store.update("case", documents)
+        return await IndexStore(str(tmp_path)).get("case")
+
+    reloaded = asyncio.run(run())
+    assert len(writes) == 1
+    assert ids(reloaded.search("dismiss")) == {"1"}
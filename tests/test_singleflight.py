@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from docketbird_client import SingleFlight
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_callers_share_one_result():
+    flights = SingleFlight()
+    calls = []
+
+    async def fetch(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    async def main():
+        return await asyncio.gather(*(flights.do(("k",), fetch, 1) for _ in range(5)))
+
+    assert run(main()) == [1] * 5
+    assert calls == [1]
+    assert flights.shared == 4
+    assert len(flights) == 0
+
+
+def test_concurrent_callers_share_one_exception():
+    flights = SingleFlight()
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            *(flights.do(("k",), fail) for _ in range(3)), return_exceptions=True
+        )
+
+    results = run(main())
+    assert len(calls) == 1
+    assert all(isinstance(r, ValueError) and str(r) == "boom" for r in results)
+    assert len(flights) == 0
+
+
+def test_different_keys_do_not_share():
+    flights = SingleFlight()
+
+    async def fetch(value):
+        await asyncio.sleep(0)
+        return value
+
+    async def main():
+        return await asyncio.gather(
+            flights.do(("a",), fetch, "a"), flights.do(("b",), fetch, "b")
+        )
+
+    assert run(main()) == ["a", "b"]
+    assert flights.shared == 0
+
+
+def test_cancelling_one_waiter_keeps_the_call_for_others():
+    flights = SingleFlight()
+    started = []
+
+    async def fetch():
+        started.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(flights.do(("k",), fetch))
+        second = asyncio.ensure_future(flights.do(("k",), fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert run(main()) == "done"
+    assert started == [1]
+
+
+def test_cancelling_the_last_waiter_cancels_the_call():
+    flights = SingleFlight()
+    cancelled = []
+
+    async def fetch():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def main():
+        waiter = asyncio.ensure_future(flights.do(("k",), fetch))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0.01)
+
+    run(main())
+    assert cancelled == [1]
+    assert len(flights) == 0
+
+
+def test_late_waiter_of_a_finished_flight_does_not_touch_a_new_one():
+    flights = SingleFlight()
+    release = None
+
+    async def fetch(value):
+        await release.wait()
+        return value
+
+    async def main():
+        nonlocal release
+        release = asyncio.Event()
+        old = asyncio.ensure_future(flights.do(("k",), fetch, "old"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0)
+        # The old flight is done and forgotten; a new one starts for the key
+        release = asyncio.Event()
+        new = asyncio.ensure_future(flights.do(("k",), fetch, "new"))
+        assert await old == "old"
+        await asyncio.sleep(0)
+        other = asyncio.ensure_future(flights.do(("k",), fetch, "new"))
+        await asyncio.sleep(0)
+        other.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await other
+        release.set()
+        return await new
+
+    assert run(main()) == "new"